@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Generator
+
+import pytest
+
+from src.tenant_api import config as tenant_api_config
+
+
+def _reset_tenant_api_caches() -> None:
+    tenant_api_config.reset_config_cache()
+    # The handler's dependencies are built from the cached config's region, so they go too.
+    handler = sys.modules.get("src.tenant_api.handler")
+    if handler is not None:
+        handler._cached_dependencies = None
+
+
+@pytest.fixture(autouse=True)
+def _reset_tenant_api_config() -> Generator[None, None, None]:
+    # Tests set environment variables per case; never reuse a config resolved by another test.
+    _reset_tenant_api_caches()
+    yield
+    _reset_tenant_api_caches()
@@ -120,6 +120,7 @@ export function createPlatformCompute(
         'secretsmanager:TagResource',
         'secretsmanager:PutSecretValue',
         'secretsmanager:PutResourcePolicy',
+        'secretsmanager:DeleteSecret',
       ],
       resources: [`arn:aws:secretsmanager:${stack.region}:${stack.account}:secret:platform/tenants/*`],
     }),
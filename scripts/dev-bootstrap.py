@@ -26,9 +26,10 @@ import os
 import sys
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import boto3
 from botocore.exceptions import ClientError
@@ -141,6 +142,7 @@ TABLE_DEFINITIONS: list[dict[str, Any]] = [
         "BillingMode": "PAY_PER_REQUEST",
     },
 ]
+TABLE_NAMES: frozenset[str] = frozenset(defn["TableName"] for defn in TABLE_DEFINITIONS)
 
 # ---------------------------------------------------------------------------
 # Fixture data — deterministic keys, stable timestamps
@@ -332,7 +334,10 @@ def _ssm_parameters(*, mock_jwks_url: str, localstack_endpoint: str) -> list[tup
         ("/platform/config/localstack-endpoint", localstack_endpoint),
         ("/platform/gateway/pii-patterns/default", pii_patterns),
         ("/platform/billing/pricing/basic", json.dumps({"input_1k": 0.01, "output_1k": 0.03})),
-        ("/platform/billing/pricing/standard", json.dumps({"input_1k": 0.005, "output_1k": 0.015})),
+        (
+            "/platform/billing/pricing/standard",
+            json.dumps({"input_1k": 0.005, "output_1k": 0.015}),
+        ),
         ("/platform/billing/pricing/premium", json.dumps({"input_1k": 0.002, "output_1k": 0.006})),
     ]
 
@@ -342,26 +347,53 @@ def _ssm_parameters(*, mock_jwks_url: str, localstack_endpoint: str) -> list[tup
 # ---------------------------------------------------------------------------
 
 
+def _ensure_table(ddb_client: Any, defn: dict[str, Any]) -> None:
+    table_name = defn["TableName"]
+    try:
+        ddb_client.create_table(**defn)
+    except ClientError as exc:
+        code = exc.response.get("Error", {}).get("Code", "")
+        if code in ("ResourceInUseException", "TableAlreadyExistsException"):
+            logger.debug("Table %s already exists — skipping", table_name)
+            return
+        raise
+    # CreateTable returns while the table is still CREATING; seeding needs it ACTIVE.
+    ddb_client.get_waiter("table_exists").wait(
+        TableName=table_name, WaiterConfig={"Delay": 1, "MaxAttempts": 60}
+    )
+    logger.info("Created table %s", table_name)
+
+
 def ensure_tables(ddb_client: Any) -> None:
-    """Create DynamoDB tables if they do not already exist. Idempotent."""
-    for defn in TABLE_DEFINITIONS:
-        table_name = defn["TableName"]
-        try:
-            ddb_client.create_table(**defn)
-            logger.info("Created table %s", table_name)
-        except ClientError as exc:
-            code = exc.response.get("Error", {}).get("Code", "")
-            if code in ("ResourceInUseException", "TableAlreadyExistsException"):
-                logger.debug("Table %s already exists — skipping", table_name)
-            else:
-                raise
+    """Create DynamoDB tables if they do not already exist. Idempotent.
+
+    Existing tables are found with one ListTables pass, so re-runs issue no CreateTable
+    calls; missing tables are created (and awaited) concurrently, one worker per table.
+    """
+    existing: set[str] = set()
+    for page in ddb_client.get_paginator("list_tables").paginate():
+        existing.update(page.get("TableNames", []))
+    missing = [defn for defn in TABLE_DEFINITIONS if defn["TableName"] not in existing]
+    for name in sorted(TABLE_NAMES & existing):
+        logger.debug("Table %s already exists — skipping", name)
+    if not missing:
+        return
+    with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+        futures = [pool.submit(_ensure_table, ddb_client, defn) for defn in missing]
+        for future in futures:
+            future.result()
 
 
 def _seed_items(ddb_resource: Any, table_name: str, items: list[dict[str, Any]]) -> None:
-    """Upsert items into a DynamoDB table. put_item is idempotent by PK+SK key."""
+    """Upsert items into a DynamoDB table in BatchWriteItem calls. Idempotent by PK+SK key.
+
+    overwrite_by_pkeys drops duplicate keys within a batch (last one wins), which
+    BatchWriteItem would otherwise reject.
+    """
     table = ddb_resource.Table(table_name)
-    for item in items:
-        table.put_item(Item=item)
+    with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+        for item in items:
+            batch.put_item(Item=item)
     logger.info("Seeded %d item(s) into %s", len(items), table_name)
 
 
@@ -392,6 +424,24 @@ def seed_ssm_parameters(ssm_client: Any, *, mock_jwks_url: str, localstack_endpo
     logger.info("Seeded %d SSM parameter(s)", len(params))
 
 
+def _fetch_jwt(mock_jwks_url: str, role: str, payload: dict[str, Any]) -> str | None:
+    """POST one token request to mock-jwks; None (with a warning) if it cannot be fetched."""
+    try:
+        data = json.dumps(payload).encode()
+        req = urllib.request.Request(
+            f"{mock_jwks_url}/token",
+            data=data,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            body = json.loads(resp.read())
+            return body["access_token"]
+    except (urllib.error.URLError, OSError, KeyError) as exc:
+        logger.warning("Could not fetch JWT for role=%s: %s", role, exc)
+        return None
+
+
 def fetch_jwts(mock_jwks_url: str) -> dict[str, str]:
     """Fetch test JWTs from the mock-jwks service.
 
@@ -424,58 +474,68 @@ def fetch_jwts(mock_jwks_url: str) -> dict[str, str]:
             },
         ),
     ]
-    tokens: dict[str, str] = {}
-    for role, payload in requests_to_make:
-        try:
-            data = json.dumps(payload).encode()
-            req = urllib.request.Request(
-                f"{mock_jwks_url}/token",
-                data=data,
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                body = json.loads(resp.read())
-                tokens[role] = body["access_token"]
-        except (urllib.error.URLError, OSError, KeyError) as exc:
-            logger.warning("Could not fetch JWT for role=%s: %s", role, exc)
-    return tokens
-
-
-def write_env_test(tokens: dict[str, str], env_test_path: Path) -> None:
-    """Write test environment variables to .env.test. Overwrites on each run."""
-    lines: list[str] = [
-        "# Test environment variables — generated by scripts/dev-bootstrap.py",
-        "# Re-run `uv run python scripts/dev-bootstrap.py` (with dev services up) to refresh JWTs",
-        "#",
-        "AWS_REGION=eu-west-2",
-        "LOCALSTACK_ENDPOINT=http://localhost:4566",
-        "MOCK_RUNTIME_URL=http://localhost:8765",
-        "JWKS_URL=http://localhost:8766/.well-known/jwks.json",
-        "API_AUDIENCE=api://platform-local",
-        "API_ISSUER=http://localhost:8766",
-        "PLATFORM_ENV=local",
-        f"SCOPED_TOKEN_SIGNING_KEY={_LOCAL_SCOPED_TOKEN_SIGNING_KEY}",
-        "BASIC_TENANT_ID=t-test-001",
-        "PREMIUM_TENANT_ID=t-test-002",
-        "ADMIN_TENANT_ID=t-test-001",
-        "",
-    ]
-    if tokens:
-        lines += [
-            f"BASIC_TENANT_JWT={tokens.get('basic', '')}",
-            f"PREMIUM_TENANT_JWT={tokens.get('premium', '')}",
-            f"ADMIN_JWT={tokens.get('admin', '')}",
+    # The three token requests are independent; issue them concurrently (~1 RTT, not 3).
+    with ThreadPoolExecutor(max_workers=len(requests_to_make)) as pool:
+        futures = [
+            (role, pool.submit(_fetch_jwt, mock_jwks_url, role, payload))
+            for role, payload in requests_to_make
         ]
+        results = [(role, future.result()) for role, future in futures]
+    return {role: token for role, token in results if token is not None}
+
+
+# Everything in .env.test except the JWT lines is fixed, so it is rendered once here.
+_ENV_TEST_PREAMBLE = (
+    "# Test environment variables — generated by scripts/dev-bootstrap.py\n"
+    "# Re-run `uv run python scripts/dev-bootstrap.py` (with dev services up) to refresh JWTs\n"
+    "#\n"
+    "AWS_REGION=eu-west-2\n"
+    "LOCALSTACK_ENDPOINT=http://localhost:4566\n"
+    "MOCK_RUNTIME_URL=http://localhost:8765\n"
+    "JWKS_URL=http://localhost:8766/.well-known/jwks.json\n"
+    "API_AUDIENCE=api://platform-local\n"
+    "API_ISSUER=http://localhost:8766\n"
+    "PLATFORM_ENV=local\n"
+    f"SCOPED_TOKEN_SIGNING_KEY={_LOCAL_SCOPED_TOKEN_SIGNING_KEY}\n"
+    "BASIC_TENANT_ID=t-test-001\n"
+    "PREMIUM_TENANT_ID=t-test-002\n"
+    "ADMIN_TENANT_ID=t-test-001\n"
+    "\n"
+)
+_ENV_TEST_NO_JWTS = (
+    "# JWTs not available (mock-jwks service was not running)\n"
+    "BASIC_TENANT_JWT=\n"
+    "PREMIUM_TENANT_JWT=\n"
+    "ADMIN_JWT=\n"
+)
+
+
+def write_env_test(
+    tokens: dict[str, str],
+    env_test_path: Path = _DEFAULT_ENV_TEST_PATH,
+    *,
+    writer: TextIO | None = None,
+) -> None:
+    """Write test environment variables to .env.test. Overwrites on each run.
+
+    When writer is given, env_test_path is ignored and the contents go to writer
+    instead (used by tests).
+    """
+    if tokens:
+        jwt_lines = (
+            f"BASIC_TENANT_JWT={tokens.get('basic', '')}\n"
+            f"PREMIUM_TENANT_JWT={tokens.get('premium', '')}\n"
+            f"ADMIN_JWT={tokens.get('admin', '')}\n"
+        )
     else:
-        lines += [
-            "# JWTs not available (mock-jwks service was not running)",
-            "BASIC_TENANT_JWT=",
-            "PREMIUM_TENANT_JWT=",
-            "ADMIN_JWT=",
-        ]
-    env_test_path.write_text("\n".join(lines) + "\n")
-    logger.info("Written %s", env_test_path)
+        jwt_lines = _ENV_TEST_NO_JWTS
+    content = _ENV_TEST_PREAMBLE + jwt_lines
+    if writer is not None:
+        writer.write(content)
+    else:
+        # One write of the whole file, always UTF-8 (the header contains a non-ASCII dash).
+        env_test_path.write_bytes(content.encode("utf-8"))
+        logger.info("Written %s", env_test_path)
 
 
 def run_bootstrap(
@@ -487,11 +547,13 @@ def run_bootstrap(
     ddb_client: Any = None,
     ddb_resource: Any = None,
     ssm_client: Any = None,
+    env_test_writer: TextIO | None = None,
 ) -> None:
     """Run the full dev bootstrap sequence.
 
     AWS client parameters may be injected for testing (moto-backed clients).
     When None, real boto3 clients are constructed pointing at localstack_endpoint.
+    env_test_writer, when given, receives the .env.test contents instead of env_test_path.
     """
     # LocalStack accepts any credential values; read from env for CI compatibility.
     _ls_key = os.environ.get("AWS_ACCESS_KEY_ID", "test")  # pragma: allowlist secret
@@ -531,7 +593,7 @@ def run_bootstrap(
     tokens = fetch_jwts(mock_jwks_url)
 
     logger.info("-- Step 7: Write .env.test")
-    write_env_test(tokens, env_test_path)
+    write_env_test(tokens, env_test_path, writer=env_test_writer)
 
     logger.info("==> dev-bootstrap complete")
 
@@ -144,10 +144,16 @@ def acquire_lock(
             TableName=table_name,
             Item=item,
             ConditionExpression="attribute_not_exists(PK)",
+            # The current holder comes back on the failed write; no follow-up GetItem.
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
     except ClientError as exc:
         if _is_conditional_check_failed(exc):
-            raise LockAlreadyHeldError(f"Lock already held: {lock_name}") from exc
+            holder = exc.response.get("Item", {})
+            held_by = holder.get("acquiredBy", {}).get("S")
+            held_since = holder.get("acquiredAt", {}).get("S")
+            detail = f" (held by {held_by} since {held_since})" if held_by else ""
+            raise LockAlreadyHeldError(f"Lock already held: {lock_name}{detail}") from exc
         raise
     return lock_record
 
@@ -2,7 +2,7 @@
 hash_layer.py — Dependency hash checker for agent layer caching.
 
 Reads [project.dependencies] from the agent's pyproject.toml and the resolved
-lockfile (uv.lock), computes a canonical SHA256 hash, and compares against the
+lockfile (uv.lock), computes a canonical BLAKE2b hash, and compares against the
 stored hash in SSM.
 
 Exit codes:
@@ -14,8 +14,7 @@ Hash algorithm:
     - Read uv.lock content (if present)
     - Canonicalise deps: sort, strip whitespace
     - Combine canonical deps with lockfile content
-    - SHA256 of combined form
-    - First 16 hex characters
+    - BLAKE2b of combined form with an 8-byte digest (16 hex characters)
 
 Usage:
     uv run python scripts/hash_layer.py <agent_name> --env <env>
@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import tomllib
 from pathlib import Path
+from typing import Any
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 HASH_LENGTH = 16
 
 
-def read_agent_deps(agent_name: str) -> list[str]:
-    """Read [project.dependencies] from agents/{agent_name}/pyproject.toml."""
+@functools.cache
+def _parse_toml(toml_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns and size are only part of the cache key, so an edited file is re-parsed.
+    with toml_path.open("rb") as fh:
+        return tomllib.load(fh)
+
+
+def _load_agent_pyproject(agent_name: str) -> tuple[Path, dict[str, Any]]:
+    """Return agents/{agent_name}/pyproject.toml parsed at most once per file revision."""
     toml_path = REPO_ROOT / "agents" / agent_name / "pyproject.toml"
-    if not toml_path.exists():
-        raise FileNotFoundError(f"pyproject.toml not found: {toml_path}")
+    try:
+        stat = toml_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"pyproject.toml not found: {toml_path}") from None
+    return toml_path, _parse_toml(toml_path, stat.st_mtime_ns, stat.st_size)
 
-    with toml_path.open("rb") as fh:
-        data = tomllib.load(fh)
+
+def read_agent_deps(agent_name: str) -> list[str]:
+    """Read [project.dependencies] from agents/{agent_name}/pyproject.toml."""
+    toml_path, data = _load_agent_pyproject(agent_name)
 
     deps = data.get("project", {}).get("dependencies", [])
     if not isinstance(deps, list):
@@ -27,12 +41,7 @@ def read_agent_deps(agent_name: str) -> list[str]:
 
 def read_deployment_type(agent_name: str) -> str:
     """Read deployment.type from agents/{agent_name}/pyproject.toml."""
-    toml_path = REPO_ROOT / "agents" / agent_name / "pyproject.toml"
-    if not toml_path.exists():
-        raise FileNotFoundError(f"pyproject.toml not found: {toml_path}")
-
-    with toml_path.open("rb") as fh:
-        data = tomllib.load(fh)
+    toml_path, data = _load_agent_pyproject(agent_name)
 
     deployment = data.get("tool", {}).get("agentcore", {}).get("deployment", {})
     deployment_type = deployment.get("type", "zip")
@@ -54,4 +63,5 @@ def compute_dependency_hash(deps: list[str], lockfile_content: str | None = None
     canonical = "\n".join(sorted(dep.strip() for dep in deps))
     if lockfile_content is not None:
         canonical = canonical + "\n---lockfile---\n" + lockfile_content
-    return hashlib.sha256(canonical.encode()).hexdigest()[:HASH_LENGTH]
+    # Only 64 bits are kept, so ask BLAKE2b for exactly that instead of truncating SHA256.
+    return hashlib.blake2b(canonical.encode(), digest_size=HASH_LENGTH // 2).hexdigest()
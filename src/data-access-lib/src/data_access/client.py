@@ -19,12 +19,13 @@ ADRs: ADR-012
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import boto3
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.parameters import AppConfigProvider
-from boto3.dynamodb.conditions import ConditionBase, Key
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder, Key
 
 from data_access.domains.capability import (
     CapabilityRollout,
@@ -233,11 +234,12 @@ class TenantScopedDynamoDB:
         *,
         expression_attribute_names: dict[str, str] | None = None,
         condition_expression: str | None = None,
+        return_values: str = "ALL_NEW",
     ) -> dict[str, Any]:
         """Update an item, enforcing tenant partition on PK.
 
-        Returns the raw boto3 response dict.  The updated attributes are
-        under the "Attributes" key (ReturnValues=ALL_NEW).
+        Returns the raw boto3 response dict.  The attributes selected by
+        return_values (ALL_NEW by default) are under the "Attributes" key.
         """
         self._validate_pk(key)
         table = self._dynamodb.Table(table_name)
@@ -245,7 +247,7 @@ class TenantScopedDynamoDB:
             "Key": key,
             "UpdateExpression": update_expression,
             "ExpressionAttributeValues": expression_attribute_values,
-            "ReturnValues": "ALL_NEW",
+            "ReturnValues": return_values,
         }
         if expression_attribute_names is not None:
             kwargs["ExpressionAttributeNames"] = expression_attribute_names
@@ -345,6 +347,8 @@ class TenantScopedDynamoDB:
         exclusive_start_key: dict[str, Any] | None = None,
         expression_attribute_names: dict[str, str] | None = None,
         expression_attribute_values: dict[str, Any] | None = None,
+        segment: int | None = None,
+        total_segments: int | None = None,
     ) -> PaginatedItems:
         """Scanning is intentionally unsupported on tenant-scoped clients."""
         _ = (
@@ -354,6 +358,8 @@ class TenantScopedDynamoDB:
             exclusive_start_key,
             expression_attribute_names,
             expression_attribute_values,
+            segment,
+            total_segments,
         )
         raise RuntimeError(
             "TenantScopedDynamoDB.scan is not permitted; use ControlPlaneDynamoDB "
@@ -367,6 +373,7 @@ class TenantScopedDynamoDB:
         filter_expression: ConditionBase | str | None = None,
         expression_attribute_names: dict[str, str] | None = None,
         expression_attribute_values: dict[str, Any] | None = None,
+        total_segments: int = 1,
     ) -> list[dict[str, Any]]:
         """Scanning is intentionally unsupported on tenant-scoped clients."""
         _ = (
@@ -374,6 +381,7 @@ class TenantScopedDynamoDB:
             filter_expression,
             expression_attribute_names,
             expression_attribute_values,
+            total_segments,
         )
         raise RuntimeError(
             "TenantScopedDynamoDB.scan_all is not permitted; use ControlPlaneDynamoDB "
@@ -470,19 +478,21 @@ class ControlPlaneDynamoDB(TenantScopedDynamoDB):
         exclusive_start_key: dict[str, Any] | None = None,
         expression_attribute_names: dict[str, str] | None = None,
         expression_attribute_values: dict[str, Any] | None = None,
+        segment: int | None = None,
+        total_segments: int | None = None,
     ) -> PaginatedItems:
         table = self._dynamodb.Table(table_name)
-        kwargs: dict[str, Any] = {}
-        if filter_expression is not None:
-            kwargs["FilterExpression"] = filter_expression
+        kwargs = _scan_kwargs(
+            filter_expression=filter_expression,
+            expression_attribute_names=expression_attribute_names,
+            expression_attribute_values=expression_attribute_values,
+            segment=segment,
+            total_segments=total_segments,
+        )
         if limit is not None:
             kwargs["Limit"] = limit
         if exclusive_start_key is not None:
             kwargs["ExclusiveStartKey"] = exclusive_start_key
-        if expression_attribute_names is not None:
-            kwargs["ExpressionAttributeNames"] = expression_attribute_names
-        if expression_attribute_values is not None:
-            kwargs["ExpressionAttributeValues"] = expression_attribute_values
 
         response = table.scan(**kwargs)
         return PaginatedItems(
@@ -497,22 +507,97 @@ class ControlPlaneDynamoDB(TenantScopedDynamoDB):
         filter_expression: ConditionBase | str | None = None,
         expression_attribute_names: dict[str, str] | None = None,
         expression_attribute_values: dict[str, Any] | None = None,
+        total_segments: int = 1,
     ) -> list[dict[str, Any]]:
+        """Scan every page of a table.
+
+        total_segments is chosen by the caller, not by table size. With 1 the
+        table is read sequentially and items come back in scan order. With more,
+        it is read as a DynamoDB parallel scan, one worker thread per segment,
+        and items come back grouped by segment (segment 0 first), each group in
+        scan order.
+        """
+        if total_segments <= 1:
+            items: list[dict[str, Any]] = []
+            exclusive_start_key = None
+            while True:
+                result = self.scan(
+                    table_name,
+                    filter_expression=filter_expression,
+                    exclusive_start_key=exclusive_start_key,
+                    expression_attribute_names=expression_attribute_names,
+                    expression_attribute_values=expression_attribute_values,
+                )
+                items.extend(result.items)
+                exclusive_start_key = result.last_evaluated_key
+                if not exclusive_start_key:
+                    return items
+
+        if isinstance(filter_expression, ConditionBase):
+            # boto3 serialises condition objects with one placeholder builder shared by
+            # every caller of the client, which is not safe across threads; build the
+            # expression once here so the workers only ever send strings.
+            built = ConditionExpressionBuilder().build_expression(filter_expression)
+            filter_expression = built.condition_expression
+            expression_attribute_names = {
+                **(expression_attribute_names or {}),
+                **built.attribute_name_placeholders,
+            }
+            expression_attribute_values = {
+                **(expression_attribute_values or {}),
+                **built.attribute_value_placeholders,
+            }
+
+        with ThreadPoolExecutor(max_workers=total_segments) as pool:
+            futures = [
+                pool.submit(
+                    self._scan_segment,
+                    table_name,
+                    _scan_kwargs(
+                        filter_expression=filter_expression,
+                        expression_attribute_names=expression_attribute_names,
+                        expression_attribute_values=expression_attribute_values,
+                        segment=segment,
+                        total_segments=total_segments,
+                    ),
+                )
+                for segment in range(total_segments)
+            ]
+            return [item for future in futures for item in future.result()]
+
+    def _scan_segment(self, table_name: str, kwargs: dict[str, Any]) -> list[dict[str, Any]]:
+        # boto3 resources are not thread-safe; the low-level client behind the
+        # resource is, as long as scan_all has already turned any condition object
+        # into a plain expression string.
+        client = self._dynamodb.meta.client
         items: list[dict[str, Any]] = []
-        exclusive_start_key = None
         while True:
-            result = self.scan(
-                table_name,
-                filter_expression=filter_expression,
-                exclusive_start_key=exclusive_start_key,
-                expression_attribute_names=expression_attribute_names,
-                expression_attribute_values=expression_attribute_values,
-            )
-            items.extend(result.items)
-            exclusive_start_key = result.last_evaluated_key
-            if not exclusive_start_key:
-                break
-        return items
+            response = client.scan(TableName=table_name, **kwargs)
+            items.extend(response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return items
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _scan_kwargs(
+    *,
+    filter_expression: ConditionBase | str | None,
+    expression_attribute_names: dict[str, str] | None,
+    expression_attribute_values: dict[str, Any] | None,
+    segment: int | None,
+    total_segments: int | None,
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {}
+    if filter_expression is not None:
+        kwargs["FilterExpression"] = filter_expression
+    if expression_attribute_names is not None:
+        kwargs["ExpressionAttributeNames"] = expression_attribute_names
+    if expression_attribute_values is not None:
+        kwargs["ExpressionAttributeValues"] = expression_attribute_values
+    if total_segments is not None:
+        kwargs["Segment"] = segment or 0
+        kwargs["TotalSegments"] = total_segments
+    return kwargs
 
 
 # ---------------------------------------------------------------------------
@@ -182,6 +182,22 @@ class TestTenantScopedDynamoDBUpdateItem:
             )
         assert result["Attributes"]["status"] == "expired"
 
+    def test_update_item_can_return_previous_attributes(self, ctx, mock_cw: MagicMock) -> None:
+        with mock_aws():
+            db, dynamo = make_dynamo_db(ctx, cw=mock_cw)
+            dynamo.Table(TABLE_NAME).put_item(
+                Item={"PK": f"TENANT#{TENANT_ID}", "SK": "SESS#004", "status": "active"}
+            )
+            result = db.update_item(
+                TABLE_NAME,
+                key={"PK": f"TENANT#{TENANT_ID}", "SK": "SESS#004"},
+                update_expression="SET #s = :s",
+                expression_attribute_values={":s": "expired"},
+                expression_attribute_names={"#s": "status"},
+                return_values="ALL_OLD",
+            )
+        assert result["Attributes"]["status"] == "active"
+
     def test_update_item_without_optional_params(self, ctx, mock_cw: MagicMock) -> None:
         with mock_aws():
             db, dynamo = make_dynamo_db(ctx, cw=mock_cw)
@@ -466,6 +482,75 @@ class TestControlPlaneDynamoDBScan:
                 assert len(items) == 5
                 assert mock_s.call_count == 3
 
+    def test_scan_all_parallel_segments_return_every_item(self, ctx, mock_cw: MagicMock) -> None:
+        with mock_aws():
+            _, dynamo = make_dynamo_db(ctx, cw=mock_cw)
+            table = dynamo.Table(TABLE_NAME)
+            for i in range(12):
+                table.put_item(Item={"PK": f"TENANT#{TENANT_ID}-{i}", "SK": "METADATA"})
+            db = ControlPlaneDynamoDB(ctx, dynamodb_resource=dynamo, cloudwatch_client=mock_cw)
+            client = dynamo.meta.client
+
+            with patch.object(client, "scan", wraps=client.scan) as segment_scan:
+                items = db.scan_all(TABLE_NAME, total_segments=3)
+
+        assert sorted(item["PK"] for item in items) == sorted(
+            f"TENANT#{TENANT_ID}-{i}" for i in range(12)
+        )
+        calls = [c.kwargs for c in segment_scan.call_args_list]
+        assert sorted(kwargs["Segment"] for kwargs in calls) == [0, 1, 2]
+        assert {kwargs["TotalSegments"] for kwargs in calls} == {3}
+
+    def test_scan_all_parallel_segments_build_condition_filter_once(
+        self, ctx, mock_cw: MagicMock
+    ) -> None:
+        from boto3.dynamodb.conditions import Attr
+
+        with mock_aws():
+            _, dynamo = make_dynamo_db(ctx, cw=mock_cw)
+            table = dynamo.Table(TABLE_NAME)
+            for i in range(12):
+                table.put_item(
+                    Item={
+                        "PK": f"TENANT#{TENANT_ID}-{i}",
+                        "SK": "METADATA",
+                        "status": "active" if i % 2 else "deleted",
+                    }
+                )
+            db = ControlPlaneDynamoDB(ctx, dynamodb_resource=dynamo, cloudwatch_client=mock_cw)
+            client = dynamo.meta.client
+
+            with patch.object(client, "scan", wraps=client.scan) as segment_scan:
+                items = db.scan_all(
+                    TABLE_NAME,
+                    filter_expression=Attr("status").eq("active"),
+                    total_segments=4,
+                )
+
+        assert sorted(item["PK"] for item in items) == sorted(
+            f"TENANT#{TENANT_ID}-{i}" for i in range(1, 12, 2)
+        )
+        calls = [c.kwargs for c in segment_scan.call_args_list]
+        assert len(calls) == 4
+        assert {kwargs["FilterExpression"] for kwargs in calls} == {"#n0 = :v0"}
+        assert all(kwargs["ExpressionAttributeNames"] == {"#n0": "status"} for kwargs in calls)
+
+    def test_scan_all_single_segment_reads_sequentially(self, ctx, mock_cw: MagicMock) -> None:
+        with mock_aws():
+            _, dynamo = make_dynamo_db(ctx, cw=mock_cw)
+            table = dynamo.Table(TABLE_NAME)
+            for i in range(3):
+                table.put_item(Item={"PK": f"TENANT#{TENANT_ID}-{i}", "SK": "METADATA"})
+            db = ControlPlaneDynamoDB(ctx, dynamodb_resource=dynamo, cloudwatch_client=mock_cw)
+            expected = db.scan(TABLE_NAME).items
+            client = dynamo.meta.client
+
+            with patch.object(client, "scan", wraps=client.scan) as segment_scan:
+                items = db.scan_all(TABLE_NAME)
+
+        assert items == expected
+        assert all("Segment" not in call.kwargs for call in segment_scan.call_args_list)
+
 
 class TestTenantScopedDynamoDBQueryAll:
     def test_query_all_paginates(self, ctx, mock_cw: MagicMock) -> None:
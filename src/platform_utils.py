@@ -12,6 +12,12 @@ def now_utc() -> datetime:
 
 
 def iso_utc(ts: datetime) -> str:
+    if ts.tzinfo is UTC:
+        # Fast path for the common case; same output as the isoformat route below.
+        return (
+            f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+            f"T{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}Z"
+        )
     return ts.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
@@ -27,7 +33,7 @@ def get_hex_jitter(num_bytes: int = 1) -> str:
 def coerce_optional_string(value: Any) -> str | None:
     if value is None:
         return None
-    text = str(value).strip()
+    text = (value if isinstance(value, str) else str(value)).strip()
     return text or None
 
 
@@ -49,6 +55,9 @@ def coerce_positive_int(value: Any, *, default: int) -> int:
 
 def json_default(value: Any) -> Any:
     if isinstance(value, Decimal):
+        # Compare against to_integral_value() rather than inspecting as_tuple().exponent:
+        # the tuple form is several times slower in CPython's C decimal and misclassifies
+        # integral values carrying a fractional exponent such as Decimal("100.0").
         if value == value.to_integral_value():
             return int(value)
         return float(value)
@@ -19,7 +19,7 @@ def can_read_tenant(caller: CallerIdentity, tenant_id: str) -> bool:
 
 
 def is_self_service_admin(caller: CallerIdentity) -> bool:
-    return bool(caller.roles & SELF_SERVICE_ADMIN_ROLES)
+    return not caller.roles.isdisjoint(SELF_SERVICE_ADMIN_ROLES)
 
 
 def can_manage_tenant_self_service(caller: CallerIdentity, tenant_id: str) -> bool:
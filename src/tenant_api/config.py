@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from src.tenant_api import constants, utils
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TenantApiConfig:
     region: str
     platform_env: str
@@ -47,8 +47,9 @@ def from_env(env: Mapping[str, str] | None = None) -> TenantApiConfig:
             source.get("AUDIT_EXPORT_URL_EXPIRY_SECONDS"),
             default=constants.AUDIT_EXPORT_URL_EXPIRY_SECONDS,
         ),
-        api_key_secret_prefix=utils.str_or_none(source.get(constants.API_KEY_SECRET_PREFIX_ENV))
-        or "platform/tenants",
+        api_key_secret_prefix=(
+            utils.str_or_none(source.get(constants.API_KEY_SECRET_PREFIX_ENV)) or "platform/tenants"
+        ).rstrip("/"),
         tenant_mgmt_role_arn=utils.str_or_none(source.get(constants.TENANT_MGMT_ROLE_ARN_ENV)),
         ops_locks_table_name=utils.str_or_none(source.get(constants.OPS_LOCKS_TABLE_ENV))
         or constants.DEFAULT_OPS_LOCKS_TABLE,
@@ -63,5 +64,19 @@ def from_env(env: Mapping[str, str] | None = None) -> TenantApiConfig:
     )
 
 
+_current: TenantApiConfig | None = None
+
+
 def current_config() -> TenantApiConfig:
-    return from_env()
+    # Lambda environment variables are fixed for the life of the execution environment.
+    # handler._dependencies() memoises clients built from this region; resetting this
+    # cache alone does not rebuild them.
+    global _current
+    if _current is None:
+        _current = from_env()
+    return _current
+
+
+def reset_config_cache() -> None:
+    global _current
+    _current = None
@@ -23,6 +23,7 @@ TENANT_ID_MAX_LENGTH = 32
 AUDIT_EXPORT_PREFIX = "audit-exports"
 AUDIT_EXPORT_URL_EXPIRY_SECONDS = 3600
 AUDIT_EXPORT_PAGE_SIZE = 200
+TENANT_LIST_SCAN_SEGMENTS = 4
 
 # Roles
 ADMIN_ROLES = frozenset({"Platform.Admin"})
@@ -46,6 +47,17 @@ AGENTCORE_CONCURRENT_SESSIONS_NAMESPACE = "AgentCore"
 AGENTCORE_CONCURRENT_SESSIONS_METRIC = "ConcurrentSessions"
 AGENTCORE_QUOTA_LOOKBACK_MINUTES = 5
 
+# Request Fields
+TENANT_CREATE_REQUIRED_FIELDS = (
+    "tenantId",
+    "appId",
+    "displayName",
+    "tier",
+    "ownerEmail",
+    "ownerTeam",
+    "accountId",
+)
+
 # Allowed Status Sets
 TENANT_PROVISIONING_STATUSES = frozenset({"pending", "provisioning", "ready", "failed"})
 PLATFORM_TENANT_ID = "platform"
@@ -39,17 +39,22 @@ def fallback_region_param_name() -> str:
     return config.current_config().fallback_region_param_name
 
 
+# Unknown or missing caller tiers fall back to STANDARD; a dict lookup avoids raising
+# and catching ValueError from TenantTier(...) on every scoped client request.
+_TIERS_BY_VALUE = {tier.value: tier for tier in TenantTier}
+
+
 def _tenant_context_for_scope(
     *,
     tenant_id: str,
     caller: CallerIdentity,
     app_id: str | None,
 ) -> TenantContext:
-    tier_raw = (caller.tier or TenantTier.STANDARD.value).lower()
-    try:
-        tier = TenantTier(tier_raw)
-    except ValueError:
-        tier = TenantTier.STANDARD
+    tier = (
+        _TIERS_BY_VALUE.get(caller.tier.lower(), TenantTier.STANDARD)
+        if caller.tier
+        else TenantTier.STANDARD
+    )
     return TenantContext(
         tenant_id=tenant_id,
         app_id=app_id or caller.app_id or "unknown-app",
@@ -51,16 +51,13 @@ def read_tenant_record(
 def build_update_expression(
     attributes: dict[str, Any],
 ) -> tuple[str, dict[str, str], dict[str, Any]]:
-    names: dict[str, str] = {}
-    values: dict[str, Any] = {}
-    set_parts: list[str] = []
-    for idx, (field, raw_value) in enumerate(attributes.items(), start=1):
-        name_key = f"#n{idx}"
-        value_key = f":v{idx}"
-        names[name_key] = field
-        values[value_key] = ddb_value(raw_value)
-        set_parts.append(f"{name_key} = {value_key}")
-    return "SET " + ", ".join(set_parts), names, values
+    names = {f"#n{idx}": field for idx, field in enumerate(attributes, start=1)}
+    values = {
+        f":v{idx}": ddb_value(raw_value)
+        for idx, raw_value in enumerate(attributes.values(), start=1)
+    }
+    expression = "SET " + ", ".join(f"#n{idx} = :v{idx}" for idx in range(1, len(attributes) + 1))
+    return expression, names, values
 
 
 def read_failover_lock_record(
@@ -3,8 +3,9 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Any
 
-import boto3
+from botocore.config import Config
 
+from src.platform_aws import boto3_session
 from src.tenant_api import utils
 from src.tenant_api.constants import (
     AGENTCORE_CONCURRENT_SESSIONS_METRIC,
@@ -14,6 +15,10 @@ from src.tenant_api.constants import (
 )
 from src.tenant_api.models import TenantApiDependencies
 
+# TCP keep-alive lets warm invocations reuse pooled TLS connections instead of having
+# idle sockets dropped between requests.
+_CLIENT_CONFIG = Config(tcp_keepalive=True, retries={"mode": "standard"})
+
 
 class _NoopUsageClient:
     def get_tenant_usage(self, *, tenant_id: str, app_id: str | None) -> dict[str, Any]:
@@ -24,6 +29,9 @@ class _NoopMemoryProvisioner:
     def provision(self, *, tenant_id: str, app_id: str) -> dict[str, Any]:
         return {}
 
+    def deprovision(self, *, tenant_id: str, app_id: str) -> None:
+        return None
+
 
 class _AwsPlatformQuotaClient:
     def __init__(self, session: Any) -> None:
@@ -97,12 +105,12 @@ class _AwsPlatformQuotaClient:
 
 
 def build_tenant_api_dependencies(*, region: str) -> TenantApiDependencies:
-    session = boto3.session.Session(region_name=region)
+    session = boto3_session(region_name=region)
     return TenantApiDependencies(
-        secretsmanager=session.client("secretsmanager"),
-        events=session.client("events"),
-        ssm=session.client("ssm"),
-        awslambda=session.client("lambda"),
+        secretsmanager=session.client("secretsmanager", config=_CLIENT_CONFIG),
+        events=session.client("events", config=_CLIENT_CONFIG),
+        ssm=session.client("ssm", config=_CLIENT_CONFIG),
+        awslambda=session.client("lambda", config=_CLIENT_CONFIG),
         usage_client=_NoopUsageClient(),
         memory_provisioner=_NoopMemoryProvisioner(),
         platform_quota_client=_AwsPlatformQuotaClient(session),
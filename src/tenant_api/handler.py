@@ -10,60 +10,42 @@ ADRs: ADR-012
 
 from __future__ import annotations
 
-import json
-import secrets
-from datetime import UTC, datetime
 from typing import Any
 
 from aws_lambda_powertools import Logger
-from aws_lambda_powertools.logging import correlation_paths
-from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
-from data_access import (
-    ControlPlaneDynamoDB,
-    TenantContext,
-    TenantScopedDynamoDB,
-    TenantScopedS3,
-)
-from data_access.models import (
-    AgentStatus,
-    TenantStatus,
-    TenantTier,
-    normalize_agent_status,
-)
 
 from src.tenant_api import (
-    agent_logic,
-    auth,
     config,
-    constants,
     db_factory,
-    db_utils,
     dependency_factories,
-    events,
     http_utils,
-    lifecycle_logic,
-    models,
-    secrets_manager,
-    serialization,
     utils,
     validation,
 )
-from src.tenant_api.constants import (
-    ADMIN_ROLES,
-    TENANT_PROVISIONING_STATUSES,
-)
 from src.tenant_api.models import CallerIdentity, TenantApiDependencies
 
 logger = Logger(service="tenant-api")
 
+_SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
 _NoopUsageClient = dependency_factories._NoopUsageClient
 _NoopMemoryProvisioner = dependency_factories._NoopMemoryProvisioner
 _AwsPlatformQuotaClient = dependency_factories._AwsPlatformQuotaClient
 
 
+_cached_dependencies: TenantApiDependencies | None = None
+
+
 def _dependencies() -> TenantApiDependencies:
-    return dependency_factories.build_tenant_api_dependencies(region=config.current_config().region)
+    # Built on first use and kept for the life of the execution environment so warm
+    # invocations reuse the same boto3 clients.
+    global _cached_dependencies
+    if _cached_dependencies is None:
+        _cached_dependencies = dependency_factories.build_tenant_api_dependencies(
+            region=config.current_config().region
+        )
+    return _cached_dependencies
 
 
 _parse_roles = http_utils.parse_roles
@@ -173,10 +155,10 @@ def _dispatch_tenant_routes(
 
 @logger.inject_lambda_context(clear_state=True, log_event=False)
 def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
-    deps = _dependencies()
     detail_type = utils.str_or_none(event.get("detail-type"))
     source = utils.str_or_none(event.get("source"))
     if detail_type and source == "platform.tenant_provisioner":
+        deps = _dependencies()
         detail = event.get("detail") or {}
         tenant_id = utils.str_or_none(detail.get("tenantId")) if isinstance(detail, dict) else None
         app_id = utils.str_or_none(detail.get("appId")) if isinstance(detail, dict) else None
@@ -194,17 +176,17 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             error_code = exc.response.get("Error", {}).get("Code", "Unknown")
             return http_utils.error(502, "AWS_CLIENT_ERROR", error_code)
 
-    caller = http_utils.caller_identity(event)
+    request = http_utils.parse_request(event)
+    method = request.method
+    if method not in _SUPPORTED_METHODS:
+        # No route accepts this method; skip identity parsing and dependency wiring.
+        return http_utils.error(405, "METHOD_NOT_ALLOWED", "Unsupported tenant API route")
+
+    deps = _dependencies()
+    caller = http_utils.caller_identity(event, authorizer=request.authorizer)
     logger.append_keys(appid=caller.app_id or "unknown", tenantid=caller.tenant_id or "unknown")
 
-    method = str(
-        event.get("httpMethod")
-        or event.get("requestContext", {}).get("http", {}).get("method")
-        or "GET"
-    ).upper()
-    path = str(
-        event.get("path") or event.get("requestContext", {}).get("http", {}).get("path") or ""
-    ).rstrip("/")
+    path = request.path
 
     try:
         path_params = event.get("pathParameters") or {}
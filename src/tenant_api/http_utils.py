@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from src.tenant_api.models import CallerIdentity
+from src.tenant_api.models import CallerIdentity, RequestLine
 from src.tenant_api.utils import json_default, str_or_none
 
 
@@ -35,7 +35,10 @@ def require_json_body(event: dict[str, Any]) -> dict[str, Any]:
 
 
 def get_authorizer_map(event: dict[str, Any]) -> dict[str, Any]:
-    request_context = event.get("requestContext", {})
+    return _authorizer_from_context(event.get("requestContext", {}))
+
+
+def _authorizer_from_context(request_context: dict[str, Any]) -> dict[str, Any]:
     authorizer = request_context.get("authorizer", {})
     if not isinstance(authorizer, dict):
         return {}
@@ -50,26 +53,52 @@ def parse_roles(value: Any) -> frozenset[str]:
     if isinstance(value, list):
         return frozenset(str(v).strip() for v in value if str(v).strip())
     if isinstance(value, str):
-        try:
-            decoded = json.loads(value)
-            if isinstance(decoded, list):
-                return frozenset(str(v).strip() for v in decoded if str(v).strip())
-        except json.JSONDecodeError:
-            pass
-        normalized = value.replace(",", " ").split()
-        return frozenset(part.strip() for part in normalized if part.strip())
+        # Only a JSON array can yield roles; skip the decode attempt (and the exception
+        # it raises) for the common plain or comma-delimited claim.
+        if value.lstrip().startswith("["):
+            try:
+                decoded = json.loads(value)
+                if isinstance(decoded, list):
+                    return frozenset(str(v).strip() for v in decoded if str(v).strip())
+            except json.JSONDecodeError:
+                pass
+        # split() with no separator already drops empty and whitespace-only parts.
+        return frozenset(value.replace(",", " ").split())
     return frozenset()
 
 
-def caller_identity(event: dict[str, Any]) -> CallerIdentity:
-    auth = get_authorizer_map(event)
+def _pick(mapping: dict[str, Any], *candidates: str) -> str | None:
+    """Return the first truthy value among candidate keys, as a stripped string."""
+    for key in candidates:
+        value = mapping.get(key)
+        if value:
+            return str_or_none(value)
+    return None
+
+
+def parse_request(event: dict[str, Any]) -> RequestLine:
+    """Read method, path and authorizer context in a single walk of the event.
+
+    Handles both REST API (v1) and HTTP API (v2) payload shapes.
+    """
+    request_context = event.get("requestContext") or {}
+    http = request_context.get("http") or {}
+    return RequestLine(
+        method=str(event.get("httpMethod") or http.get("method") or "GET").upper(),
+        path=str(event.get("path") or http.get("path") or "").rstrip("/"),
+        authorizer=_authorizer_from_context(request_context),
+    )
+
+
+def caller_identity(
+    event: dict[str, Any], *, authorizer: dict[str, Any] | None = None
+) -> CallerIdentity:
+    auth = get_authorizer_map(event) if authorizer is None else authorizer
     return CallerIdentity(
-        tenant_id=str_or_none(auth.get("tenantid") or auth.get("tenantId")),
-        app_id=str_or_none(auth.get("appid") or auth.get("appId")),
-        tier=str_or_none(auth.get("tier")),
-        sub=str_or_none(auth.get("sub")),
+        tenant_id=_pick(auth, "tenantid", "tenantId"),
+        app_id=_pick(auth, "appid", "appId"),
+        tier=_pick(auth, "tier"),
+        sub=_pick(auth, "sub"),
         roles=parse_roles(auth.get("roles")),
-        usage_identifier_key=str_or_none(
-            auth.get("usageIdentifierKey") or auth.get("usage_identifier_key")
-        ),
+        usage_identifier_key=_pick(auth, "usageIdentifierKey", "usage_identifier_key"),
     )
@@ -9,26 +9,29 @@ from src.tenant_api.constants import ALLOWED_TENANT_INVITE_ROLES
 from src.tenant_api.http_utils import response, str_or_none
 from src.tenant_api.models import CallerIdentity
 
+_TIER_VALUES = frozenset(tier.value for tier in TenantTier)
+_STATUS_VALUES = frozenset(status.value for status in TenantStatus)
+
 
 def normalize_tier(value: Any) -> str:
     tier_text = str_or_none(value)
     if tier_text is None:
         raise ValueError("tier is required")
-    try:
-        return TenantTier(tier_text.lower()).value
-    except ValueError as exc:
-        raise ValueError("tier must be one of: basic, standard, premium") from exc
+    normalized = tier_text.lower()
+    if normalized not in _TIER_VALUES:
+        raise ValueError("tier must be one of: basic, standard, premium")
+    return normalized
 
 
 def normalize_status(value: Any) -> str:
     status_text = str_or_none(value)
     if status_text is None:
         raise ValueError("status is required")
-    try:
-        return TenantStatus(status_text.lower()).value
-    except ValueError as exc:
+    normalized = status_text.lower()
+    if normalized not in _STATUS_VALUES:
         allowed = ", ".join(status.value for status in TenantStatus)
-        raise ValueError(f"status must be one of: {allowed}") from exc
+        raise ValueError(f"status must be one of: {allowed}")
+    return normalized
 
 
 def normalize_tenant_invite_role(value: Any) -> str:
@@ -6,7 +6,7 @@ from typing import Any
 from src.tenant_api.constants import ADMIN_ROLES
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallerIdentity:
     tenant_id: str | None
     app_id: str | None
@@ -17,7 +17,7 @@ class CallerIdentity:
 
     @property
     def is_admin(self) -> bool:
-        return bool(self.roles & ADMIN_ROLES)
+        return not self.roles.isdisjoint(ADMIN_ROLES)
 
     @property
     def is_platform_actor(self) -> bool:
@@ -26,7 +26,7 @@ class CallerIdentity:
         return self.tenant_id == PLATFORM_TENANT_ID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TenantApiDependencies:
     secretsmanager: Any
     events: Any
@@ -35,3 +35,10 @@ class TenantApiDependencies:
     usage_client: Any
     memory_provisioner: Any
     platform_quota_client: Any
+
+
+@dataclass(frozen=True, slots=True)
+class RequestLine:
+    method: str
+    path: str
+    authorizer: dict[str, Any]
@@ -295,6 +295,15 @@ def handle_lambda_rollback(
     )
 
 
+_PLATFORM_ADMIN_ROUTES = {
+    ("POST", "/v1/platform/failover"): handle_platform_failover,
+    ("GET", "/v1/platform/quota"): handle_platform_quota,
+    ("POST", "/v1/platform/quota/split-accounts"): handle_platform_split_accounts,
+    ("GET", "/v1/platform/billing/status"): handle_platform_billing_status,
+    ("GET", "/v1/platform/service-health"): handle_service_health,
+}
+
+
 def dispatch_platform_admin_routes(
     path: str,
     method: str,
@@ -302,17 +311,10 @@ def dispatch_platform_admin_routes(
     caller: models.CallerIdentity,
     deps: models.TenantApiDependencies,
 ) -> dict[str, Any] | None:
-    if path == "/v1/platform/failover" and method == "POST":
-        return handle_platform_failover(event, caller, deps)
-    if path == "/v1/platform/quota" and method == "GET":
-        return handle_platform_quota(event, caller, deps)
-    if path == "/v1/platform/quota/split-accounts" and method == "POST":
-        return handle_platform_split_accounts(event, caller, deps)
-    if path == "/v1/platform/billing/status" and method == "GET":
-        return handle_platform_billing_status(event, caller, deps)
-    if path == "/v1/platform/service-health" and method == "GET":
-        return handle_service_health(event, caller, deps)
-    return None
+    route = _PLATFORM_ADMIN_ROUTES.get((method, path))
+    if route is None:
+        return None
+    return route(event, caller, deps)
 
 
 def dispatch_ops_routes(
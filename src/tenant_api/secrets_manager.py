@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import json
-import secrets
+from base64 import urlsafe_b64encode
+from os import urandom
 
 from aws_lambda_powertools import Logger
+from botocore.exceptions import ClientError
 
 from src.tenant_api import config
 from src.tenant_api.models import TenantApiDependencies
 
 logger = Logger(service="tenant-api-secrets")
 
+API_KEY_BYTES = 32
+
+
+def new_api_key(num_bytes: int = API_KEY_BYTES) -> str:
+    # Same construction as secrets.token_urlsafe, without the module indirection.
+    return urlsafe_b64encode(urandom(num_bytes)).rstrip(b"=").decode("ascii")
+
 
 def secret_prefix() -> str:
     return config.current_config().api_key_secret_prefix
@@ -21,12 +30,12 @@ def create_api_key_secret(
     tenant_id: str,
     app_id: str,
 ) -> str:
-    secret_name = f"{secret_prefix().rstrip('/')}/{tenant_id}/api-key"
+    secret_name = f"{secret_prefix()}/{tenant_id}/api-key"
     secret_string = json.dumps(
         {
             "tenantId": tenant_id,
             "appId": app_id,
-            "apiKey": secrets.token_urlsafe(32),
+            "apiKey": new_api_key(),
         }
     )
     response = deps.secretsmanager.create_secret(
@@ -47,6 +56,22 @@ def create_api_key_secret(
     return str(response["ARN"])
 
 
+def delete_api_key_secret(
+    deps: TenantApiDependencies,
+    *,
+    secret_arn: str,
+    tenant_id: str,
+) -> None:
+    """Compensate a create that failed after its API key secret was written."""
+    try:
+        deps.secretsmanager.delete_secret(SecretId=secret_arn, ForceDeleteWithoutRecovery=True)
+    except ClientError:
+        logger.exception(
+            "Failed to delete orphaned tenant API key secret",
+            extra={"tenant_id": tenant_id, "secret_arn": secret_arn},
+        )
+
+
 def attach_tenant_api_key_secret_policy(
     deps: TenantApiDependencies,
     *,
@@ -2,34 +2,37 @@ from __future__ import annotations
 
 from typing import Any
 
+_OPTIONAL_FIELDS = (
+    "executionRoleArn",
+    "memoryStoreArn",
+    "runtimeRegion",
+    "fallbackRegion",
+    "provisioningStatus",
+    "provisioningUpdatedAt",
+    "provisioningError",
+    "apiKeySecretArn",
+    "monthlyBudgetUsd",
+    "deletedAt",
+    "purgeAtEpochSeconds",
+)
+
 
 def serialize_tenant(item: dict[str, Any]) -> dict[str, Any]:
+    get = item.get
     record = {
-        "tenantId": str(item.get("tenantId", "")),
-        "appId": str(item.get("appId", "")),
-        "displayName": str(item.get("displayName", "")),
-        "tier": str(item.get("tier", "")),
-        "status": str(item.get("status", "")),
-        "createdAt": item.get("createdAt"),
-        "updatedAt": item.get("updatedAt"),
-        "ownerEmail": item.get("ownerEmail"),
-        "ownerTeam": item.get("ownerTeam"),
-        "accountId": item.get("accountId"),
+        "tenantId": str(get("tenantId", "")),
+        "appId": str(get("appId", "")),
+        "displayName": str(get("displayName", "")),
+        "tier": str(get("tier", "")),
+        "status": str(get("status", "")),
+        "createdAt": get("createdAt"),
+        "updatedAt": get("updatedAt"),
+        "ownerEmail": get("ownerEmail"),
+        "ownerTeam": get("ownerTeam"),
+        "accountId": get("accountId"),
     }
-    optional_fields = (
-        "executionRoleArn",
-        "memoryStoreArn",
-        "runtimeRegion",
-        "fallbackRegion",
-        "provisioningStatus",
-        "provisioningUpdatedAt",
-        "provisioningError",
-        "apiKeySecretArn",
-        "monthlyBudgetUsd",
-        "deletedAt",
-        "purgeAtEpochSeconds",
-    )
-    for field in optional_fields:
-        if field in item and item[field] is not None:
-            record[field] = item[field]
+    for field in _OPTIONAL_FIELDS:
+        value = get(field)
+        if value is not None:
+            record[field] = value
     return record
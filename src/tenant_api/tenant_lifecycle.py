@@ -3,10 +3,14 @@ from __future__ import annotations
 import json
 import secrets
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Any
 
+from aws_lambda_powertools import Logger
 from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
 from data_access.models import TenantStatus
 
 try:
@@ -42,6 +46,8 @@ except (ImportError, ValueError):  # pragma: no cover
         validation,
     )
 
+logger = Logger(service="tenant-api-lifecycle")
+
 
 def _shared_handler() -> Any | None:
     return sys.modules.get("src.tenant_api.handler") or sys.modules.get("handler")
@@ -75,8 +81,7 @@ def handle_create(
 ) -> dict[str, Any]:
     auth.require_admin(caller)
     body = http_utils.require_json_body(event)
-    required = ["tenantId", "appId", "displayName", "tier", "ownerEmail", "ownerTeam", "accountId"]
-    missing = [field for field in required if utils.str_or_none(body.get(field)) is None]
+    missing = validation.missing_fields(body, constants.TENANT_CREATE_REQUIRED_FIELDS)
     if missing:
         raise ValueError(f"Missing required field(s): {', '.join(missing)}")
 
@@ -88,21 +93,45 @@ def handle_create(
     if db_utils.read_tenant_record(tenant_id=tenant_id, caller=caller, app_id=app_id) is not None:
         return http_utils.error(409, "CONFLICT", "Tenant already exists")
 
-    memory_info = deps.memory_provisioner.provision(tenant_id=tenant_id, app_id=app_id) or {}
-    api_key_secret_arn = secrets_manager.create_api_key_secret(
-        deps, tenant_id=tenant_id, app_id=app_id
-    )
+    # Memory provisioning and secret creation are independent external calls.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        memory_future = executor.submit(
+            deps.memory_provisioner.provision, tenant_id=tenant_id, app_id=app_id
+        )
+        secret_future = executor.submit(
+            secrets_manager.create_api_key_secret, deps, tenant_id=tenant_id, app_id=app_id
+        )
+    memory_error = memory_future.exception()
+    secret_error = secret_future.exception()
+    if secret_error is not None:
+        if memory_error is None:
+            _deprovision_memory(deps, tenant_id=tenant_id, app_id=app_id)
+        else:
+            logger.error(
+                "Memory provisioning also failed during tenant create",
+                exc_info=memory_error,
+                extra={"tenant_id": tenant_id, "app_id": app_id},
+            )
+        raise secret_error
+    api_key_secret_arn = secret_future.result()
+    if memory_error is not None:
+        secrets_manager.delete_api_key_secret(
+            deps, secret_arn=api_key_secret_arn, tenant_id=tenant_id
+        )
+        raise memory_error
+    memory_info = memory_future.result() or {}
 
+    now_iso = utils.iso(now)
     attributes: dict[str, Any] = {
         "tenantId": tenant_id,
         "appId": app_id,
         "displayName": str(body["displayName"]).strip(),
         "tier": tier,
         "status": TenantStatus.ACTIVE.value,
-        "createdAt": utils.iso(now),
-        "updatedAt": utils.iso(now),
+        "createdAt": now_iso,
+        "updatedAt": now_iso,
         "provisioningStatus": "pending",
-        "provisioningUpdatedAt": utils.iso(now),
+        "provisioningUpdatedAt": now_iso,
         "ownerEmail": str(body["ownerEmail"]).strip(),
         "ownerTeam": str(body["ownerTeam"]).strip(),
         "accountId": str(body["accountId"]).strip(),
@@ -121,9 +150,30 @@ def handle_create(
         **attributes,
     }
 
-    # Save to DynamoDB
+    # Save to DynamoDB; the condition closes the race with a concurrent create.
     db = _db_for_tenant(tenant_id=tenant_id, caller=caller, app_id=app_id)
-    db.put_item(db_factory.tenants_table_name(), item)
+    try:
+        db.put_item(
+            db_factory.tenants_table_name(),
+            item,
+            condition_expression="attribute_not_exists(PK)",
+        )
+    except ClientError as exc:
+        secrets_manager.delete_api_key_secret(
+            deps, secret_arn=api_key_secret_arn, tenant_id=tenant_id
+        )
+        if exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            # Lost the race to a concurrent create. Memory is provisioned per tenant and
+            # app id, so it may be the store the winning create now records; leave it.
+            return http_utils.error(409, "CONFLICT", "Tenant already exists")
+        _deprovision_memory(deps, tenant_id=tenant_id, app_id=app_id)
+        raise
+    except Exception:
+        secrets_manager.delete_api_key_secret(
+            deps, secret_arn=api_key_secret_arn, tenant_id=tenant_id
+        )
+        _deprovision_memory(deps, tenant_id=tenant_id, app_id=app_id)
+        raise
 
     # Emit event
     events.put_event(
@@ -141,18 +191,53 @@ def handle_create(
     return http_utils.response(201, {"tenant": serialization.serialize_tenant(item)})
 
 
+def _deprovision_memory(
+    deps: models.TenantApiDependencies,
+    *,
+    tenant_id: str,
+    app_id: str,
+) -> None:
+    """Compensate a create that failed after its memory was provisioned."""
+    deprovision = getattr(deps.memory_provisioner, "deprovision", None)
+    if deprovision is None:
+        logger.warning(
+            "Memory provisioner cannot deprovision; tenant memory may be orphaned",
+            extra={"tenant_id": tenant_id, "app_id": app_id},
+        )
+        return
+    try:
+        deprovision(tenant_id=tenant_id, app_id=app_id)
+    except Exception:
+        logger.exception(
+            "Failed to deprovision memory for failed tenant create",
+            extra={"tenant_id": tenant_id, "app_id": app_id},
+        )
+
+
 def handle_read(
     caller: models.CallerIdentity,
     deps: models.TenantApiDependencies,
     *,
     tenant_id: str,
 ) -> dict[str, Any]:
+    tenant = _tenant_with_usage(caller, deps, tenant_id=tenant_id)
+    if tenant is None:
+        return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
+    return http_utils.response(200, {"tenant": tenant})
+
+
+def _tenant_with_usage(
+    caller: models.CallerIdentity,
+    deps: models.TenantApiDependencies,
+    *,
+    tenant_id: str,
+) -> dict[str, Any] | None:
     if not auth.can_read_tenant(caller, tenant_id):
         raise PermissionError("Access denied")
 
     item = db_utils.read_tenant_record(tenant_id=tenant_id, caller=caller)
     if item is None:
-        return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
+        return None
 
     tenant = serialization.serialize_tenant(item)
     usage = deps.usage_client.get_tenant_usage(
@@ -162,7 +247,7 @@ def handle_read(
     tenant["usage"] = usage if isinstance(usage, dict) else {}
     if caller.usage_identifier_key:
         tenant["usage"]["usageIdentifierKey"] = caller.usage_identifier_key
-    return http_utils.response(200, {"tenant": tenant})
+    return tenant
 
 
 def handle_list_tenants(
@@ -171,18 +256,22 @@ def handle_list_tenants(
     deps: models.TenantApiDependencies,
 ) -> dict[str, Any]:
     if not caller.is_admin:
-        if caller.tenant_id:
-            response = handle_read(caller, deps, tenant_id=caller.tenant_id)
-            if response["statusCode"] == 200:
-                body = json.loads(response["body"])
-                return http_utils.response(200, {"items": [body["tenant"]], "nextToken": None})
-        return http_utils.response(200, {"items": [], "nextToken": None})
+        tenant = (
+            _tenant_with_usage(caller, deps, tenant_id=caller.tenant_id)
+            if caller.tenant_id
+            else None
+        )
+        return http_utils.response(
+            200, {"items": [tenant] if tenant is not None else [], "nextToken": None}
+        )
 
     query = event.get("queryStringParameters") or {}
     status_filter = utils.str_or_none(query.get("status")) if isinstance(query, dict) else None
     tier_filter = utils.str_or_none(query.get("tier")) if isinstance(query, dict) else None
     db = _control_plane_db(caller)
-    items = db.scan_all(db_factory.tenants_table_name())
+    items = db.scan_all(
+        db_factory.tenants_table_name(), total_segments=constants.TENANT_LIST_SCAN_SEGMENTS
+    )
     records = [
         serialization.serialize_tenant(item)
         for item in items
@@ -203,10 +292,6 @@ def handle_update(
     auth.require_admin(caller)
     body = http_utils.require_json_body(event)
 
-    item = db_utils.read_tenant_record(tenant_id=tenant_id, caller=caller)
-    if item is None:
-        return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
-
     now = _now_utc()
     updates: dict[str, Any] = {"updatedAt": utils.iso(now)}
 
@@ -221,20 +306,13 @@ def handle_update(
             body["monthlyBudgetUsd"], field="monthlyBudgetUsd"
         )
 
-    expression, names, values = db_utils.build_update_expression(updates)
-    db = _db_for_tenant(tenant_id=tenant_id, caller=caller, app_id=None)
-    db.update_item(
-        db_factory.tenants_table_name(),
-        db_utils.tenant_key(tenant_id),
-        expression,
-        values,
-        expression_attribute_names=names,
-    )
+    item = _update_existing_tenant(caller, tenant_id=tenant_id, updates=updates)
+    if item is None:
+        return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
 
-    # Re-fetch for response
-    updated_item = db_utils.read_tenant_record(tenant_id=tenant_id, caller=caller)
+    updated_item = {**item, **{field: db_utils.ddb_value(v) for field, v in updates.items()}}
     old_tier = utils.str_or_none(item.get("tier"))
-    new_tier = utils.str_or_none((updated_item or item).get("tier"))
+    new_tier = utils.str_or_none(updated_item.get("tier"))
     detail_type = "tenant.updated"
     detail: dict[str, Any] = {"tenantId": tenant_id, "actorSub": caller.sub}
     if old_tier != new_tier and new_tier is not None:
@@ -242,10 +320,37 @@ def handle_update(
         detail["oldTier"] = old_tier
         detail["newTier"] = new_tier
     events.put_event(deps, detail_type=detail_type, detail=detail)
-    return http_utils.response(
-        200,
-        {"tenant": serialization.serialize_tenant(updated_item or item)},
-    )
+    return http_utils.response(200, {"tenant": serialization.serialize_tenant(updated_item)})
+
+
+def _update_existing_tenant(
+    caller: models.CallerIdentity,
+    *,
+    tenant_id: str,
+    updates: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Apply updates to the tenant METADATA item and return its previous attributes.
+
+    The existence check rides on the write's condition expression, so a missing
+    tenant costs no extra read and yields None.
+    """
+    expression, names, values = db_utils.build_update_expression(updates)
+    db = _db_for_tenant(tenant_id=tenant_id, caller=caller, app_id=None)
+    try:
+        response = db.update_item(
+            db_factory.tenants_table_name(),
+            db_utils.tenant_key(tenant_id),
+            expression,
+            values,
+            expression_attribute_names=names,
+            condition_expression="attribute_exists(PK)",
+            return_values="ALL_OLD",
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            return None
+        raise
+    return response.get("Attributes") or {}
 
 
 def handle_delete(
@@ -256,30 +361,21 @@ def handle_delete(
 ) -> dict[str, Any]:
     auth.require_admin(caller)
 
-    item = db_utils.read_tenant_record(tenant_id=tenant_id, caller=caller)
-    if item is None:
-        return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
-
     now = _now_utc()
+    now_iso = utils.iso(now)
     # Soft delete: update status and set purge date
     updates = {
         "status": "deleted",
-        "deletedAt": utils.iso(now),
+        "deletedAt": now_iso,
         "purgeAtEpochSeconds": int(
             (now + timedelta(days=constants.DELETE_RETENTION_DAYS)).timestamp()
         ),
-        "updatedAt": utils.iso(now),
+        "updatedAt": now_iso,
     }
 
-    expression, names, values = db_utils.build_update_expression(updates)
-    db = _db_for_tenant(tenant_id=tenant_id, caller=caller, app_id=None)
-    db.update_item(
-        db_factory.tenants_table_name(),
-        db_utils.tenant_key(tenant_id),
-        expression,
-        values,
-        expression_attribute_names=names,
-    )
+    item = _update_existing_tenant(caller, tenant_id=tenant_id, updates=updates)
+    if item is None:
+        return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
 
     deleted_item = dict(item)
     deleted_item.update(updates)
@@ -317,10 +413,11 @@ def handle_tenant_provisioning_event(
         raise ValueError(f"Invalid provisioning status: {status}")
 
     now = _now_utc()
+    now_iso = utils.iso(now)
     updates: dict[str, Any] = {
         "provisioningStatus": status,
-        "provisioningUpdatedAt": utils.iso(now),
-        "updatedAt": utils.iso(now),
+        "provisioningUpdatedAt": now_iso,
+        "updatedAt": now_iso,
     }
     if status == "ready":
         updates["status"] = TenantStatus.ACTIVE.value
@@ -425,7 +522,7 @@ def handle_rotate_api_key(
             {
                 "tenantId": tenant_id,
                 "appId": app_id,
-                "apiKey": secrets.token_urlsafe(32),
+                "apiKey": secrets_manager.new_api_key(),
                 "rotatedAt": utils.iso(rotated_at),
             }
         ),
@@ -691,6 +788,25 @@ def handle_list_invites(
     return http_utils.response(200, {"items": invites})
 
 
+_RouteHandler = Callable[
+    [dict[str, Any], models.CallerIdentity, models.TenantApiDependencies, str],
+    dict[str, Any],
+]
+
+# Keyed on (method, path suffix after /v1/tenants/{tenantId}). Targets are looked up
+# by name at call time so module-level handlers stay patchable.
+_TENANT_ITEM_ROUTES: dict[tuple[str, str], _RouteHandler] = {
+    ("GET", ""): lambda _e, c, d, t: handle_read(c, d, tenant_id=t),
+    ("PATCH", ""): lambda e, c, d, t: handle_update(e, c, d, tenant_id=t),
+    ("PUT", ""): lambda e, c, d, t: handle_update(e, c, d, tenant_id=t),
+    ("DELETE", ""): lambda _e, c, d, t: handle_delete(c, d, tenant_id=t),
+    ("POST", "/api-key/rotate"): lambda _e, c, d, t: handle_rotate_api_key(c, d, tenant_id=t),
+    ("POST", "/users/invite"): lambda e, c, d, t: handle_invite_user(e, c, d, tenant_id=t),
+    ("GET", "/audit-export"): lambda e, c, _d, t: handle_audit_export(e, c, tenant_id=t),
+    ("GET", "/users/invites"): lambda _e, c, _d, t: handle_list_invites(c, tenant_id=t),
+}
+
+
 def dispatch_routes(
     path: str,
     method: str,
@@ -699,27 +815,17 @@ def dispatch_routes(
     deps: models.TenantApiDependencies,
     tenant_id: str | None,
 ) -> dict[str, Any] | None:
-    if path == "/v1/tenants" and method == "POST":
-        return handle_create(event, caller, deps)
-    if path == "/v1/tenants" and method == "GET":
-        return handle_list_tenants(event, caller, deps)
+    if path == "/v1/tenants":
+        if method == "POST":
+            return handle_create(event, caller, deps)
+        if method == "GET":
+            return handle_list_tenants(event, caller, deps)
     if tenant_id:
-        if path == f"/v1/tenants/{tenant_id}" and method == "GET":
-            return handle_read(caller, deps, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}" and method == "PATCH":
-            return handle_update(event, caller, deps, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}" and method == "PUT":
-            return handle_update(event, caller, deps, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}" and method == "DELETE":
-            return handle_delete(caller, deps, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}/api-key/rotate" and method == "POST":
-            return handle_rotate_api_key(caller, deps, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}/users/invite" and method == "POST":
-            return handle_invite_user(event, caller, deps, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}/audit-export" and method == "GET":
-            return handle_audit_export(event, caller, tenant_id=tenant_id)
-        if path == f"/v1/tenants/{tenant_id}/users/invites" and method == "GET":
-            return handle_list_invites(caller, tenant_id=tenant_id)
+        tenant_prefix = f"/v1/tenants/{tenant_id}"
+        if path.startswith(tenant_prefix):
+            route = _TENANT_ITEM_ROUTES.get((method, path[len(tenant_prefix) :]))
+            if route is not None:
+                return route(event, caller, deps, tenant_id)
 
         # Dispatch sub-resources (webhooks, etc.)
         if path.startswith(f"/v1/tenants/{tenant_id}/webhooks"):
@@ -44,8 +44,7 @@ def handle_create(
 ) -> dict[str, Any]:
     auth.require_admin(caller)
     body = http_utils.require_json_body(event)
-    required = ["tenantId", "appId", "displayName", "tier", "ownerEmail", "ownerTeam", "accountId"]
-    missing = [field for field in required if utils.str_or_none(body.get(field)) is None]
+    missing = validation.missing_fields(body, constants.TENANT_CREATE_REQUIRED_FIELDS)
     if missing:
         raise ValueError(f"Missing required field(s): {', '.join(missing)}")
 
@@ -62,16 +61,17 @@ def handle_create(
         deps, tenant_id=tenant_id, app_id=app_id
     )
 
+    now_iso = utils.iso(now)
     attributes: dict[str, Any] = {
         "tenantId": tenant_id,
         "appId": app_id,
         "displayName": str(body["displayName"]).strip(),
         "tier": tier,
         "status": TenantStatus.ACTIVE.value,
-        "createdAt": utils.iso(now),
-        "updatedAt": utils.iso(now),
+        "createdAt": now_iso,
+        "updatedAt": now_iso,
         "provisioningStatus": "pending",
-        "provisioningUpdatedAt": utils.iso(now),
+        "provisioningUpdatedAt": now_iso,
         "ownerEmail": str(body["ownerEmail"]).strip(),
         "ownerTeam": str(body["ownerTeam"]).strip(),
         "accountId": str(body["accountId"]).strip(),
@@ -168,13 +168,14 @@ def handle_delete(
         return http_utils.error(404, "NOT_FOUND", f"Tenant '{tenant_id}' not found")
 
     now = utils.now_utc()
+    now_iso = utils.iso(now)
     updates = {
         "status": "deleted",
-        "deletedAt": utils.iso(now),
+        "deletedAt": now_iso,
         "purgeAtEpochSeconds": int(
             (now + timedelta(days=constants.DELETE_RETENTION_DAYS)).timestamp()
         ),
-        "updatedAt": utils.iso(now),
+        "updatedAt": now_iso,
     }
     expression, names, values = db_utils.build_update_expression(updates)
     db = db_factory.db_for_tenant(tenant_id=tenant_id, caller=caller, app_id=None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -30,6 +31,20 @@ def canonical_tenant_id(value: Any, *, allow_reserved: bool = False) -> str:
     return normalized
 
 
+def missing_fields(body: dict[str, Any], fields: Iterable[str]) -> list[str]:
+    """Return the fields that are absent or blank in body, in the order given."""
+    missing: list[str] = []
+    for field in fields:
+        value = body.get(field)
+        if isinstance(value, str):
+            # Inline of str_or_none for the usual case of a JSON string value.
+            if not value.strip():
+                missing.append(field)
+        elif str_or_none(value) is None:
+            missing.append(field)
+    return missing
+
+
 def require_aws_account_id(value: Any, *, field: str) -> str:
     account_id = str_or_none(value)
     if account_id is None:
@@ -21,17 +21,12 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
     _ = context
     try:
         deps = shared._dependencies()
-        caller = http_utils.caller_identity(event)
+        request = http_utils.parse_request(event)
+        caller = http_utils.caller_identity(event, authorizer=request.authorizer)
         logger.append_keys(appid=caller.app_id or "unknown", tenantid=caller.tenant_id or "unknown")
 
-        method = str(
-            event.get("httpMethod")
-            or event.get("requestContext", {}).get("http", {}).get("method")
-            or "GET"
-        ).upper()
-        path = str(
-            event.get("path") or event.get("requestContext", {}).get("http", {}).get("path") or ""
-        ).rstrip("/")
+        method = request.method
+        path = request.path
 
         try:
             from src.tenant_api import webhook_registry
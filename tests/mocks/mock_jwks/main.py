@@ -1,26 +1,32 @@
 """Mock JWKS endpoint — FastAPI on :8766.
 
 Endpoints:
-    GET  /.well-known/jwks.json  Serve the test RSA public key as a JWK Set.
-    POST /token                  Issue a signed RS256 JWT for a given tenant.
+    GET  /.well-known/jwks.json  Serve the test public key as a JWK Set.
+    POST /token                  Issue a signed JWT for a given tenant.
     GET  /health                 Service health check.
 
-The RSA key pair is generated once on startup and is ephemeral (not persisted).
+The signing algorithm is selected with MOCK_JWKS_ALG: RS256 (default, matches the
+authoriser) or ES256 (P-256 ECDSA, much cheaper to sign with).
+
+The key pair is generated once on startup and is ephemeral (not persisted).
 All JWTs issued by this service are valid only while the container is running.
 """
 
 import base64
+import hashlib
 import logging
+import os
 import time
 import uuid
 
 import jwt
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-from fastapi import FastAPI
+import orjson
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from fastapi import FastAPI, Header, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-app = FastAPI(title="mock-jwks")
+app = FastAPI(title="mock-jwks", default_response_class=ORJSONResponse)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,8 +34,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mock-jwks")
 
-# Ephemeral RSA-2048 key pair — generated once per container lifetime
-_PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+_ALGORITHM = os.environ.get("MOCK_JWKS_ALG", "RS256").upper()
+if _ALGORITHM not in {"RS256", "ES256"}:
+    raise ValueError(f"Unsupported MOCK_JWKS_ALG: {_ALGORITHM}")
+
+# Ephemeral key pair (RSA-2048 or P-256) — generated once per container lifetime
+_PRIVATE_KEY: rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey
+if _ALGORITHM == "ES256":
+    _PRIVATE_KEY = ec.generate_private_key(ec.SECP256R1())
+else:
+    _PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
 _PUBLIC_KEY = _PRIVATE_KEY.public_key()
 _KID = str(uuid.uuid4())
 
@@ -38,9 +52,13 @@ ISSUER = "http://localhost:8766"
 AUDIENCE = "api://platform-local"
 
 
-def _int_to_base64url(n: int) -> str:
-    """Encode a big integer as a base64url string (for use in JWK 'n' and 'e')."""
-    byte_length = (n.bit_length() + 7) // 8
+def _int_to_base64url(n: int, byte_length: int | None = None) -> str:
+    """Encode a big integer as a base64url string (for use in JWK 'n', 'e', 'x' and 'y').
+
+    EC coordinates must be encoded at the full curve size, so callers pass ``byte_length``.
+    """
+    if byte_length is None:
+        byte_length = (n.bit_length() + 7) // 8
     return base64.urlsafe_b64encode(n.to_bytes(byte_length, "big")).rstrip(b"=").decode()
 
 
@@ -49,22 +67,41 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+def _build_jwks() -> dict[str, list[dict[str, str]]]:
+    if isinstance(_PUBLIC_KEY, ec.EllipticCurvePublicKey):
+        ec_numbers = _PUBLIC_KEY.public_numbers()
+        coordinate_length = (_PUBLIC_KEY.curve.key_size + 7) // 8
+        key = {
+            "kty": "EC",
+            "crv": "P-256",
+            "x": _int_to_base64url(ec_numbers.x, coordinate_length),
+            "y": _int_to_base64url(ec_numbers.y, coordinate_length),
+        }
+    else:
+        rsa_numbers = _PUBLIC_KEY.public_numbers()
+        key = {
+            "kty": "RSA",
+            "n": _int_to_base64url(rsa_numbers.n),
+            "e": _int_to_base64url(rsa_numbers.e),
+        }
+    return {"keys": [{**key, "use": "sig", "kid": _KID, "alg": _ALGORITHM}]}
+
+
+# The key pair never changes for the life of the process, so the JWK Set is encoded once.
+_JWKS_BYTES = orjson.dumps(_build_jwks())
+# Let JWKS clients cache the key set and revalidate with If-None-Match
+_JWKS_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": f'"{hashlib.sha256(_JWKS_BYTES).hexdigest()[:32]}"',
+}
+
+
 @app.get("/.well-known/jwks.json")
-def jwks() -> dict[str, list[dict[str, str]]]:
-    """Serve the RSA public key as a JWK Set (JWKS)."""
-    pub_numbers = _PUBLIC_KEY.public_numbers()
-    return {
-        "keys": [
-            {
-                "kty": "RSA",
-                "use": "sig",
-                "kid": _KID,
-                "alg": "RS256",
-                "n": _int_to_base64url(pub_numbers.n),
-                "e": _int_to_base64url(pub_numbers.e),
-            }
-        ]
-    }
+def jwks(if_none_match: str | None = Header(default=None)) -> Response:
+    """Serve the public key as a JWK Set (JWKS)."""
+    if if_none_match == _JWKS_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_JWKS_HEADERS)
+    return Response(content=_JWKS_BYTES, media_type="application/json", headers=_JWKS_HEADERS)
 
 
 class TokenRequest(BaseModel):
@@ -76,10 +113,12 @@ class TokenRequest(BaseModel):
     ttl: int = 3600
 
 
+# Deliberately a sync endpoint: FastAPI runs it on the worker threadpool, so key signing
+# never blocks the event loop and concurrent /token requests sign in parallel.
 @app.post("/token")
 def issue_token(req: TokenRequest) -> dict[str, object]:
-    """Issue a signed RS256 JWT containing tenant context claims."""
-    now = int(time.time())
+    """Issue a signed JWT containing tenant context claims."""
+    now = time.time_ns() // 1_000_000_000
     payload: dict[str, object] = {
         "iss": ISSUER,
         "aud": AUDIENCE,
@@ -93,15 +132,11 @@ def issue_token(req: TokenRequest) -> dict[str, object]:
         "tier": req.tier,
         "roles": req.roles,
     }
-    private_key_pem = _PRIVATE_KEY.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.TraditionalOpenSSL,
-        encryption_algorithm=serialization.NoEncryption(),
-    )
     token: str = jwt.encode(
         payload,
-        private_key_pem,
-        algorithm="RS256",
+        # PyJWT accepts the key object directly, skipping a PEM load (and key check) per token
+        _PRIVATE_KEY,
+        algorithm=_ALGORITHM,
         headers={"kid": _KID},
     )
     logger.info(
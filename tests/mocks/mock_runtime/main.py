@@ -2,18 +2,18 @@
 
 Endpoints:
     GET  /ping         Health check, returns {"status": "Healthy"}
-    POST /invocations  Returns a canned SSE streaming response.
+    POST /invocations  Returns a canned SSE (text/event-stream) response.
                        Logs tenant context headers from the Bridge Lambda.
 """
 
-import json
 import logging
 import os
 
-from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI(title="mock-agentcore-runtime")
+app = FastAPI(title="mock-agentcore-runtime", default_response_class=ORJSONResponse)
 
 _LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -31,6 +31,8 @@ _TENANT_HEADERS = [
     "x-invocation-id",
     "x-agent-name",
 ]
+# ASGI delivers header names lower-cased as bytes, so the raw list is matched against this set
+_TENANT_HEADER_NAMES = frozenset(header.encode("latin-1") for header in _TENANT_HEADERS)
 
 # Canned streaming chunks returned for every /invocations request
 _CANNED_CHUNKS = [
@@ -39,6 +41,19 @@ _CANNED_CHUNKS = [
     " Tenant context has been logged.",
 ]
 
+# The SSE frames never change, so they are serialised to bytes once at import time
+_SSE_FRAMES: tuple[bytes, ...] = (
+    *(
+        b"data: " + orjson.dumps({"type": "text", "content": chunk}) + b"\n\n"
+        for chunk in _CANNED_CHUNKS
+    ),
+    b"data: [DONE]\n\n",
+)
+# The whole canned stream is ~300 bytes, so it is sent as one pre-joined body rather than
+# chunk by chunk; SSE clients parse it identically.
+_SSE_BODY = b"".join(_SSE_FRAMES)
+_SSE_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+
 
 @app.get("/ping")
 def ping() -> dict[str, str]:
@@ -47,29 +62,23 @@ def ping() -> dict[str, str]:
 
 
 @app.post("/invocations")
-async def invocations(request: Request) -> StreamingResponse:
-    """Return a canned SSE streaming response and log tenant context headers."""
-    tenant_context: dict[str, str] = {}
-    for header in _TENANT_HEADERS:
-        value = request.headers.get(header)
-        if value:
-            tenant_context[header] = value
-
-    body = await request.body()
-    logger.info(
-        "Invocation received | tenant_context=%s body_bytes=%d",
-        json.dumps(tenant_context),
-        len(body),
-    )
+async def invocations(request: Request) -> Response:
+    """Return a canned SSE response and log tenant context headers."""
+    # Only the size is logged, so count the body as it streams in instead of buffering it
+    body_bytes = 0
+    async for chunk in request.stream():
+        body_bytes += len(chunk)
 
-    async def _stream():
-        for chunk in _CANNED_CHUNKS:
-            event = json.dumps({"type": "text", "content": chunk})
-            yield f"data: {event}\n\n"
-        yield "data: [DONE]\n\n"
+    # The header scan and JSON encoding only feed this log line; skip both when it is filtered
+    if logger.isEnabledFor(logging.INFO):
+        tenant_context: dict[str, str] = {}
+        for name, value in request.headers.raw:
+            if value and name in _TENANT_HEADER_NAMES:
+                tenant_context.setdefault(name.decode("latin-1"), value.decode("latin-1"))
+        logger.info(
+            "Invocation received | tenant_context=%s body_bytes=%d",
+            orjson.dumps(tenant_context).decode(),
+            body_bytes,
+        )
 
-    return StreamingResponse(
-        _stream(),
-        media_type="text/event-stream",
-        headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
-    )
+    return Response(content=_SSE_BODY, media_type="text/event-stream", headers=_SSE_HEADERS)
@@ -32,6 +32,8 @@ __all__ = [
     "_issue",
 ]
 
+_DEFAULT_LABELS = ("type:task", "status:not-started")
+
 
 def _issue(
     *,
@@ -48,7 +50,7 @@ def _issue(
         state=state,
         created_at="2026-01-01T00:00:00Z",
         body=f"Seq: {seq}\nDepends on: none",
-        labels=labels or ["type:task", "status:not-started"],
+        labels=labels or list(_DEFAULT_LABELS),
         url=f"https://example.test/issues/{number}",
         task_id=task_id,
         seq=seq,
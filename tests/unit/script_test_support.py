@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+# Script modules loaded from scripts/, keyed by (module name, path); each is executed
+# once per session.
+_MODULE_CACHE: dict[tuple[str, Path], ModuleType] = {}
+
+
+def load_script_module(module_name: str, script_path: Path) -> ModuleType:
+    """Load a script outside any package as ``module_name``, reusing an earlier load."""
+    cache_key = (module_name, script_path)
+    cached = _MODULE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    _MODULE_CACHE[cache_key] = module
+    return module
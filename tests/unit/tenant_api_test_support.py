@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import re
 from datetime import UTC, datetime
 from typing import Any
 
@@ -9,6 +10,9 @@ from data_access.models import PaginatedItems
 from src.tenant_api import db_utils as tenant_api_db_utils
 from src.tenant_api import handler as tenant_api_handler
 
+# One `#name = :value` (or `name = :value`) assignment in a SET update expression.
+_SET_ASSIGNMENT_RE = re.compile(r"(#?\w+)\s*=\s*(:\w+)")
+
 
 class FakeScopedDb:
     def __init__(self) -> None:
@@ -56,6 +60,7 @@ class FakeScopedDb:
         *,
         expression_attribute_names: dict[str, str] | None = None,
         condition_expression: str | None = None,
+        return_values: str = "ALL_NEW",
     ) -> dict[str, Any]:
         pk = str(key["PK"])
         sk = str(key["SK"])
@@ -80,11 +85,12 @@ class FakeScopedDb:
         names = expression_attribute_names or {}
         item = dict(existing or {"PK": pk, "SK": sk})
         assert update_expression.startswith("SET ")
-        for part in update_expression.removeprefix("SET ").split(", "):
-            name_ref, value_ref = [token.strip() for token in part.split("=", 1)]
+        for name_ref, value_ref in _SET_ASSIGNMENT_RE.findall(update_expression):
             attr_name = names.get(name_ref, name_ref.lstrip("#"))
             item[attr_name] = expression_attribute_values[value_ref]
         self.items[storage_key] = item
+        if return_values == "ALL_OLD":
+            return {"Attributes": dict(existing)} if existing is not None else {}
         return {"Attributes": dict(item)}
 
     def scan_all(self, _table_name: str, **kwargs: Any) -> list[dict[str, Any]]:
@@ -100,13 +106,15 @@ class FakeScopedDb:
         expression_attribute_names: dict[str, str] | None = None,
         expression_attribute_values: dict[str, Any] | None = None,
     ) -> PaginatedItems:
-        results = [dict(item) for item in self.items.values()]
         status_filter = (expression_attribute_values or {}).get(":s")
         tier_filter = (expression_attribute_values or {}).get(":t")
-        if status_filter:
-            results = [r for r in results if r.get("status") == status_filter]
-        if tier_filter:
-            results = [r for r in results if r.get("tier") == tier_filter]
+        # Filter before copying so only the returned items are duplicated.
+        results = [
+            dict(item)
+            for item in self.items.values()
+            if (not status_filter or item.get("status") == status_filter)
+            and (not tier_filter or item.get("tier") == tier_filter)
+        ]
 
         last_key = None
         if limit and len(results) > limit:
@@ -151,6 +159,7 @@ class FakeSecretsManager:
         self.calls: list[dict[str, Any]] = []
         self.rotate_calls: list[dict[str, Any]] = []
         self.policy_calls: list[dict[str, Any]] = []
+        self.delete_calls: list[dict[str, Any]] = []
 
     def create_secret(self, **kwargs: Any) -> dict[str, Any]:
         self.calls.append(kwargs)
@@ -160,6 +169,10 @@ class FakeSecretsManager:
         self.rotate_calls.append(kwargs)
         return {"ARN": str(kwargs.get("SecretId", "")), "VersionId": "ver-rotated-001"}
 
+    def delete_secret(self, **kwargs: Any) -> dict[str, Any]:
+        self.delete_calls.append(kwargs)
+        return {"ARN": str(kwargs.get("SecretId", ""))}
+
     def put_resource_policy(self, **kwargs: Any) -> dict[str, Any]:
         self.policy_calls.append(kwargs)
         return {
@@ -189,11 +202,15 @@ class FakeUsageClient:
 class FakeMemoryProvisioner:
     def __init__(self) -> None:
         self.calls: list[dict[str, Any]] = []
+        self.deprovision_calls: list[dict[str, Any]] = []
 
     def provision(self, *, tenant_id: str, app_id: str) -> dict[str, Any]:
         self.calls.append({"tenant_id": tenant_id, "app_id": app_id})
         return {"memoryStoreArn": f"arn:aws:memory:eu-west-2::store/{tenant_id}"}
 
+    def deprovision(self, *, tenant_id: str, app_id: str) -> None:
+        self.deprovision_calls.append({"tenant_id": tenant_id, "app_id": app_id})
+
 
 class FakePlatformQuotaClient:
     def __init__(self) -> None:
@@ -331,25 +348,50 @@ def build_tenant_api_dependencies() -> tenant_api_handler.TenantApiDependencies:
     )
 
 
-def build_handler_state(monkeypatch: Any, fixed_now: datetime) -> dict[str, Any]:
-    db = FakeScopedDb()
-    deps = build_tenant_api_dependencies()
-    apply_common_tenant_api_env(monkeypatch)
-    monkeypatch.setattr(tenant_api_handler, "_dependencies", lambda: deps)
-    monkeypatch.setattr(tenant_api_handler.db_factory, "db_for_tenant", lambda **_kwargs: db)
-    monkeypatch.setattr(
-        tenant_api_handler.db_factory, "control_plane_db", lambda *_args, **_kwargs: db
-    )
-    monkeypatch.setattr(tenant_api_db_utils, "db_for_tenant", lambda **_kwargs: db)
-    monkeypatch.setattr(tenant_api_db_utils, "control_plane_db", lambda *_args, **_kwargs: db)
+def build_handler_state(
+    monkeypatch: Any,
+    fixed_now: datetime,
+    *,
+    deps: tenant_api_handler.TenantApiDependencies | None = None,
+    apply_env: bool = True,
+) -> dict[str, Any]:
+    """Patch the handler onto fakes looked up through the returned state dict.
+
+    The patches read ``state["db"]`` and ``state["deps"]`` at call time, so a
+    longer-lived state can be handed fresh fakes with ``reset_handler_state``.
+    """
+    state: dict[str, Any] = {
+        "db": FakeScopedDb(),
+        "deps": deps if deps is not None else build_tenant_api_dependencies(),
+    }
+    if apply_env:
+        apply_common_tenant_api_env(monkeypatch)
+
+    def _db(*_args: Any, **_kwargs: Any) -> FakeScopedDb:
+        return state["db"]
+
+    monkeypatch.setattr(tenant_api_handler, "_dependencies", lambda: state["deps"])
+    monkeypatch.setattr(tenant_api_handler.db_factory, "db_for_tenant", _db)
+    monkeypatch.setattr(tenant_api_handler.db_factory, "control_plane_db", _db)
+    monkeypatch.setattr(tenant_api_db_utils, "db_for_tenant", _db)
+    monkeypatch.setattr(tenant_api_db_utils, "control_plane_db", _db)
     monkeypatch.setattr(tenant_api_handler.utils, "_OVERRIDE_NOW", fixed_now)
-    return {"db": db, "deps": deps}
+    return state
+
 
+def reset_handler_state(state: dict[str, Any]) -> dict[str, Any]:
+    state["db"] = FakeScopedDb()
+    state["deps"] = build_tenant_api_dependencies()
+    return state
 
-def build_module_state(monkeypatch: Any, fixed_now: datetime) -> dict[str, Any]:
+
+def build_module_state(
+    monkeypatch: Any, fixed_now: datetime, *, apply_env: bool = True
+) -> dict[str, Any]:
     db = FakeScopedDb()
     deps = build_tenant_api_dependencies()
-    apply_common_tenant_api_env(monkeypatch, include_agents_table=True)
+    if apply_env:
+        apply_common_tenant_api_env(monkeypatch, include_agents_table=True)
     monkeypatch.setattr(tenant_api_handler, "_db_for_tenant", lambda **_kwargs: db)
     monkeypatch.setattr(tenant_api_handler, "_now_utc", lambda: fixed_now)
     return {"db": db, "deps": deps}
@@ -359,5 +401,9 @@ def response_body(response: dict[str, Any]) -> dict[str, Any]:
     return json.loads(response["body"])
 
 
+# The context only carries class-level constants, so every invocation can share one instance.
+_LAMBDA_CONTEXT = FakeLambdaContext()
+
+
 def invoke_handler(event: dict[str, Any]) -> dict[str, Any]:
-    return tenant_api_handler.lambda_handler(event, FakeLambdaContext())
+    return tenant_api_handler.lambda_handler(event, _LAMBDA_CONTEXT)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+from collections.abc import Generator
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,10 @@ from moto import mock_aws
 
 
 def _load_bootstrap_module() -> object:
+    # Re-importing this test module (e.g. under importlib mode) must not re-execute the script.
+    cached = sys.modules.get("bootstrap_script")
+    if cached is not None:
+        return cached
     repo_root = Path(__file__).resolve().parents[2]
     spec = importlib.util.spec_from_file_location(
         "bootstrap_script", repo_root / "scripts" / "bootstrap.py"
@@ -28,6 +33,21 @@ bootstrap: Any = _load_bootstrap_module()
 _REGION = "eu-west-2"
 
 
+@pytest.fixture(scope="module")
+def _moto_backend() -> Generator[Any, None, None]:
+    mock = mock_aws()
+    mock.start()
+    yield mock
+    mock.stop()
+
+
+@pytest.fixture
+def moto_aws(_moto_backend: Any) -> Generator[None, None, None]:
+    # One moto patcher serves the whole module; only backend state is reset between tests.
+    yield
+    _moto_backend.reset()
+
+
 def _ctx() -> object:
     return bootstrap.BootstrapContext(
         env="dev",
@@ -152,8 +172,7 @@ def test_validate_first_deploy_checks_home_region_bootstrap_stacks_only(
     ]
 
 
-@mock_aws
-def test_upsert_secret_create_then_update() -> None:
+def test_upsert_secret_create_then_update(moto_aws: None) -> None:
     client = boto3.client("secretsmanager", region_name=_REGION)
     secret_name = "platform/dev/entra/client-id"  # pragma: allowlist secret
 
@@ -216,8 +235,7 @@ def test_step_seed_secrets_uses_home_region_for_secret_writes(
     assert calls == ["eu-west-2"]
 
 
-@mock_aws
-def test_report_roundtrip_s3() -> None:
+def test_report_roundtrip_s3(moto_aws: None) -> None:
     ctx = _ctx()
     s3_client = boto3.client("s3", region_name=_REGION)
 
@@ -233,8 +251,7 @@ def test_report_roundtrip_s3() -> None:
     assert loaded["steps"][0]["status"] == "passed"
 
 
-@mock_aws
-def test_execute_step_failure_is_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_execute_step_failure_is_recorded(moto_aws: None, monkeypatch: pytest.MonkeyPatch) -> None:
     ctx = _ctx()
     s3_client = boto3.client("s3", region_name=_REGION)
 
@@ -1,26 +1,25 @@
 from __future__ import annotations
 
 import json
-import os
-import sys
-from pathlib import Path
+import types
 from unittest.mock import MagicMock, patch
 from urllib.parse import parse_qs, urlparse
 
 import boto3
 import pytest
 from boto3.dynamodb.conditions import Key
-from moto import mock_aws
-
-# Add project root and data-access-lib to path
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "data-access-lib" / "src"))
-
 from data_access.models import AgentRecord, InvocationMode, TenantContext, TenantTier
+from moto import mock_aws
 
 from src.bridge import handler as bridge_handler
 from src.bridge.handler import handler
 
+_BODY = json.dumps({"input": "Hello"})
+# Shared read-only authorizer claims; the handler expects a real dict, so tests copy it.
+_AUTHZ = types.MappingProxyType(
+    {"tenantid": "t-001", "appid": "app-001", "tier": "basic", "sub": "user-1"}
+)
+
 
 @pytest.fixture(autouse=True)
 def mock_capabilities():
@@ -43,25 +42,93 @@ class FakeLambdaContext:
     aws_request_id = "req-123"
 
 
-@pytest.fixture
+class _FakeResp:
+    """Minimal stand-in for a ``requests`` response from the mock runtime."""
+
+    status_code = 200
+    ok = True
+    text = None
+
+    def __init__(self, lines: list[bytes]) -> None:
+        self._lines = lines
+        self.headers: dict[str, str] = {}
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def __enter__(self) -> _FakeResp:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+@pytest.fixture(scope="module")
 def aws_credentials():
-    """Mocked AWS Credentials for moto."""
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"  # pragma: allowlist secret
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"  # pragma: allowlist secret
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "eu-west-2"
-    os.environ["AWS_REGION"] = "eu-west-2"
+    """Mocked AWS Credentials for moto, restored when the module's tests finish."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_ACCESS_KEY_ID", "testing")  # pragma: allowlist secret
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "testing")  # pragma: allowlist secret
+        mp.setenv("AWS_SECURITY_TOKEN", "testing")
+        mp.setenv("AWS_SESSION_TOKEN", "testing")
+        mp.setenv("AWS_DEFAULT_REGION", "eu-west-2")
+        mp.setenv("AWS_REGION", "eu-west-2")
+        yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_aws_services(aws_credentials):
     with mock_aws():
         yield
 
 
-@pytest.fixture
-def setup_data(mock_aws_services):
+_TABLE_NAMES = (
+    "platform-agents",
+    "platform-invocations",
+    "platform-jobs",
+    "platform-sessions",
+    "platform-tenants",
+)
+
+
+_SEED_ITEMS = {
+    "platform-agents": [
+        {
+            "PK": "AGENT#echo-agent",
+            "SK": "VERSION#1.0.0",
+            "agent_name": "echo-agent",
+            "version": "1.0.0",
+            "owner_team": "platform-test",
+            "tier_minimum": "basic",
+            "layer_hash": "0000",
+            "layer_s3_key": "k",
+            "script_s3_key": "s",
+            "deployed_at": "2026-01-01T00:00:00Z",
+            "invocation_mode": "sync",
+            "streaming_enabled": True,
+            "ag_ui_enabled": False,
+            "ag_ui_transport": "sse",
+        }
+    ],
+    "platform-tenants": [
+        {
+            "PK": "TENANT#t-001",
+            "SK": "METADATA",
+            "tenant_id": "t-001",
+            "app_id": "app-001",
+            "status": "active",
+            "account_id": "123456789012",
+        }
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_tables(mock_aws_services):
+    """Create the tables and seed data once per module; returns the seeded items per table."""
     ddb = boto3.resource("dynamodb", region_name="eu-west-2")
     ssm = boto3.client("ssm", region_name="eu-west-2")
 
@@ -127,37 +194,11 @@ def setup_data(mock_aws_services):
         BillingMode="PAY_PER_REQUEST",
     )
 
-    # Seed agent
-    agents_table = ddb.Table("platform-agents")
-    agents_table.put_item(
-        Item={
-            "PK": "AGENT#echo-agent",
-            "SK": "VERSION#1.0.0",
-            "agent_name": "echo-agent",
-            "version": "1.0.0",
-            "owner_team": "platform-test",
-            "tier_minimum": "basic",
-            "layer_hash": "0000",
-            "layer_s3_key": "k",
-            "script_s3_key": "s",
-            "deployed_at": "2026-01-01T00:00:00Z",
-            "invocation_mode": "sync",
-            "streaming_enabled": True,
-            "ag_ui_enabled": False,
-            "ag_ui_transport": "sse",
-        }
-    )
-
-    # Seed tenant
-    tenants_table = ddb.Table("platform-tenants")
-    tenants_table.put_item(
-        Item={
-            "PK": "TENANT#t-001",
-            "SK": "METADATA",
-            "tenant_id": "t-001",
-            "app_id": "app-001",
-            "status": "active",
-            "account_id": "123456789012",
+    # Seed the agent and tenant rows in a single BatchWriteItem call
+    ddb.batch_write_item(
+        RequestItems={
+            name: [{"PutRequest": {"Item": item}} for item in items]
+            for name, items in _SEED_ITEMS.items()
         }
     )
 
@@ -167,31 +208,47 @@ def setup_data(mock_aws_services):
         Name="/platform/config/mock-runtime-url", Value="http://localhost:8765", Type="String"
     )
 
+    return {name: _SEED_ITEMS.get(name, []) for name in _TABLE_NAMES}
+
+
+@pytest.fixture
+def setup_data(seeded_tables):
+    yield
+    # Tables are shared across the module: drop whatever the test wrote, restore the seed rows
+    # and remove any buckets it created.
+    ddb = boto3.resource("dynamodb", region_name="eu-west-2")
+    for name, seed_items in seeded_tables.items():
+        table = ddb.Table(name)
+        seed_keys = {(item["PK"], item["SK"]) for item in seed_items}
+        with table.batch_writer() as batch:
+            for item in table.scan(ProjectionExpression="PK, SK")["Items"]:
+                if (item["PK"], item["SK"]) not in seed_keys:
+                    batch.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+            for item in seed_items:
+                batch.put_item(Item=item)
+    s3 = boto3.resource("s3", region_name="eu-west-2")
+    for bucket in s3.buckets.all():
+        bucket.objects.all().delete()
+        bucket.delete()
+
 
 def test_handler_sync_success(setup_data):
     event = {
         "path": "/v1/agents/echo-agent/invoke",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
-        "body": json.dumps({"input": "Hello"}),
+        "requestContext": {"authorizer": dict(_AUTHZ)},
+        "body": _BODY,
     }
 
     with patch("src.bridge.handler.get_http_session") as mock_get_http_session:
         mock_post = MagicMock()
         mock_get_http_session.return_value.post = mock_post
-        mock_response = MagicMock()
-        mock_response.iter_lines.return_value = [
-            b'data: {"type": "text", "content": "Echo: Hello"}',
-            b"data: [DONE]",
-        ]
-        mock_response.status_code = 200
+        mock_response = _FakeResp(
+            [
+                b'data: {"type": "text", "content": "Echo: Hello"}',
+                b"data: [DONE]",
+            ]
+        )
         # Mocking usage info in the response if it were to come from mock runtime
         # (Though currently bridge doesn't read it from mock runtime either)
         mock_post.return_value = mock_response
@@ -227,14 +284,7 @@ def test_list_agents_returns_openapi_shape_and_tier_filtered(setup_data):
         "httpMethod": "GET",
         "path": "/v1/agents",
         "pathParameters": {},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -270,14 +320,7 @@ def test_list_agents_handles_multiple_scan_pages(setup_data):
             "httpMethod": "GET",
             "path": "/v1/agents",
             "pathParameters": {},
-            "requestContext": {
-                "authorizer": {
-                    "tenantid": "t-001",
-                    "appid": "app-001",
-                    "tier": "basic",
-                    "sub": "user-1",
-                }
-            },
+            "requestContext": {"authorizer": dict(_AUTHZ)},
         }
 
         response = handler(event, FakeLambdaContext())
@@ -314,14 +357,7 @@ def test_get_agent_detail_returns_latest_version_and_versions(setup_data):
         "httpMethod": "GET",
         "path": "/v1/agents/echo-agent",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -367,14 +403,7 @@ def test_get_agent_detail_masks_ag_ui_when_tenant_capability_disabled(
         "httpMethod": "GET",
         "path": "/v1/agents/echo-agent",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -413,14 +442,7 @@ def test_agent_bootstrap_returns_connection_contract_and_persists_session(
         "httpMethod": "POST",
         "path": "/v1/agents/echo-agent/bootstrap",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
         "body": json.dumps({}),
     }
 
@@ -468,14 +490,7 @@ def test_list_agents_ignores_built_version_when_newer_semver_exists(setup_data):
         "httpMethod": "GET",
         "path": "/v1/agents",
         "pathParameters": {},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -508,14 +523,7 @@ def test_get_agent_detail_prefers_highest_promoted_semver(setup_data):
         "httpMethod": "GET",
         "path": "/v1/agents/echo-agent",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -526,14 +534,7 @@ def test_get_agent_detail_prefers_highest_promoted_semver(setup_data):
 def test_handler_rejects_legacy_invoke_route(setup_data):
     event = {
         "path": "/v1/invoke",
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
         "body": json.dumps({"agentName": "echo-agent", "input": "Hello"}),
     }
 
@@ -567,15 +568,8 @@ def test_handler_tier_insufficient(setup_data):
     event = {
         "path": "/v1/agents/premium-agent/invoke",
         "pathParameters": {"agentName": "premium-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
-        "body": json.dumps({"input": "Hello"}),
+        "requestContext": {"authorizer": dict(_AUTHZ)},
+        "body": _BODY,
     }
 
     response = handler(event, FakeLambdaContext())
@@ -616,7 +610,7 @@ def test_handler_tier_insufficient_ignores_spoofed_request_header(setup_data):
                 "sub": "machine-1",
             }
         },
-        "body": json.dumps({"input": "Hello"}),
+        "body": _BODY,
     }
 
     response = handler(event, FakeLambdaContext())
@@ -629,15 +623,8 @@ def test_handler_agent_not_found(setup_data):
     event = {
         "path": "/v1/agents/missing-agent/invoke",
         "pathParameters": {"agentName": "missing-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
-        "body": json.dumps({"input": "Hello"}),
+        "requestContext": {"authorizer": dict(_AUTHZ)},
+        "body": _BODY,
     }
 
     response = handler(event, FakeLambdaContext())
@@ -651,14 +638,7 @@ def test_get_agent_detail_not_found(setup_data):
         "httpMethod": "GET",
         "path": "/v1/agents/missing-agent",
         "pathParameters": {"agentName": "missing-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -691,15 +671,8 @@ def test_handler_async_accepted(setup_data):
     event = {
         "path": "/v1/agents/async-agent/invoke",
         "pathParameters": {"agentName": "async-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
-        "body": json.dumps({"input": "Hello"}),
+        "requestContext": {"authorizer": dict(_AUTHZ)},
+        "body": _BODY,
     }
 
     with patch("src.bridge.handler.get_http_session") as mock_get_http_session:
@@ -743,15 +716,8 @@ def test_handler_streaming(setup_data):
     event = {
         "path": "/v1/agents/stream-agent/invoke",
         "pathParameters": {"agentName": "stream-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
-        "body": json.dumps({"input": "Hello"}),
+        "requestContext": {"authorizer": dict(_AUTHZ)},
+        "body": _BODY,
     }
 
     mock_stream = MagicMock()
@@ -759,12 +725,13 @@ def test_handler_streaming(setup_data):
     with patch("src.bridge.handler.get_http_session") as mock_get_http_session:
         mock_post = MagicMock()
         mock_get_http_session.return_value.post = mock_post
-        mock_response = MagicMock()
-        mock_response.iter_lines.return_value = [
-            b'data: {"type": "text", "content": "Chunk 1"}',
-            b"data: [DONE]",
-        ]
-        mock_post.return_value.__enter__.return_value = mock_response
+        mock_response = _FakeResp(
+            [
+                b'data: {"type": "text", "content": "Chunk 1"}',
+                b"data: [DONE]",
+            ]
+        )
+        mock_post.return_value = mock_response
 
         response = handler(event, FakeLambdaContext(), response_stream=mock_stream)
 
@@ -808,26 +775,19 @@ def test_handler_session_id_propagation(setup_data):
     event = {
         "path": "/v1/agents/echo-agent/invoke",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
         "body": json.dumps({"input": "Hello", "sessionId": "provided-session-123"}),
     }
 
     with patch("src.bridge.handler.get_http_session") as mock_get_http_session:
         mock_post = MagicMock()
         mock_get_http_session.return_value.post = mock_post
-        mock_response = MagicMock()
-        mock_response.iter_lines.return_value = [
-            b'data: {"type": "text", "content": "Echo"}',
-            b"data: [DONE]",
-        ]
-        mock_response.status_code = 200
+        mock_response = _FakeResp(
+            [
+                b'data: {"type": "text", "content": "Echo"}',
+                b"data: [DONE]",
+            ]
+        )
         mock_post.return_value = mock_response
 
         response = handler(event, FakeLambdaContext())
@@ -849,27 +809,20 @@ def test_handler_session_id_from_runtime(setup_data):
     event = {
         "path": "/v1/agents/echo-agent/invoke",
         "pathParameters": {"agentName": "echo-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
-        "body": json.dumps({"input": "Hello"}),
+        "requestContext": {"authorizer": dict(_AUTHZ)},
+        "body": _BODY,
     }
 
     with patch("src.bridge.handler.get_http_session") as mock_get_http_session:
         mock_post = MagicMock()
         mock_get_http_session.return_value.post = mock_post
-        mock_response = MagicMock()
-        mock_response.iter_lines.return_value = [
-            b'data: {"type": "session", "sessionId": "runtime-session-456"}',
-            b'data: {"type": "text", "content": "Echo"}',
-            b"data: [DONE]",
-        ]
-        mock_response.status_code = 200
+        mock_response = _FakeResp(
+            [
+                b'data: {"type": "session", "sessionId": "runtime-session-456"}',
+                b'data: {"type": "text", "content": "Echo"}',
+                b"data: [DONE]",
+            ]
+        )
         mock_post.return_value = mock_response
 
         response = handler(event, FakeLambdaContext())
@@ -907,14 +860,7 @@ def test_get_job_status_returns_job_payload(setup_data):
         "httpMethod": "GET",
         "path": "/v1/jobs/job-123",
         "pathParameters": {"jobId": "job-123"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -945,14 +891,7 @@ def test_get_job_status_rejects_non_contract_route_with_job_id_path_param(setup_
         "httpMethod": "GET",
         "path": "/v1/platform/ops/jobs/job-123",
         "pathParameters": {"jobId": "job-123"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -980,14 +919,7 @@ def test_get_job_status_accepts_stage_prefixed_contract_route(setup_data):
         "httpMethod": "GET",
         "path": "/prod/v1/jobs/job-123",
         "pathParameters": {"jobId": "job-123"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -1027,14 +959,7 @@ def test_get_job_status_generates_presigned_result_url_with_expected_expiry(setu
         "httpMethod": "GET",
         "path": "/v1/jobs/job-456",
         "pathParameters": {"jobId": "job-456"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     with (
@@ -1064,7 +989,7 @@ def test_handler_emits_bridge_metrics(setup_data):
                 "tier": "basic",
             }
         },
-        "body": json.dumps({"input": "Hello"}),
+        "body": _BODY,
     }
 
     with (
@@ -1073,12 +998,12 @@ def test_handler_emits_bridge_metrics(setup_data):
     ):
         mock_post = MagicMock()
         mock_get_http_session.return_value.post = mock_post
-        mock_response = MagicMock()
-        mock_response.iter_lines.return_value = [
-            b'data: {"type": "text", "content": "Hi"}',
-            b"data: [DONE]",
-        ]
-        mock_response.status_code = 200
+        mock_response = _FakeResp(
+            [
+                b'data: {"type": "text", "content": "Hi"}',
+                b"data: [DONE]",
+            ]
+        )
         mock_post.return_value = mock_response
 
         mock_cw = MagicMock()
@@ -1192,14 +1117,7 @@ def test_runtime_failure_response_emits_bedrock_throttle_metric(
         "httpMethod": "GET",
         "path": "/v1/jobs/job-foreign",
         "pathParameters": {"jobId": "job-foreign"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
     }
 
     response = handler(event, FakeLambdaContext())
@@ -1262,14 +1180,7 @@ def test_handler_async_uses_registered_webhook_callback(setup_data):
     event = {
         "path": "/v1/agents/async-webhook-agent/invoke",
         "pathParameters": {"agentName": "async-webhook-agent"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
         "body": json.dumps({"input": "hello", "webhookId": "webhook-001"}),
     }
 
@@ -1311,14 +1222,7 @@ def test_handler_async_rejects_unknown_webhook_id(setup_data):
     event = {
         "path": "/v1/agents/async-agent-missing-webhook/invoke",
         "pathParameters": {"agentName": "async-agent-missing-webhook"},
-        "requestContext": {
-            "authorizer": {
-                "tenantid": "t-001",
-                "appid": "app-001",
-                "tier": "basic",
-                "sub": "user-1",
-            }
-        },
+        "requestContext": {"authorizer": dict(_AUTHZ)},
         "body": json.dumps({"input": "hello", "webhookId": "does-not-exist"}),
     }
 
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import importlib.util
 import io
-import sys
 import zipfile
 from pathlib import Path
 from typing import Any
@@ -13,17 +11,11 @@ import boto3
 import pytest
 from moto import mock_aws
 
+from tests.unit.script_test_support import SCRIPTS_DIR, load_script_module
+
 
 def _load_module() -> Any:
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location(
-        "build_layer_script", repo_root / "scripts" / "build_layer.py"
-    )
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)  # type: ignore[union-attr]
-    return module
+    return load_script_module("build_layer_script", SCRIPTS_DIR / "build_layer.py")
 
 
 bl: Any = _load_module()
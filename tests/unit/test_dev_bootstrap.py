@@ -14,33 +14,44 @@ Test requirement (TASK-015): run twice, verify no duplicate records.
 
 from __future__ import annotations
 
-import importlib.util
+import io
 import json
-import sys
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import boto3
+import pytest
+from botocore.config import Config
 from moto import mock_aws
 
+from tests.unit.script_test_support import SCRIPTS_DIR, load_script_module
+
 
 def _load_bootstrap_module() -> object:
-    """Load scripts/dev-bootstrap.py as a Python module via importlib."""
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location(
-        "dev_bootstrap", repo_root / "scripts" / "dev-bootstrap.py"
-    )
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)  # type: ignore[union-attr]
-    return module
+    """Load scripts/dev-bootstrap.py as a Python module via importlib (once per session)."""
+    return load_script_module("dev_bootstrap", SCRIPTS_DIR / "dev-bootstrap.py")
 
 
 bootstrap = _load_bootstrap_module()
 
 _REGION = "eu-west-2"
-_EXPECTED_TABLE_NAMES = {d["TableName"] for d in bootstrap.TABLE_DEFINITIONS}  # type: ignore[attr-defined]
+_EXPECTED_TABLE_NAMES: frozenset[str] = bootstrap.TABLE_NAMES  # type: ignore[attr-defined]
+# Test-only: a moto error should fail fast, not sit in botocore's retry backoff. The
+# script's own clients (built in run_bootstrap when none are injected) keep default retries.
+_TEST_BOTO_CONFIG = Config(
+    retries={"max_attempts": 1, "mode": "standard"}, connect_timeout=1, read_timeout=1
+)
+_SEEDED_FIXTURES: dict[str, list[dict]] = {
+    "platform-tenants": bootstrap.TENANT_FIXTURES,  # type: ignore[attr-defined]
+    "platform-agents": bootstrap.AGENT_FIXTURES,  # type: ignore[attr-defined]
+    "platform-tools": bootstrap.TOOL_FIXTURES,  # type: ignore[attr-defined]
+}
 
 
 # ---------------------------------------------------------------------------
@@ -48,17 +59,140 @@ _EXPECTED_TABLE_NAMES = {d["TableName"] for d in bootstrap.TABLE_DEFINITIONS}  #
 # ---------------------------------------------------------------------------
 
 
-def _make_aws_clients() -> tuple[object, object, object]:
-    """Return moto-backed DynamoDB client, DynamoDB resource, and SSM client."""
-    ddb_client = boto3.client("dynamodb", region_name=_REGION)
-    ddb_resource = boto3.resource("dynamodb", region_name=_REGION)
-    ssm_client = boto3.client("ssm", region_name=_REGION)
-    return ddb_client, ddb_resource, ssm_client
+def _get_items(ddb_resource: object, table_name: str, fixtures: list[dict]) -> list[dict]:
+    """Fetch seeded fixture rows by their known PK/SK with one consistent BatchGetItem.
+
+    Rows come back in fixture order; anything missing is simply absent from the result.
+    """
+    keys = [{"PK": item["PK"], "SK": item["SK"]} for item in fixtures]
+    request = {table_name: {"Keys": keys, "ConsistentRead": True}}
+    found: dict[tuple[str, str], dict] = {}
+    while request:
+        resp = ddb_resource.batch_get_item(RequestItems=request)  # type: ignore[union-attr]
+        for item in resp["Responses"].get(table_name, []):
+            found[(item["PK"], item["SK"])] = item
+        request = resp.get("UnprocessedKeys") or {}
+    return [found[key["PK"], key["SK"]] for key in keys if (key["PK"], key["SK"]) in found]
+
+
+def _count_items(ddb_resource: object, table_name: str) -> int:
+    """Count a table's items without materialising them (Select=COUNT)."""
+    return ddb_resource.Table(table_name).scan(Select="COUNT")["Count"]  # type: ignore[union-attr]
+
+
+def _parse_env_str(text: str) -> dict[str, str]:
+    """Parse KEY=VALUE env text into a dict in one pass, skipping comments and blanks."""
+    return dict(
+        line.split("=", 1)
+        for line in text.splitlines()
+        if line and not line.startswith("#") and "=" in line
+    )
+
+
+@pytest.fixture(scope="module")
+def _moto_backend() -> Generator[Any, None, None]:
+    mock = mock_aws()
+    mock.start()
+    yield mock
+    mock.stop()
+
+
+@pytest.fixture
+def moto_aws(_moto_backend: Any) -> Generator[None, None, None]:
+    # One moto patcher serves the whole module; only backend state is reset between tests.
+    yield
+    _moto_backend.reset()
+
+
+@pytest.fixture(scope="module")
+def aws_clients(_moto_backend: Any) -> tuple[object, object, object]:
+    """Return moto-backed DynamoDB client, DynamoDB resource, and SSM client.
+
+    Built once per module: moto intercepts requests from any client while the module mock
+    is active, and resets only clear backend state, so the clients stay valid.
+    """
+    return (
+        boto3.client("dynamodb", region_name=_REGION, config=_TEST_BOTO_CONFIG),
+        boto3.resource("dynamodb", region_name=_REGION, config=_TEST_BOTO_CONFIG),
+        boto3.client("ssm", region_name=_REGION, config=_TEST_BOTO_CONFIG),
+    )
+
+
+@pytest.fixture
+def ddb_client(aws_clients: tuple[object, object, object]) -> object:
+    return aws_clients[0]
+
+
+@pytest.fixture
+def ddb_resource(aws_clients: tuple[object, object, object]) -> object:
+    return aws_clients[1]
+
+
+@pytest.fixture
+def ssm_client(aws_clients: tuple[object, object, object]) -> object:
+    return aws_clients[2]
+
 
+@pytest.fixture
+def empty_tables(ddb_client: object, ddb_resource: object) -> Generator[None, None, None]:
+    """Ensure every bootstrap table is present and empty for the test.
 
-def _scan_table(ddb_resource: object, table_name: str) -> list[dict]:
-    """Scan all items from a DynamoDB table and return them."""
-    return ddb_resource.Table(table_name).scan()["Items"]  # type: ignore[union-attr]
+    ensure_tables only creates missing tables (the first test, or after a moto reset) and
+    tables are truncated on teardown instead of being dropped, so CreateTable runs once per
+    module.
+    """
+    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
+    yield
+    for defn in bootstrap.TABLE_DEFINITIONS:  # type: ignore[attr-defined]
+        key_names = [key["AttributeName"] for key in defn["KeySchema"]]
+        table = ddb_resource.Table(defn["TableName"])  # type: ignore[union-attr]
+        keys = table.scan(ProjectionExpression=", ".join(key_names))["Items"]
+        with table.batch_writer() as batch:
+            for key in keys:
+                batch.delete_item(Key=key)
+
+
+@pytest.fixture(scope="module")
+def bootstrapped(_moto_backend: Any, aws_clients: tuple[object, object, object]) -> dict[str, Any]:
+    """Run the full bootstrap under moto and snapshot what the first run wrote.
+
+    The bootstrap is then run a second time against the same state and the per-table item
+    counts are recorded under ``rerun_counts`` for the TASK-015 run-twice check. Read-only
+    assertions share this snapshot; backend state is reset afterwards so per-step idempotency
+    tests still start from empty tables.
+    """
+    env_test = io.StringIO()
+    with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("Connection refused")):
+        ddb_client, ddb_resource, ssm_client = aws_clients
+        run_kwargs = {
+            "ddb_client": ddb_client,
+            "ddb_resource": ddb_resource,
+            "ssm_client": ssm_client,
+        }
+        bootstrap.run_bootstrap(**run_kwargs, env_test_writer=env_test)  # type: ignore[attr-defined]
+        paginator = ssm_client.get_paginator("get_parameters_by_path")  # type: ignore[union-attr]
+        snapshot = {
+            "table_names": set(ddb_client.list_tables()["TableNames"]),  # type: ignore[union-attr]
+            "counts": {name: _count_items(ddb_resource, name) for name in _EXPECTED_TABLE_NAMES},
+            "items": {
+                name: _get_items(ddb_resource, name, fixtures)
+                for name, fixtures in _SEEDED_FIXTURES.items()
+            },
+            "ssm": {
+                param["Name"]: param["Value"]
+                for page in paginator.paginate(Path="/", Recursive=True)
+                for param in page["Parameters"]
+            },
+            "env_test": env_test.getvalue(),
+        }
+        bootstrap.run_bootstrap(  # type: ignore[attr-defined]
+            **run_kwargs, env_test_writer=io.StringIO()
+        )
+        snapshot["rerun_counts"] = {
+            name: _count_items(ddb_resource, name) for name in _EXPECTED_TABLE_NAMES
+        }
+    _moto_backend.reset()
+    return snapshot
 
 
 # ---------------------------------------------------------------------------
@@ -66,79 +200,82 @@ def _scan_table(ddb_resource: object, table_name: str) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
-@mock_aws
-def test_ensure_tables_creates_all_tables() -> None:
-    ddb_client, _, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    tables = set(ddb_client.list_tables()["TableNames"])  # type: ignore[union-attr]
-    assert _EXPECTED_TABLE_NAMES <= tables
+def test_ensure_tables_creates_all_tables(bootstrapped: dict[str, Any]) -> None:
+    assert _EXPECTED_TABLE_NAMES <= bootstrapped["table_names"]
 
 
-@mock_aws
-def test_ensure_tables_is_idempotent() -> None:
+def test_ensure_tables_is_idempotent(moto_aws: None, ddb_client: object) -> None:
     """Calling ensure_tables twice must not raise and must not duplicate tables."""
-    ddb_client, _, _ = _make_aws_clients()
     bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
     bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
     tables = [t for t in ddb_client.list_tables()["TableNames"] if t.startswith("platform-")]  # type: ignore[union-attr]
     assert len(tables) == len(bootstrap.TABLE_DEFINITIONS)  # type: ignore[attr-defined]
 
 
+def test_ensure_tables_skips_create_table_for_existing_tables() -> None:
+    ddb_client = MagicMock()
+    ddb_client.get_paginator.return_value.paginate.return_value = [
+        {"TableNames": sorted(_EXPECTED_TABLE_NAMES)}
+    ]
+    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
+    ddb_client.create_table.assert_not_called()
+
+
+def test_ensure_tables_issues_create_table_calls_concurrently() -> None:
+    """Every CreateTable must be in flight at once; a serial loop would break the barrier."""
+    barrier = threading.Barrier(len(bootstrap.TABLE_DEFINITIONS), timeout=5)  # type: ignore[attr-defined]
+    ddb_client = MagicMock()
+    ddb_client.create_table.side_effect = lambda **_: barrier.wait()
+    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
+    assert ddb_client.create_table.call_count == len(bootstrap.TABLE_DEFINITIONS)  # type: ignore[attr-defined]
+
+
 # ---------------------------------------------------------------------------
 # Tenant seeding
 # ---------------------------------------------------------------------------
 
 
-@mock_aws
-def test_seed_tenants_creates_two_records() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    bootstrap.seed_tenants(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-tenants")
-    assert len(items) == 3
+def test_seed_tenants_creates_two_records(bootstrapped: dict[str, Any]) -> None:
+    assert bootstrapped["counts"]["platform-tenants"] == 3
 
 
-@mock_aws
-def test_seed_tenants_correct_tiers() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    bootstrap.seed_tenants(ddb_resource)  # type: ignore[attr-defined]
-    items = {item["tenant_id"]: item for item in _scan_table(ddb_resource, "platform-tenants")}
+def test_seed_tenants_correct_tiers(bootstrapped: dict[str, Any]) -> None:
+    items = {item["tenant_id"]: item for item in bootstrapped["items"]["platform-tenants"]}
     assert items["t-test-001"]["tier"] == "basic"
     assert items["t-test-002"]["tier"] == "premium"
     assert items["t-test-001"]["tenantId"] == "t-test-001"
     assert items["t-test-002"]["executionRoleArn"].endswith("t-test-002-execution-role")
 
 
-@mock_aws
-def test_seed_tenants_both_active() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    bootstrap.seed_tenants(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-tenants")
+def test_seed_tenants_both_active(bootstrapped: dict[str, Any]) -> None:
+    items = bootstrapped["items"]["platform-tenants"]
     assert all(item["status"] == "active" for item in items)
 
 
-@mock_aws
-def test_seed_tenants_writes_canonical_aliases() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    bootstrap.seed_tenants(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-tenants")
+def test_seed_tenants_writes_canonical_aliases(bootstrapped: dict[str, Any]) -> None:
+    items = bootstrapped["items"]["platform-tenants"]
     assert all("tenantId" in item for item in items)
     assert all("appId" in item for item in items)
     assert all("createdAt" in item for item in items)
 
 
-@mock_aws
-def test_seed_tenants_idempotent_no_duplicates() -> None:
+def test_seed_tenants_idempotent_no_duplicates(empty_tables: None, ddb_resource: object) -> None:
     """Running seed_tenants twice must not create duplicate records."""
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
     bootstrap.seed_tenants(ddb_resource)  # type: ignore[attr-defined]
     bootstrap.seed_tenants(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-tenants")
-    assert len(items) == 3
+    assert _count_items(ddb_resource, "platform-tenants") == 3
+
+
+def test_seed_items_collapses_duplicate_keys_in_one_batch(
+    empty_tables: None, ddb_resource: object
+) -> None:
+    """Duplicate PK/SK pairs in one seed call must not fail the BatchWriteItem."""
+    first, *_ = bootstrap.TENANT_FIXTURES  # type: ignore[attr-defined]
+    renamed = {**first, "display_name": "Renamed"}
+    bootstrap._seed_items(ddb_resource, "platform-tenants", [first, renamed])  # type: ignore[attr-defined]
+    items = _get_items(ddb_resource, "platform-tenants", [first])
+    assert [item["display_name"] for item in items] == ["Renamed"]
+    assert _count_items(ddb_resource, "platform-tenants") == 1
 
 
 # ---------------------------------------------------------------------------
@@ -146,25 +283,17 @@ def test_seed_tenants_idempotent_no_duplicates() -> None:
 # ---------------------------------------------------------------------------
 
 
-@mock_aws
-def test_seed_agents_creates_echo_agent() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    bootstrap.seed_agents(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-agents")
-    assert len(items) == 1
+def test_seed_agents_creates_echo_agent(bootstrapped: dict[str, Any]) -> None:
+    items = bootstrapped["items"]["platform-agents"]
+    assert bootstrapped["counts"]["platform-agents"] == 1
     assert items[0]["agent_name"] == "echo-agent"
     assert items[0]["version"] == "1.0.0"
 
 
-@mock_aws
-def test_seed_agents_idempotent_no_duplicates() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
+def test_seed_agents_idempotent_no_duplicates(empty_tables: None, ddb_resource: object) -> None:
     bootstrap.seed_agents(ddb_resource)  # type: ignore[attr-defined]
     bootstrap.seed_agents(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-agents")
-    assert len(items) == 1
+    assert _count_items(ddb_resource, "platform-agents") == 1
 
 
 # ---------------------------------------------------------------------------
@@ -172,24 +301,16 @@ def test_seed_agents_idempotent_no_duplicates() -> None:
 # ---------------------------------------------------------------------------
 
 
-@mock_aws
-def test_seed_tools_creates_echo_tool() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
-    bootstrap.seed_tools(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-tools")
-    assert len(items) == 1
+def test_seed_tools_creates_echo_tool(bootstrapped: dict[str, Any]) -> None:
+    items = bootstrapped["items"]["platform-tools"]
+    assert bootstrapped["counts"]["platform-tools"] == 1
     assert items[0]["tool_name"] == "echo"
 
 
-@mock_aws
-def test_seed_tools_idempotent_no_duplicates() -> None:
-    ddb_client, ddb_resource, _ = _make_aws_clients()
-    bootstrap.ensure_tables(ddb_client)  # type: ignore[attr-defined]
+def test_seed_tools_idempotent_no_duplicates(empty_tables: None, ddb_resource: object) -> None:
     bootstrap.seed_tools(ddb_resource)  # type: ignore[attr-defined]
     bootstrap.seed_tools(ddb_resource)  # type: ignore[attr-defined]
-    items = _scan_table(ddb_resource, "platform-tools")
-    assert len(items) == 1
+    assert _count_items(ddb_resource, "platform-tools") == 1
 
 
 # ---------------------------------------------------------------------------
@@ -197,60 +318,29 @@ def test_seed_tools_idempotent_no_duplicates() -> None:
 # ---------------------------------------------------------------------------
 
 
-@mock_aws
-def test_seed_ssm_runtime_region() -> None:
-    _, _, ssm_client = _make_aws_clients()
-    bootstrap.seed_ssm_parameters(  # type: ignore[attr-defined]
-        ssm_client,
-        mock_jwks_url="http://localhost:8766",
-        localstack_endpoint="http://localhost:4566",
-    )
-    resp = ssm_client.get_parameter(Name="/platform/config/runtime-region")  # type: ignore[union-attr]
-    assert resp["Parameter"]["Value"] == "eu-west-1"
-
-
-@mock_aws
-def test_seed_ssm_jwks_url() -> None:
-    _, _, ssm_client = _make_aws_clients()
-    bootstrap.seed_ssm_parameters(  # type: ignore[attr-defined]
-        ssm_client,
-        mock_jwks_url="http://localhost:8766",
-        localstack_endpoint="http://localhost:4566",
-    )
-    resp = ssm_client.get_parameter(Name="/platform/config/jwks-url")  # type: ignore[union-attr]
-    assert resp["Parameter"]["Value"] == "http://localhost:8766/.well-known/jwks.json"
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("/platform/config/runtime-region", "eu-west-1"),
+        ("/platform/config/env", "local"),
+        ("/platform/config/jwks-url", "http://localhost:8766/.well-known/jwks.json"),
+        ("/platform/config/api-audience", "api://platform-local"),
+        ("/platform/config/localstack-endpoint", "http://localhost:4566"),
+    ],
+    ids=["runtime-region", "env", "jwks-url", "api-audience", "localstack-endpoint"],
+)
+def test_seed_ssm_parameter_values(bootstrapped: dict[str, Any], name: str, expected: str) -> None:
+    assert bootstrapped["ssm"][name] == expected
 
 
-@mock_aws
-def test_seed_ssm_api_audience() -> None:
-    _, _, ssm_client = _make_aws_clients()
-    bootstrap.seed_ssm_parameters(  # type: ignore[attr-defined]
-        ssm_client,
-        mock_jwks_url="http://localhost:8766",
-        localstack_endpoint="http://localhost:4566",
-    )
-    resp = ssm_client.get_parameter(Name="/platform/config/api-audience")  # type: ignore[union-attr]
-    assert resp["Parameter"]["Value"] == "api://platform-local"
-
-
-@mock_aws
-def test_seed_ssm_pii_patterns_is_valid_json() -> None:
-    _, _, ssm_client = _make_aws_clients()
-    bootstrap.seed_ssm_parameters(  # type: ignore[attr-defined]
-        ssm_client,
-        mock_jwks_url="http://localhost:8766",
-        localstack_endpoint="http://localhost:4566",
-    )
-    resp = ssm_client.get_parameter(Name="/platform/gateway/pii-patterns/default")  # type: ignore[union-attr]
-    patterns = json.loads(resp["Parameter"]["Value"])
+def test_seed_ssm_pii_patterns_is_valid_json(bootstrapped: dict[str, Any]) -> None:
+    patterns = json.loads(bootstrapped["ssm"]["/platform/gateway/pii-patterns/default"])
     assert isinstance(patterns, list)
     assert len(patterns) > 0
 
 
-@mock_aws
-def test_seed_ssm_idempotent() -> None:
+def test_seed_ssm_idempotent(moto_aws: None, ssm_client: object) -> None:
     """Seeding SSM parameters twice must not raise."""
-    _, _, ssm_client = _make_aws_clients()
     for _ in range(2):
         bootstrap.seed_ssm_parameters(  # type: ignore[attr-defined]
             ssm_client,
@@ -268,8 +358,6 @@ def test_seed_ssm_idempotent() -> None:
 
 def test_fetch_jwts_returns_empty_when_service_unavailable() -> None:
     """When mock-jwks is not reachable, fetch_jwts must return an empty dict."""
-    import urllib.error
-
     with patch(
         "urllib.request.urlopen",
         side_effect=urllib.error.URLError("Connection refused"),
@@ -278,23 +366,61 @@ def test_fetch_jwts_returns_empty_when_service_unavailable() -> None:
     assert tokens == {}
 
 
-def test_fetch_jwts_returns_three_tokens_when_service_available() -> None:
-    """Mock the HTTP call and verify all three roles receive a token."""
+class _MockJwksHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for mock-jwks POST /token: echoes the tenant id into the token."""
 
-    def _make_response() -> MagicMock:
-        resp = MagicMock()
-        resp.read.return_value = json.dumps(
-            {"access_token": "mock-jwt", "token_type": "Bearer", "expires_in": 86400}
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps(
+            {
+                "access_token": f"jwt-{payload['tenant_id']}",
+                "token_type": "Bearer",
+                "expires_in": payload["ttl"],
+            }
         ).encode()
-        resp.__enter__ = lambda s: s
-        resp.__exit__ = MagicMock(return_value=False)
-        return resp
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+
+@pytest.fixture(scope="session")
+def mock_jwks_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockJwksHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_jwts_returns_three_tokens_when_service_available(mock_jwks_url: str) -> None:
+    """Fetch from a local HTTP server and verify all three roles receive a token."""
+    tokens = bootstrap.fetch_jwts(mock_jwks_url)  # type: ignore[attr-defined]
+
+    assert tokens == {
+        "basic": "jwt-t-test-001",
+        "premium": "jwt-t-test-002",
+        "admin": "jwt-admin-001",
+    }
+
 
-    with patch("urllib.request.urlopen", side_effect=[_make_response() for _ in range(3)]):
-        tokens = bootstrap.fetch_jwts("http://localhost:8766")  # type: ignore[attr-defined]
+def test_fetch_jwts_keeps_tokens_that_succeeded_when_one_role_fails(mock_jwks_url: str) -> None:
+    real_urlopen = urllib.request.urlopen
 
-    assert set(tokens.keys()) == {"basic", "premium", "admin"}
-    assert all(v == "mock-jwt" for v in tokens.values())
+    def _urlopen(req: urllib.request.Request, timeout: float) -> Any:
+        if b"Platform.Admin" in req.data:  # type: ignore[operator]
+            raise urllib.error.URLError("Connection reset")
+        return real_urlopen(req, timeout=timeout)
+
+    with patch("urllib.request.urlopen", side_effect=_urlopen):
+        tokens = bootstrap.fetch_jwts(mock_jwks_url)  # type: ignore[attr-defined]
+
+    assert tokens == {"basic": "jwt-t-test-001", "premium": "jwt-t-test-002"}
 
 
 # ---------------------------------------------------------------------------
@@ -302,30 +428,30 @@ def test_fetch_jwts_returns_three_tokens_when_service_available() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_write_env_test_with_tokens(tmp_path: Path) -> None:
-    env_test_path = tmp_path / ".env.test"
+def test_write_env_test_with_tokens() -> None:
+    buf = io.StringIO()
     tokens = {"basic": "jwt-basic", "premium": "jwt-premium", "admin": "jwt-admin"}
-    bootstrap.write_env_test(tokens, env_test_path)  # type: ignore[attr-defined]
-    content = env_test_path.read_text()
-    assert "BASIC_TENANT_ID=t-test-001" in content
-    assert "PREMIUM_TENANT_ID=t-test-002" in content
-    assert "BASIC_TENANT_JWT=jwt-basic" in content
-    assert "PREMIUM_TENANT_JWT=jwt-premium" in content
-    assert "ADMIN_JWT=jwt-admin" in content
-    assert "AWS_REGION=eu-west-2" in content
-    assert "LOCALSTACK_ENDPOINT=http://localhost:4566" in content
+    bootstrap.write_env_test(tokens, writer=buf)  # type: ignore[attr-defined]
+    env = _parse_env_str(buf.getvalue())
+    assert env["BASIC_TENANT_ID"] == "t-test-001"
+    assert env["PREMIUM_TENANT_ID"] == "t-test-002"
+    assert env["BASIC_TENANT_JWT"] == "jwt-basic"
+    assert env["PREMIUM_TENANT_JWT"] == "jwt-premium"
+    assert env["ADMIN_JWT"] == "jwt-admin"
+    assert env["AWS_REGION"] == "eu-west-2"
+    assert env["LOCALSTACK_ENDPOINT"] == "http://localhost:4566"
     assert (
-        "SCOPED_TOKEN_SIGNING_KEY=local-dev-scoped-token-signing-key-32-bytes-minimum" in content
+        env["SCOPED_TOKEN_SIGNING_KEY"] == "local-dev-scoped-token-signing-key-32-bytes-minimum"
     )  # pragma: allowlist secret
 
 
-def test_write_env_test_without_tokens_writes_empty_values(tmp_path: Path) -> None:
-    env_test_path = tmp_path / ".env.test"
-    bootstrap.write_env_test({}, env_test_path)  # type: ignore[attr-defined]
-    content = env_test_path.read_text()
-    assert "BASIC_TENANT_JWT=" in content
-    assert "PREMIUM_TENANT_JWT=" in content
-    assert "mock-jwks service was not running" in content
+def test_write_env_test_without_tokens_writes_empty_values() -> None:
+    buf = io.StringIO()
+    bootstrap.write_env_test({}, writer=buf)  # type: ignore[attr-defined]
+    env = _parse_env_str(buf.getvalue())
+    assert env["BASIC_TENANT_JWT"] == ""
+    assert env["PREMIUM_TENANT_JWT"] == ""
+    assert "mock-jwks service was not running" in buf.getvalue()
 
 
 def test_write_env_test_is_idempotent(tmp_path: Path) -> None:
@@ -344,69 +470,21 @@ def test_write_env_test_is_idempotent(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-@mock_aws
-def test_run_bootstrap_full_first_run(tmp_path: Path) -> None:
+def test_run_bootstrap_full_first_run(bootstrapped: dict[str, Any]) -> None:
     """run_bootstrap produces all expected records on first run."""
-    import urllib.error
+    counts = bootstrapped["counts"]
+    assert counts["platform-tenants"] == 3
+    assert counts["platform-agents"] == 1
+    assert counts["platform-tools"] == 1
+    assert _parse_env_str(bootstrapped["env_test"])["BASIC_TENANT_ID"] == "t-test-001"
 
-    ddb_client = boto3.client("dynamodb", region_name=_REGION)
-    ddb_resource = boto3.resource("dynamodb", region_name=_REGION)
-    ssm_client = boto3.client("ssm", region_name=_REGION)
-    env_test_path = tmp_path / ".env.test"
 
-    with patch(
-        "urllib.request.urlopen",
-        side_effect=urllib.error.URLError("Connection refused"),
-    ):
-        bootstrap.run_bootstrap(  # type: ignore[attr-defined]
-            ddb_client=ddb_client,
-            ddb_resource=ddb_resource,
-            ssm_client=ssm_client,
-            env_test_path=env_test_path,
-        )
-
-    assert len(_scan_table(ddb_resource, "platform-tenants")) == 3
-    assert len(_scan_table(ddb_resource, "platform-agents")) == 1
-    assert len(_scan_table(ddb_resource, "platform-tools")) == 1
-    assert env_test_path.exists()
-
-
-@mock_aws
-def test_run_bootstrap_twice_no_duplicate_records(tmp_path: Path) -> None:
+def test_run_bootstrap_twice_no_duplicate_records(bootstrapped: dict[str, Any]) -> None:
     """TASK-015 acceptance: run twice, verify no duplicate records in any table."""
-    import urllib.error
-
-    ddb_client = boto3.client("dynamodb", region_name=_REGION)
-    ddb_resource = boto3.resource("dynamodb", region_name=_REGION)
-    ssm_client = boto3.client("ssm", region_name=_REGION)
-    env_test_path = tmp_path / ".env.test"
-
-    run_kwargs = {
-        "ddb_client": ddb_client,
-        "ddb_resource": ddb_resource,
-        "ssm_client": ssm_client,
-        "env_test_path": env_test_path,
-    }
-
-    with patch(
-        "urllib.request.urlopen",
-        side_effect=urllib.error.URLError("Connection refused"),
-    ):
-        bootstrap.run_bootstrap(**run_kwargs)  # type: ignore[attr-defined]
-        counts_after_first = {
-            "tenants": len(_scan_table(ddb_resource, "platform-tenants")),
-            "agents": len(_scan_table(ddb_resource, "platform-agents")),
-            "tools": len(_scan_table(ddb_resource, "platform-tools")),
-        }
-
-        bootstrap.run_bootstrap(**run_kwargs)  # type: ignore[attr-defined]
-        counts_after_second = {
-            "tenants": len(_scan_table(ddb_resource, "platform-tenants")),
-            "agents": len(_scan_table(ddb_resource, "platform-agents")),
-            "tools": len(_scan_table(ddb_resource, "platform-tools")),
-        }
+    counts_after_first = bootstrapped["counts"]
+    counts_after_second = bootstrapped["rerun_counts"]
 
     assert counts_after_second == counts_after_first
-    assert counts_after_second["tenants"] == 3
-    assert counts_after_second["agents"] == 1
-    assert counts_after_second["tools"] == 1
+    assert counts_after_second["platform-tenants"] == 3
+    assert counts_after_second["platform-agents"] == 1
+    assert counts_after_second["platform-tools"] == 1
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import importlib.util
 import io
-import sys
 import threading
 from contextlib import redirect_stdout
 from datetime import UTC, datetime
@@ -15,17 +13,11 @@ import boto3
 import pytest
 from moto import mock_aws
 
+from tests.unit.script_test_support import SCRIPTS_DIR, load_script_module
+
 
 def _load_module() -> Any:
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location(
-        "failover_lock_script", repo_root / "scripts" / "failover_lock.py"
-    )
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)  # type: ignore[union-attr]
-    return module
+    return load_script_module("failover_lock_script", SCRIPTS_DIR / "failover_lock.py")
 
 
 failover_lock = _load_module()
@@ -84,6 +76,21 @@ def test_acquire_lock_writes_expected_record() -> None:
     assert int(item["ttl"]["N"]) == int(now.timestamp()) + 300
 
 
+@mock_aws
+def test_second_acquire_fails_and_reports_current_holder() -> None:
+    _create_ops_lock_table()
+    client = boto3.client("dynamodb", region_name=_REGION)
+    now = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+    failover_lock.acquire_lock(client, table_name=_TABLE_NAME, acquired_by="ops/a", now=now)
+
+    with pytest.raises(
+        failover_lock.LockAlreadyHeldError,
+        match=r"held by ops/a since 2026-01-01T12:00:00Z",
+    ):
+        failover_lock.acquire_lock(client, table_name=_TABLE_NAME, acquired_by="ops/b")
+
+
+@pytest.mark.slow
 @mock_aws
 def test_concurrent_acquire_only_one_succeeds() -> None:
     _create_ops_lock_table()
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import importlib.util
-import sys
+import hashlib
+import os
 from pathlib import Path
 from typing import Any
 
@@ -11,17 +11,11 @@ import boto3
 import pytest
 from moto import mock_aws
 
+from tests.unit.script_test_support import SCRIPTS_DIR, load_script_module
+
 
 def _load_hash_layer_module() -> Any:
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location(
-        "hash_layer_script", repo_root / "scripts" / "hash_layer.py"
-    )
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)  # type: ignore[union-attr]
-    return module
+    return load_script_module("hash_layer_script", SCRIPTS_DIR / "hash_layer.py")
 
 
 hl: Any = _load_hash_layer_module()
@@ -29,15 +23,7 @@ build_layer: Any
 
 
 def _load_build_layer_module() -> Any:
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location(
-        "build_layer_script", repo_root / "scripts" / "build_layer.py"
-    )
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)  # type: ignore[union-attr]
-    return module
+    return load_script_module("build_layer_script", SCRIPTS_DIR / "build_layer.py")
 
 
 build_layer = _load_build_layer_module()
@@ -83,7 +69,18 @@ def test_hash_length_is_16_chars() -> None:
     deps = ["boto3>=1.37.0"]
     result = hl.compute_dependency_hash(deps)
     assert len(result) == 16
-    assert all(c in "0123456789abcdef" for c in result)
+    assert result == result.lower()
+    try:
+        assert len(bytes.fromhex(result)) == 8
+    except ValueError:
+        pytest.fail(f"dependency hash is not valid hex: {result!r}")
+
+
+def test_hash_is_blake2b_64_bit_digest_of_canonical_form() -> None:
+    deps = [" strands-agents>=0.1.0", "boto3>=1.37.0 "]
+    canonical = "boto3>=1.37.0\nstrands-agents>=0.1.0\n---lockfile---\nlock"
+    expected = hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+    assert hl.compute_dependency_hash(deps, lockfile_content="lock") == expected
 
 
 def test_empty_deps_returns_hash() -> None:
@@ -171,6 +168,36 @@ def test_read_agent_deps_missing_agent() -> None:
         hl.read_agent_deps("nonexistent-agent-xyz")
 
 
+def _write_agent_pyproject(root: Path, deps: list[str], *, mtime_ns: int) -> Path:
+    toml_path = root / "agents" / "cached-agent" / "pyproject.toml"
+    toml_path.parent.mkdir(parents=True, exist_ok=True)
+    toml_path.write_text(
+        "[project]\ndependencies = [" + ", ".join(f'"{dep}"' for dep in deps) + "]\n"
+    )
+    os.utime(toml_path, ns=(mtime_ns, mtime_ns))
+    return toml_path
+
+
+def test_read_agent_deps_parses_pyproject_once_per_revision(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(hl.layer_manifest, "REPO_ROOT", tmp_path)
+    _write_agent_pyproject(tmp_path, ["boto3>=1.37.0"], mtime_ns=1_000_000_000)
+    parses = []
+    real_load = hl.layer_manifest.tomllib.load
+    monkeypatch.setattr(
+        hl.layer_manifest.tomllib, "load", lambda fh: parses.append(1) or real_load(fh)
+    )
+
+    assert hl.read_agent_deps("cached-agent") == ["boto3>=1.37.0"]
+    assert hl.read_deployment_type("cached-agent") == "zip"
+    assert len(parses) == 1
+
+    _write_agent_pyproject(tmp_path, ["boto3>=1.38.0"], mtime_ns=2_000_000_000)
+    assert hl.read_agent_deps("cached-agent") == ["boto3>=1.38.0"]
+    assert len(parses) == 2
+
+
 # ---------------------------------------------------------------------------
 # get_ssm_hash — SSM interaction tests (moto)
 # ---------------------------------------------------------------------------
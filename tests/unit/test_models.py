@@ -12,6 +12,9 @@ Validates:
 
 import dataclasses
 import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from data_access.models import (
@@ -48,6 +51,157 @@ from data_access.models import (
     normalize_agent_status,
 )
 
+# Default TTLs for the baseline records; only test_ttl_is_approximately_5_minutes_from_now
+# asserts on freshness and it computes its own.
+_NOW = int(time.time())
+_INVOCATION_TTL = _NOW + INVOCATION_TTL_SECONDS
+_JOB_TTL = _NOW + JOB_TTL_SECONDS
+_SESSION_TTL = _NOW + SESSION_TTL_SECONDS
+_OPS_LOCK_TTL = _NOW + OPS_LOCK_TTL_SECONDS
+
+# Exceptions accepted as "field assignment rejected" by the test_frozen checks.
+_FROZEN_EXC = (dataclasses.FrozenInstanceError, TypeError)
+
+# Enum members materialised once for the parametrized "all values accepted" tests.
+_TENANT_TIERS = tuple(TenantTier)
+_TENANT_STATUSES = tuple(TenantStatus)
+_INVOCATION_MODES = tuple(InvocationMode)
+_AGENT_STATUSES = tuple(AgentStatus)
+_INVOCATION_STATUSES = tuple(InvocationStatus)
+_JOB_STATUSES = tuple(JobStatus)
+_SESSION_STATUSES = tuple(SessionStatus)
+
+# ---------------------------------------------------------------------------
+# Record factories
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def baseline_records() -> SimpleNamespace:
+    """One default instance of each record type, shared across the session.
+
+    Records are frozen, so sharing them is safe; tests that need different field
+    values go through the ``make_*`` factories below.
+    """
+    return SimpleNamespace(
+        tenant=TenantRecord(
+            tenant_id="t-abc123",
+            app_id="app-001",
+            display_name="Acme Corp",
+            tier=TenantTier.STANDARD,
+            status=TenantStatus.ACTIVE,
+            created_at="2026-02-24T00:00:00Z",
+            updated_at="2026-02-24T00:00:00Z",
+            owner_email="admin@acme.example",
+            owner_team="platform",
+            account_id="123456789012",
+        ),
+        agent=AgentRecord(
+            agent_name="echo-agent",
+            version="1.0.0",
+            owner_team="platform",
+            tier_minimum=TenantTier.BASIC,
+            layer_hash="abcdef1234567890",
+            layer_s3_key="layers/echo-agent-abcdef12.zip",
+            script_s3_key="agents/echo-agent/1.0.0.zip",
+            deployed_at="2026-02-24T00:00:00Z",
+            invocation_mode=InvocationMode.SYNC,
+            streaming_enabled=False,
+        ),
+        invocation=InvocationRecord(
+            invocation_id="inv-001",
+            tenant_id="t-abc123",
+            app_id="app-001",
+            agent_name="echo-agent",
+            agent_version="1.0.0",
+            session_id="sess-001",
+            input_tokens=50,
+            output_tokens=120,
+            latency_ms=340,
+            status=InvocationStatus.SUCCESS,
+            runtime_region="eu-west-1",
+            invocation_mode=InvocationMode.SYNC,
+            timestamp="2026-02-24T12:00:00Z",
+            ttl=_INVOCATION_TTL,
+        ),
+        job=JobRecord(
+            job_id="job-001",
+            tenant_id="t-abc123",
+            app_id="app-123",
+            agent_name="echo-agent",
+            status=JobStatus.PENDING,
+            created_at="2026-02-24T12:00:00Z",
+            ttl=_JOB_TTL,
+        ),
+        session=SessionRecord(
+            session_id="sess-001",
+            tenant_id="t-abc123",
+            runtime_session_id="rts-001",
+            agent_name="echo-agent",
+            started_at="2026-02-24T12:00:00Z",
+            last_activity_at="2026-02-24T12:30:00Z",
+            status=SessionStatus.ACTIVE,
+            ttl=_SESSION_TTL,
+        ),
+        tool=ToolRecord(
+            tool_name="web-search",
+            tier_minimum=TenantTier.STANDARD,
+            lambda_arn="arn:aws:lambda:eu-west-2:123:function:platform-web-search-dev",
+            gateway_target_id="tgt-001",
+            enabled=True,
+        ),
+        lock=OpsLockRecord(
+            lock_name="region-failover",
+            lock_id="550e8400-e29b-41d4-a716-446655440000",
+            acquired_by="ops/failover@ops-host",
+            acquired_at="2026-02-24T12:00:00Z",
+            ttl=_OPS_LOCK_TTL,
+        ),
+    )
+
+
+def _factory(baseline: Any) -> Callable[..., Any]:
+    def make(**overrides: Any) -> Any:
+        return dataclasses.replace(baseline, **overrides) if overrides else baseline
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_tenant(baseline_records: SimpleNamespace) -> Callable[..., TenantRecord]:
+    return _factory(baseline_records.tenant)
+
+
+@pytest.fixture(scope="session")
+def make_agent(baseline_records: SimpleNamespace) -> Callable[..., AgentRecord]:
+    return _factory(baseline_records.agent)
+
+
+@pytest.fixture(scope="session")
+def make_invocation(baseline_records: SimpleNamespace) -> Callable[..., InvocationRecord]:
+    return _factory(baseline_records.invocation)
+
+
+@pytest.fixture(scope="session")
+def make_job(baseline_records: SimpleNamespace) -> Callable[..., JobRecord]:
+    return _factory(baseline_records.job)
+
+
+@pytest.fixture(scope="session")
+def make_session(baseline_records: SimpleNamespace) -> Callable[..., SessionRecord]:
+    return _factory(baseline_records.session)
+
+
+@pytest.fixture(scope="session")
+def make_tool(baseline_records: SimpleNamespace) -> Callable[..., ToolRecord]:
+    return _factory(baseline_records.tool)
+
+
+@pytest.fixture(scope="session")
+def make_lock(baseline_records: SimpleNamespace) -> Callable[..., OpsLockRecord]:
+    return _factory(baseline_records.lock)
+
+
 # ---------------------------------------------------------------------------
 # TTL constant sanity checks
 # ---------------------------------------------------------------------------
@@ -75,45 +229,28 @@ class TestTtlConstants:
 # ---------------------------------------------------------------------------
 
 
-def _make_tenant(**overrides) -> TenantRecord:
-    defaults = dict(
-        tenant_id="t-abc123",
-        app_id="app-001",
-        display_name="Acme Corp",
-        tier=TenantTier.STANDARD,
-        status=TenantStatus.ACTIVE,
-        created_at="2026-02-24T00:00:00Z",
-        updated_at="2026-02-24T00:00:00Z",
-        owner_email="admin@acme.example",
-        owner_team="platform",
-        account_id="123456789012",
-    )
-    defaults.update(overrides)
-    return TenantRecord(**defaults)
-
-
 class TestTenantRecord:
-    def test_pk_format(self):
-        tenant = _make_tenant(tenant_id="t-xyz")
+    def test_pk_format(self, make_tenant):
+        tenant = make_tenant(tenant_id="t-xyz")
         assert tenant.pk == "TENANT#t-xyz"
 
-    def test_sk_is_metadata(self):
-        assert _make_tenant().sk == "METADATA"
+    def test_sk_is_metadata(self, make_tenant):
+        assert make_tenant().sk == "METADATA"
 
-    def test_pk_starts_with_tenant_prefix(self):
-        tenant = _make_tenant()
+    def test_pk_starts_with_tenant_prefix(self, make_tenant):
+        tenant = make_tenant()
         assert tenant.pk.startswith("TENANT#")
 
-    def test_optional_fields_default_none(self):
-        tenant = _make_tenant()
+    def test_optional_fields_default_none(self, make_tenant):
+        tenant = make_tenant()
         assert tenant.memory_store_arn is None
         assert tenant.runtime_region is None
         assert tenant.fallback_region is None
         assert tenant.api_key_secret_arn is None
         assert tenant.monthly_budget_usd is None
 
-    def test_optional_fields_accept_values(self):
-        tenant = _make_tenant(
+    def test_optional_fields_accept_values(self, make_tenant):
+        tenant = make_tenant(
             memory_store_arn="arn:aws:bedrock:eu-west-2:123:memory/m-1",
             runtime_region="eu-west-1",
             fallback_region="eu-central-1",
@@ -123,9 +260,9 @@ class TestTenantRecord:
         assert tenant.runtime_region == "eu-west-1"
         assert tenant.monthly_budget_usd == 1000.0
 
-    def test_frozen(self):
-        tenant = _make_tenant()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_tenant):
+        tenant = make_tenant()
+        with pytest.raises(_FROZEN_EXC):
             tenant.status = TenantStatus.SUSPENDED  # type: ignore[misc]
 
     def test_tier_enum_rejects_invalid(self):
@@ -136,15 +273,15 @@ class TestTenantRecord:
         with pytest.raises(ValueError):
             TenantStatus("banned")
 
-    def test_all_tiers_accepted(self):
-        for tier in TenantTier:
-            tenant = _make_tenant(tier=tier)
-            assert tenant.tier == tier
+    @pytest.mark.parametrize("tier", _TENANT_TIERS, ids=str)
+    def test_all_tiers_accepted(self, make_tenant, tier):
+        tenant = make_tenant(tier=tier)
+        assert tenant.tier == tier
 
-    def test_all_statuses_accepted(self):
-        for status in TenantStatus:
-            tenant = _make_tenant(status=status)
-            assert tenant.status == status
+    @pytest.mark.parametrize("status", _TENANT_STATUSES, ids=str)
+    def test_all_statuses_accepted(self, make_tenant, status):
+        tenant = make_tenant(status=status)
+        assert tenant.status == status
 
 
 class TestConfigurationOwnership:
@@ -247,60 +384,43 @@ class TestTenantCapabilityPolicy:
 # ---------------------------------------------------------------------------
 
 
-def _make_agent(**overrides) -> AgentRecord:
-    defaults = dict(
-        agent_name="echo-agent",
-        version="1.0.0",
-        owner_team="platform",
-        tier_minimum=TenantTier.BASIC,
-        layer_hash="abcdef1234567890",
-        layer_s3_key="layers/echo-agent-abcdef12.zip",
-        script_s3_key="agents/echo-agent/1.0.0.zip",
-        deployed_at="2026-02-24T00:00:00Z",
-        invocation_mode=InvocationMode.SYNC,
-        streaming_enabled=False,
-    )
-    defaults.update(overrides)
-    return AgentRecord(**defaults)
-
-
 class TestAgentRecord:
-    def test_pk_format(self):
-        agent = _make_agent(agent_name="my-agent")
+    def test_pk_format(self, make_agent):
+        agent = make_agent(agent_name="my-agent")
         assert agent.pk == "AGENT#my-agent"
 
-    def test_sk_format(self):
-        agent = _make_agent(version="2.3.4")
+    def test_sk_format(self, make_agent):
+        agent = make_agent(version="2.3.4")
         assert agent.sk == "VERSION#2.3.4"
 
-    def test_pk_starts_with_agent_prefix(self):
-        assert _make_agent().pk.startswith("AGENT#")
+    def test_pk_starts_with_agent_prefix(self, make_agent):
+        assert make_agent().pk.startswith("AGENT#")
 
-    def test_sk_starts_with_version_prefix(self):
-        assert _make_agent().sk.startswith("VERSION#")
+    def test_sk_starts_with_version_prefix(self, make_agent):
+        assert make_agent().sk.startswith("VERSION#")
 
-    def test_optional_fields_default_none(self):
-        agent = _make_agent()
+    def test_optional_fields_default_none(self, make_agent):
+        agent = make_agent()
         assert agent.runtime_arn is None
         assert agent.estimated_duration_seconds is None
 
-    def test_all_invocation_modes_accepted(self):
-        for mode in InvocationMode:
-            agent = _make_agent(invocation_mode=mode)
-            assert agent.invocation_mode == mode
+    @pytest.mark.parametrize("mode", _INVOCATION_MODES, ids=str)
+    def test_all_invocation_modes_accepted(self, make_agent, mode):
+        agent = make_agent(invocation_mode=mode)
+        assert agent.invocation_mode == mode
 
-    def test_frozen(self):
-        agent = _make_agent()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_agent):
+        agent = make_agent()
+        with pytest.raises(_FROZEN_EXC):
             agent.version = "9.9.9"  # type: ignore[misc]
 
-    def test_default_status_is_built(self):
-        assert _make_agent().status is AgentStatus.BUILT
+    def test_default_status_is_built(self, make_agent):
+        assert make_agent().status is AgentStatus.BUILT
 
-    def test_all_agent_statuses_accepted(self):
-        for status in AgentStatus:
-            agent = _make_agent(status=status)
-            assert agent.status == status
+    @pytest.mark.parametrize("status", _AGENT_STATUSES, ids=str)
+    def test_all_agent_statuses_accepted(self, make_agent, status):
+        agent = make_agent(status=status)
+        assert agent.status == status
 
 
 class TestAgentReleaseStatusHelpers:
@@ -335,80 +455,59 @@ class TestAgentReleaseStatusHelpers:
 # ---------------------------------------------------------------------------
 
 
-def _make_invocation(**overrides) -> InvocationRecord:
-    defaults = dict(
-        invocation_id="inv-001",
-        tenant_id="t-abc123",
-        app_id="app-001",
-        agent_name="echo-agent",
-        agent_version="1.0.0",
-        session_id="sess-001",
-        input_tokens=50,
-        output_tokens=120,
-        latency_ms=340,
-        status=InvocationStatus.SUCCESS,
-        runtime_region="eu-west-1",
-        invocation_mode=InvocationMode.SYNC,
-        timestamp="2026-02-24T12:00:00Z",
-        ttl=int(time.time()) + INVOCATION_TTL_SECONDS,
-    )
-    defaults.update(overrides)
-    return InvocationRecord(**defaults)
-
-
 class TestInvocationRecord:
-    def test_pk_format(self):
-        inv = _make_invocation(tenant_id="t-xyz")
+    def test_pk_format(self, make_invocation):
+        inv = make_invocation(tenant_id="t-xyz")
         assert inv.pk == "TENANT#t-xyz"
 
-    def test_sk_format_without_jitter(self):
-        inv = _make_invocation(
+    def test_sk_format_without_jitter(self, make_invocation):
+        inv = make_invocation(
             timestamp="2026-02-24T12:00:00Z",
             invocation_id="inv-001",
             jitter=None,
         )
         assert inv.sk == "INV#2026-02-24T12:00:00Z#inv-001"
 
-    def test_sk_format_with_jitter(self):
-        inv = _make_invocation(
+    def test_sk_format_with_jitter(self, make_invocation):
+        inv = make_invocation(
             timestamp="2026-02-24T12:00:00Z",
             invocation_id="inv-001",
             jitter="a3",
         )
         assert inv.sk == "INV#2026-02-24T12:00:00Z#inv-001#a3"
 
-    def test_sk_starts_with_inv_prefix(self):
-        assert _make_invocation().sk.startswith("INV#")
+    def test_sk_starts_with_inv_prefix(self, make_invocation):
+        assert make_invocation().sk.startswith("INV#")
 
-    def test_jitter_must_be_two_chars(self):
+    def test_jitter_must_be_two_chars(self, make_invocation):
         with pytest.raises(ValueError):
-            _make_invocation(jitter="x")  # too short
+            make_invocation(jitter="x")  # too short
 
         with pytest.raises(ValueError):
-            _make_invocation(jitter="abc")  # too long
+            make_invocation(jitter="abc")  # too long
 
-    def test_jitter_exactly_two_chars_accepted(self):
-        inv = _make_invocation(jitter="ff")
+    def test_jitter_exactly_two_chars_accepted(self, make_invocation):
+        inv = make_invocation(jitter="ff")
         assert inv.jitter == "ff"
 
-    def test_jitter_none_accepted(self):
-        inv = _make_invocation(jitter=None)
+    def test_jitter_none_accepted(self, make_invocation):
+        inv = make_invocation(jitter=None)
         assert inv.jitter is None
 
-    def test_optional_fields_default(self):
-        inv = _make_invocation()
+    def test_optional_fields_default(self, make_invocation):
+        inv = make_invocation()
         assert inv.jitter is None
         assert inv.error_code is None
         assert inv.job_id is None
 
-    def test_all_invocation_statuses_accepted(self):
-        for status in InvocationStatus:
-            inv = _make_invocation(status=status)
-            assert inv.status == status
+    @pytest.mark.parametrize("status", _INVOCATION_STATUSES, ids=str)
+    def test_all_invocation_statuses_accepted(self, make_invocation, status):
+        inv = make_invocation(status=status)
+        assert inv.status == status
 
-    def test_frozen(self):
-        inv = _make_invocation()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_invocation):
+        inv = make_invocation()
+        with pytest.raises(_FROZEN_EXC):
             inv.status = InvocationStatus.ERROR  # type: ignore[misc]
 
 
@@ -417,34 +516,20 @@ class TestInvocationRecord:
 # ---------------------------------------------------------------------------
 
 
-def _make_job(**overrides) -> JobRecord:
-    defaults = dict(
-        job_id="job-001",
-        tenant_id="t-abc123",
-        app_id="app-123",
-        agent_name="echo-agent",
-        status=JobStatus.PENDING,
-        created_at="2026-02-24T12:00:00Z",
-        ttl=int(time.time()) + JOB_TTL_SECONDS,
-    )
-    defaults.update(overrides)
-    return JobRecord(**defaults)
-
-
 class TestJobRecord:
-    def test_pk_format(self):
-        job = _make_job(tenant_id="t-xyz")
+    def test_pk_format(self, make_job):
+        job = make_job(tenant_id="t-xyz")
         assert job.pk == "TENANT#t-xyz"
 
-    def test_sk_format(self):
-        job = _make_job(job_id="job-123")
+    def test_sk_format(self, make_job):
+        job = make_job(job_id="job-123")
         assert job.sk == "JOB#job-123"
 
-    def test_pk_starts_with_tenant_prefix(self):
-        assert _make_job().pk.startswith("TENANT#")
+    def test_pk_starts_with_tenant_prefix(self, make_job):
+        assert make_job().pk.startswith("TENANT#")
 
-    def test_optional_fields_default(self):
-        job = _make_job()
+    def test_optional_fields_default(self, make_job):
+        job = make_job()
         assert job.started_at is None
         assert job.completed_at is None
         assert job.result_s3_key is None
@@ -457,14 +542,14 @@ class TestJobRecord:
         assert job.webhook_delivery_error is None
         assert job.webhook_last_attempt_at is None
 
-    def test_all_job_statuses_accepted(self):
-        for status in JobStatus:
-            job = _make_job(status=status)
-            assert job.status == status
+    @pytest.mark.parametrize("status", _JOB_STATUSES, ids=str)
+    def test_all_job_statuses_accepted(self, make_job, status):
+        job = make_job(status=status)
+        assert job.status == status
 
-    def test_frozen(self):
-        job = _make_job()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_job):
+        job = make_job()
+        with pytest.raises(_FROZEN_EXC):
             job.status = JobStatus.RUNNING  # type: ignore[misc]
 
 
@@ -473,44 +558,29 @@ class TestJobRecord:
 # ---------------------------------------------------------------------------
 
 
-def _make_session(**overrides) -> SessionRecord:
-    defaults = dict(
-        session_id="sess-001",
-        tenant_id="t-abc123",
-        runtime_session_id="rts-001",
-        agent_name="echo-agent",
-        started_at="2026-02-24T12:00:00Z",
-        last_activity_at="2026-02-24T12:30:00Z",
-        status=SessionStatus.ACTIVE,
-        ttl=int(time.time()) + SESSION_TTL_SECONDS,
-    )
-    defaults.update(overrides)
-    return SessionRecord(**defaults)
-
-
 class TestSessionRecord:
-    def test_pk_format(self):
-        sess = _make_session(tenant_id="t-xyz")
+    def test_pk_format(self, make_session):
+        sess = make_session(tenant_id="t-xyz")
         assert sess.pk == "TENANT#t-xyz"
 
-    def test_sk_format(self):
-        sess = _make_session(session_id="sess-abc")
+    def test_sk_format(self, make_session):
+        sess = make_session(session_id="sess-abc")
         assert sess.sk == "SESSION#sess-abc"
 
-    def test_pk_starts_with_tenant_prefix(self):
-        assert _make_session().pk.startswith("TENANT#")
+    def test_pk_starts_with_tenant_prefix(self, make_session):
+        assert make_session().pk.startswith("TENANT#")
 
-    def test_sk_starts_with_session_prefix(self):
-        assert _make_session().sk.startswith("SESSION#")
+    def test_sk_starts_with_session_prefix(self, make_session):
+        assert make_session().sk.startswith("SESSION#")
 
-    def test_all_session_statuses_accepted(self):
-        for status in SessionStatus:
-            sess = _make_session(status=status)
-            assert sess.status == status
+    @pytest.mark.parametrize("status", _SESSION_STATUSES, ids=str)
+    def test_all_session_statuses_accepted(self, make_session, status):
+        sess = make_session(status=status)
+        assert sess.status == status
 
-    def test_frozen(self):
-        sess = _make_session()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_session):
+        sess = make_session()
+        with pytest.raises(_FROZEN_EXC):
             sess.status = SessionStatus.EXPIRED  # type: ignore[misc]
 
 
@@ -519,46 +589,34 @@ class TestSessionRecord:
 # ---------------------------------------------------------------------------
 
 
-def _make_tool(**overrides) -> ToolRecord:
-    defaults = dict(
-        tool_name="web-search",
-        tier_minimum=TenantTier.STANDARD,
-        lambda_arn="arn:aws:lambda:eu-west-2:123:function:platform-web-search-dev",
-        gateway_target_id="tgt-001",
-        enabled=True,
-    )
-    defaults.update(overrides)
-    return ToolRecord(**defaults)
-
-
 class TestToolRecord:
-    def test_pk_format(self):
-        tool = _make_tool(tool_name="code-exec")
+    def test_pk_format(self, make_tool):
+        tool = make_tool(tool_name="code-exec")
         assert tool.pk == "TOOL#code-exec"
 
-    def test_sk_global_when_no_tenant(self):
-        tool = _make_tool(tenant_id=None)
+    def test_sk_global_when_no_tenant(self, make_tool):
+        tool = make_tool(tenant_id=None)
         assert tool.sk == "GLOBAL"
 
-    def test_sk_tenant_scoped_when_tenant_set(self):
-        tool = _make_tool(tenant_id="t-abc123")
+    def test_sk_tenant_scoped_when_tenant_set(self, make_tool):
+        tool = make_tool(tenant_id="t-abc123")
         assert tool.sk == "TENANT#t-abc123"
 
-    def test_pk_starts_with_tool_prefix(self):
-        assert _make_tool().pk.startswith("TOOL#")
+    def test_pk_starts_with_tool_prefix(self, make_tool):
+        assert make_tool().pk.startswith("TOOL#")
 
-    def test_global_tool_tenant_id_is_none(self):
-        tool = _make_tool()
+    def test_global_tool_tenant_id_is_none(self, make_tool):
+        tool = make_tool()
         assert tool.tenant_id is None
 
-    def test_all_tier_minimums_accepted(self):
-        for tier in TenantTier:
-            tool = _make_tool(tier_minimum=tier)
-            assert tool.tier_minimum == tier
+    @pytest.mark.parametrize("tier", _TENANT_TIERS, ids=str)
+    def test_all_tier_minimums_accepted(self, make_tool, tier):
+        tool = make_tool(tier_minimum=tier)
+        assert tool.tier_minimum == tier
 
-    def test_frozen(self):
-        tool = _make_tool()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_tool):
+        tool = make_tool()
+        with pytest.raises(_FROZEN_EXC):
             tool.enabled = False  # type: ignore[misc]
 
 
@@ -567,38 +625,26 @@ class TestToolRecord:
 # ---------------------------------------------------------------------------
 
 
-def _make_lock(**overrides) -> OpsLockRecord:
-    defaults = dict(
-        lock_name="region-failover",
-        lock_id="550e8400-e29b-41d4-a716-446655440000",
-        acquired_by="ops/failover@ops-host",
-        acquired_at="2026-02-24T12:00:00Z",
-        ttl=int(time.time()) + OPS_LOCK_TTL_SECONDS,
-    )
-    defaults.update(overrides)
-    return OpsLockRecord(**defaults)
-
-
 class TestOpsLockRecord:
-    def test_pk_format(self):
-        lock = _make_lock(lock_name="region-failover")
+    def test_pk_format(self, make_lock):
+        lock = make_lock(lock_name="region-failover")
         assert lock.pk == "LOCK#region-failover"
 
-    def test_sk_is_metadata(self):
-        assert _make_lock().sk == "METADATA"
+    def test_sk_is_metadata(self, make_lock):
+        assert make_lock().sk == "METADATA"
 
-    def test_pk_starts_with_lock_prefix(self):
-        assert _make_lock().pk.startswith("LOCK#")
+    def test_pk_starts_with_lock_prefix(self, make_lock):
+        assert make_lock().pk.startswith("LOCK#")
 
-    def test_ttl_is_approximately_5_minutes_from_now(self):
+    def test_ttl_is_approximately_5_minutes_from_now(self, make_lock):
         now = int(time.time())
-        lock = _make_lock(ttl=now + OPS_LOCK_TTL_SECONDS)
+        lock = make_lock(ttl=now + OPS_LOCK_TTL_SECONDS)
         assert lock.ttl > now
         assert lock.ttl <= now + OPS_LOCK_TTL_SECONDS + 1
 
-    def test_frozen(self):
-        lock = _make_lock()
-        with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+    def test_frozen(self, make_lock):
+        lock = make_lock()
+        with pytest.raises(_FROZEN_EXC):
             lock.lock_id = "different-id"  # type: ignore[misc]
 
 
@@ -611,17 +657,19 @@ class TestOpsLockRecord:
 class TestKeyPrefixUniqueness:
     """All PK prefixes must be distinct to prevent scan/query collisions."""
 
-    def test_pk_prefixes_are_unique(self):
+    def test_pk_prefixes_are_unique(
+        self, make_tenant, make_agent, make_invocation, make_job, make_session, make_tool, make_lock
+    ):
         records = [
-            _make_tenant(),
-            _make_agent(),
-            _make_invocation(),
-            _make_job(),
-            _make_session(),
-            _make_tool(),
-            _make_lock(),
+            make_tenant(),
+            make_agent(),
+            make_invocation(),
+            make_job(),
+            make_session(),
+            make_tool(),
+            make_lock(),
         ]
-        prefixes = [r.pk.split("#")[0] for r in records]
+        prefixes = [r.pk.partition("#")[0] for r in records]
         # TenantRecord and InvocationRecord/SessionRecord share TENANT# prefix
         # intentionally (GSI queries by tenant). Others must be unique.
         non_tenant_prefixes = [p for p in prefixes if p != "TENANT"]
@@ -629,12 +677,8 @@ class TestKeyPrefixUniqueness:
             "Non-tenant PK prefixes must be unique across tables"
         )
 
-    def test_tenant_records_share_pk_prefix_by_design(self):
+    @pytest.mark.parametrize("record", ["tenant", "invocation", "session"])
+    def test_tenant_records_share_pk_prefix_by_design(self, baseline_records, record):
         """TenantRecord, InvocationRecord, and SessionRecord all use TENANT# PK
         so tenant-scoped queries return all data for a tenant via single partition."""
-        tenant = _make_tenant()
-        inv = _make_invocation()
-        sess = _make_session()
-        assert tenant.pk.startswith("TENANT#")
-        assert inv.pk.startswith("TENANT#")
-        assert sess.pk.startswith("TENANT#")
+        assert getattr(baseline_records, record).pk.startswith("TENANT#")
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import json
-import sys
+from collections.abc import Generator
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
+from src.tenant_api import handler as tenant_api_handler
 from src.tenant_api import ops_control
 from tests.unit.tenant_api_test_support import (
+    apply_common_tenant_api_env,
     build_handler_state,
+    build_tenant_api_dependencies,
     fixed_now_value,
     invoke_handler,
     response_body,
@@ -24,9 +24,27 @@ def fixed_now() -> datetime:
     return fixed_now_value()
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _ops_env() -> Generator[None, None, None]:
+    # The tenant API env never varies across this module; set it once and undo it on exit.
+    with pytest.MonkeyPatch.context() as mp:
+        apply_common_tenant_api_env(mp)
+        yield
+
+
+@pytest.fixture(scope="session")
+def shared_deps() -> tenant_api_handler.TenantApiDependencies:
+    """Dependency fakes built once; the ops routes under test only touch the scoped DB."""
+    return build_tenant_api_dependencies()
+
+
 @pytest.fixture
-def fake_state(monkeypatch: pytest.MonkeyPatch, fixed_now: datetime) -> dict[str, Any]:
-    return build_handler_state(monkeypatch, fixed_now)
+def fake_state(
+    monkeypatch: pytest.MonkeyPatch,
+    fixed_now: datetime,
+    shared_deps: tenant_api_handler.TenantApiDependencies,
+) -> dict[str, Any]:
+    return build_handler_state(monkeypatch, fixed_now, deps=shared_deps, apply_env=False)
 
 
 def _ops_event(
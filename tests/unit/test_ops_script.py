@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import importlib.util
 import io
 import json
-import sys
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError
@@ -13,18 +11,9 @@ from urllib.request import Request
 
 import pytest
 
+from tests.unit.script_test_support import SCRIPTS_DIR, load_script_module
 
-def _load_ops_module() -> Any:
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location("ops_script", repo_root / "scripts" / "ops.py")
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)  # type: ignore[union-attr]
-    return module
-
-
-ops = _load_ops_module()
+ops = load_script_module("ops_script", SCRIPTS_DIR / "ops.py")
 
 
 def _jwt(payload: dict[str, Any]) -> str:
@@ -40,6 +29,16 @@ def _jwt(payload: dict[str, Any]) -> str:
     return f"{head}.{body}.signature"
 
 
+_OPERATOR_JWT = _jwt(
+    {
+        "sub": "abc123",
+        "preferred_username": "operator@example.com",
+        "roles": ["Platform.Operator"],
+        "exp": 4102444800,
+    }
+)
+
+
 class _FakeHeaders:
     def get_content_charset(self, default: str = "utf-8") -> str:
         return default
@@ -48,7 +47,7 @@ class _FakeHeaders:
 class _FakeResponse:
     def __init__(self, *, status: int, payload: Any) -> None:
         self.status = status
-        self._payload = payload
+        self._raw = json.dumps(payload).encode("utf-8")
 
     def __enter__(self) -> _FakeResponse:
         return self
@@ -57,22 +56,40 @@ class _FakeResponse:
         return False
 
     def read(self) -> bytes:
-        return json.dumps(self._payload).encode("utf-8")
+        return self._raw
 
 
-def _write_creds(path: Path, *, env_name: str, token: str, api_base_url: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _profile(*, token: str, api_base_url: str) -> dict[str, str]:
+    return {
+        "accessToken": token,
+        "apiBaseUrl": api_base_url,
+        "expiresAt": "2099-01-01T00:00:00Z",
+    }
+
+
+@pytest.fixture(scope="session")
+def shared_creds_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Credentials store with dev and prod profiles, written once per session.
+
+    Only `login` writes the store, and its test uses its own path, so the
+    command tests can all read this one file.
+    """
+    path = tmp_path_factory.mktemp("platform") / "credentials"
     store = {
         "version": 1,
         "profiles": {
-            env_name: {
-                "accessToken": token,
-                "apiBaseUrl": api_base_url,
-                "expiresAt": "2099-01-01T00:00:00Z",
-            }
+            "dev": _profile(token="tk", api_base_url="https://api.example.com"),
+            "prod": _profile(token="ops-token", api_base_url="https://ops.example.com"),
         },
     }
     path.write_text(json.dumps(store), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def creds_path(monkeypatch: pytest.MonkeyPatch, shared_creds_path: Path) -> Path:
+    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(shared_creds_path))
+    return shared_creds_path
 
 
 def _write_failover_lock_token(path: Path, *, lock_id: str) -> None:
@@ -96,14 +113,7 @@ def test_login_persists_profile(monkeypatch, tmp_path: Path, capsys) -> None:
     creds_path = tmp_path / ".platform" / "credentials"
     monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
 
-    token = _jwt(
-        {
-            "sub": "abc123",
-            "preferred_username": "operator@example.com",
-            "roles": ["Platform.Operator"],
-            "exp": 4102444800,
-        }
-    )
+    token = _OPERATOR_JWT
 
     rc = ops.main(
         [
@@ -166,9 +176,8 @@ def test_login_persists_profile(monkeypatch, tmp_path: Path, capsys) -> None:
     ],
 )
 def test_non_authoritative_ops_commands_fail_fast(
-    monkeypatch, tmp_path: Path, capsys, argv: list[str], expected_message: str
+    monkeypatch, creds_path: Path, capsys, argv: list[str], expected_message: str
 ) -> None:
-    _make_creds(monkeypatch, tmp_path)
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(argv)
@@ -178,16 +187,7 @@ def test_non_authoritative_ops_commands_fail_fast(
     assert expected_message in capsys.readouterr().err
 
 
-def test_update_tenant_budget_uses_patch_and_json_body(monkeypatch, tmp_path: Path) -> None:
-    creds_path = tmp_path / ".platform" / "credentials"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
-    _write_creds(
-        creds_path,
-        env_name="prod",
-        token="budget-token",
-        api_base_url="https://ops.example.com",
-    )
-
+def test_update_tenant_budget_uses_patch_and_json_body(monkeypatch, creds_path: Path) -> None:
     seen: dict[str, Any] = {}
 
     def _fake_urlopen(request: Request, timeout: int) -> _FakeResponse:
@@ -221,17 +221,11 @@ def test_update_tenant_budget_uses_patch_and_json_body(monkeypatch, tmp_path: Pa
     assert seen["timeout"] == 12
 
 
-def test_set_runtime_region_uses_failover_api_contract(monkeypatch, tmp_path: Path) -> None:
-    creds_path = tmp_path / ".platform" / "credentials"
+def test_set_runtime_region_uses_failover_api_contract(
+    monkeypatch, tmp_path: Path, creds_path: Path
+) -> None:
     token_path = tmp_path / ".build" / "failover-lock-token.json"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
     monkeypatch.setenv("FAILOVER_LOCK_TOKEN_PATH", str(token_path))
-    _write_creds(
-        creds_path,
-        env_name="prod",
-        token="failover-token",
-        api_base_url="https://ops.example.com",
-    )
     _write_failover_lock_token(token_path, lock_id="lock-123")
 
     seen: dict[str, Any] = {}
@@ -254,16 +248,7 @@ def test_set_runtime_region_uses_failover_api_contract(monkeypatch, tmp_path: Pa
     assert seen["timeout"] == 30
 
 
-def test_set_runtime_region_accepts_explicit_lock_id(monkeypatch, tmp_path: Path) -> None:
-    creds_path = tmp_path / ".platform" / "credentials"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
-    _write_creds(
-        creds_path,
-        env_name="prod",
-        token="failover-token",
-        api_base_url="https://ops.example.com",
-    )
-
+def test_set_runtime_region_accepts_explicit_lock_id(monkeypatch, creds_path: Path) -> None:
     seen: dict[str, Any] = {}
 
     def _fake_urlopen(request: Request, timeout: int) -> _FakeResponse:
@@ -290,18 +275,10 @@ def test_set_runtime_region_accepts_explicit_lock_id(monkeypatch, tmp_path: Path
 
 
 def test_set_runtime_region_requires_lock_id_when_no_saved_token(
-    monkeypatch, tmp_path: Path, capsys
+    monkeypatch, tmp_path: Path, creds_path: Path, capsys
 ) -> None:
-    creds_path = tmp_path / ".platform" / "credentials"
     token_path = tmp_path / ".build" / "failover-lock-token.json"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
     monkeypatch.setenv("FAILOVER_LOCK_TOKEN_PATH", str(token_path))
-    _write_creds(
-        creds_path,
-        env_name="prod",
-        token="failover-token",
-        api_base_url="https://ops.example.com",
-    )
 
     rc = ops.main(["set-runtime-region", "--env", "prod", "--region", "eu-central-1"])
 
@@ -317,16 +294,7 @@ def test_parse_args_rejects_removed_failover_lock_api_commands() -> None:
         ops.parse_args(["failover-lock-release"])
 
 
-def test_api_error_returns_nonzero_and_prints_error(monkeypatch, tmp_path: Path, capsys) -> None:
-    creds_path = tmp_path / ".platform" / "credentials"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
-    _write_creds(
-        creds_path,
-        env_name="dev",
-        token="err-token",
-        api_base_url="https://api.example.com",
-    )
-
+def test_api_error_returns_nonzero_and_prints_error(monkeypatch, creds_path: Path, capsys) -> None:
     def _fake_urlopen(request: Request, timeout: int) -> _FakeResponse:
         del timeout
         raise HTTPError(
@@ -346,16 +314,7 @@ def test_api_error_returns_nonzero_and_prints_error(monkeypatch, tmp_path: Path,
     assert "FORBIDDEN" in captured.err
 
 
-def test_lambda_rollback_calls_expected_endpoint(monkeypatch, tmp_path: Path) -> None:
-    creds_path = tmp_path / ".platform" / "credentials"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
-    _write_creds(
-        creds_path,
-        env_name="prod",
-        token="rollback-token",
-        api_base_url="https://ops.example.com",
-    )
-
+def test_lambda_rollback_calls_expected_endpoint(monkeypatch, creds_path: Path) -> None:
     seen: dict[str, Any] = {}
 
     def _fake_urlopen(request: Request, timeout: int) -> _FakeResponse:
@@ -389,13 +348,6 @@ def test_lambda_rollback_calls_expected_endpoint(monkeypatch, tmp_path: Path) ->
 # ---------------------------------------------------------------------------
 
 
-def _make_creds(monkeypatch: Any, tmp_path: Path) -> Path:
-    creds_path = tmp_path / ".platform" / "credentials"
-    monkeypatch.setenv("PLATFORM_CREDENTIALS_PATH", str(creds_path))
-    _write_creds(creds_path, env_name="dev", token="tk", api_base_url="https://api.example.com")
-    return creds_path
-
-
 def _capture_request(monkeypatch: Any) -> dict[str, Any]:
     seen: dict[str, Any] = {}
 
@@ -412,8 +364,7 @@ def _capture_request(monkeypatch: Any) -> dict[str, Any]:
     return seen
 
 
-def test_suspend_tenant_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_suspend_tenant_calls_correct_endpoint(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(["suspend-tenant", "--env", "dev", "--tenant", "t-abc", "--reason", "abuse"])
@@ -424,8 +375,7 @@ def test_suspend_tenant_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> N
     assert seen["body"] == {"reason": "abuse"}
 
 
-def test_reinstate_tenant_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_reinstate_tenant_calls_correct_endpoint(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(["reinstate-tenant", "--env", "dev", "--tenant", "t-xyz"])
@@ -435,8 +385,7 @@ def test_reinstate_tenant_calls_correct_endpoint(monkeypatch, tmp_path: Path) ->
     assert "/v1/platform/ops/tenants/t-xyz/reinstate" in seen["url"]
 
 
-def test_notify_tenant_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_notify_tenant_calls_correct_endpoint(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(
@@ -449,8 +398,7 @@ def test_notify_tenant_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> No
     assert seen["body"] == {"template": "budget_exceeded"}
 
 
-def test_audit_export_with_date_range(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_audit_export_with_date_range(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(
@@ -474,8 +422,7 @@ def test_audit_export_with_date_range(monkeypatch, tmp_path: Path) -> None:
     assert "end=2026-01-31" in seen["url"]
 
 
-def test_audit_export_without_date_range(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_audit_export_without_date_range(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(["audit-export", "--env", "dev", "--tenant", "t-audit"])
@@ -485,8 +432,7 @@ def test_audit_export_without_date_range(monkeypatch, tmp_path: Path) -> None:
     assert "end" not in seen["url"]
 
 
-def test_fail_job_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_fail_job_calls_correct_endpoint(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(["fail-job", "--env", "dev", "--job", "job-001", "--reason", "timed out"])
@@ -497,8 +443,7 @@ def test_fail_job_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> None:
     assert seen["body"] == {"reason": "timed out"}
 
 
-def test_page_security_calls_correct_endpoint(monkeypatch, tmp_path: Path) -> None:
-    _make_creds(monkeypatch, tmp_path)
+def test_page_security_calls_correct_endpoint(monkeypatch, creds_path: Path) -> None:
     seen = _capture_request(monkeypatch)
 
     rc = ops.main(
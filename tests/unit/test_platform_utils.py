@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
 
 from src import platform_utils
@@ -28,7 +28,22 @@ def test_json_default_serializes_decimal() -> None:
     assert platform_utils.json_default(Decimal("2.5")) == 2.5
 
 
+def test_json_default_treats_integral_decimal_with_fractional_exponent_as_int() -> None:
+    value = platform_utils.json_default(Decimal("100.0"))
+    assert value == 100
+    assert isinstance(value, int)
+    assert isinstance(platform_utils.json_default(Decimal("1E+2")), int)
+
+
 def test_parse_json_object_or_empty_handles_invalid_or_non_object() -> None:
     assert platform_utils.parse_json_object_or_empty('{"a":1}') == {"a": 1}
     assert platform_utils.parse_json_object_or_empty("[]") == {}
     assert platform_utils.parse_json_object_or_empty("bad") == {}
+
+
+def test_iso_utc_matches_isoformat_for_utc_and_offset_datetimes() -> None:
+    utc_value = datetime(812, 1, 2, 3, 4, 5, 999, tzinfo=UTC)
+    offset_value = datetime(2026, 4, 4, 14, 0, 1, tzinfo=timezone(timedelta(hours=2)))
+
+    assert platform_utils.iso_utc(utc_value) == "0812-01-02T03:04:05Z"
+    assert platform_utils.iso_utc(offset_value) == "2026-04-04T14:00:01+02:00"
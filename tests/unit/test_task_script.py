@@ -1,21 +1,12 @@
 from __future__ import annotations
 
-import importlib.util
-import sys
 from pathlib import Path
 
+import pytest
 
-def _load_task_module():
-    repo_root = Path(__file__).resolve().parents[2]
-    spec = importlib.util.spec_from_file_location("task_script", repo_root / "scripts" / "task.py")
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-    return module
+from tests.unit.script_test_support import SCRIPTS_DIR, load_script_module
 
-
-task_script = _load_task_module()
+task_script = load_script_module("task_script", SCRIPTS_DIR / "task.py")
 
 
 def _sample_task():
@@ -46,25 +37,35 @@ def test_detect_runtime_env_auto_remote_when_not_wsl(monkeypatch):
     assert task_script.detect_runtime_env("auto") == "remote"
 
 
-def test_generate_prompt_marks_local_wsl_context():
-    prompt = task_script.generate_prompt(
-        _sample_task(),
-        Path("/tmp/worktrees/TASK-011-test-task"),
-        "task/011-test-task",
-        "local-wsl",
-    )
-    assert "Context:  local-wsl" in prompt
-    assert "Run `make validate-local` in this worktree" in prompt
-    assert "Work only in this worktree" in prompt
-
-
-def test_generate_prompt_marks_remote_context():
+@pytest.mark.parametrize(
+    ("runtime_env", "expected_snippets"),
+    [
+        (
+            "local-wsl",
+            (
+                "Context:  local-wsl",
+                "Run `make validate-local` in this worktree",
+                "Work only in this worktree",
+            ),
+        ),
+        (
+            "remote",
+            (
+                "Context:  remote",
+                "remote/mobile session",
+                "Do not assume a git worktree exists",
+            ),
+        ),
+    ],
+)
+def test_generate_prompt_marks_runtime_context(
+    runtime_env: str, expected_snippets: tuple[str, ...]
+) -> None:
     prompt = task_script.generate_prompt(
         _sample_task(),
         Path("/tmp/worktrees/TASK-011-test-task"),
         "task/011-test-task",
-        "remote",
+        runtime_env,
     )
-    assert "Context:  remote" in prompt
-    assert "remote/mobile session" in prompt
-    assert "Do not assume a git worktree exists" in prompt
+    for snippet in expected_snippets:
+        assert snippet in prompt
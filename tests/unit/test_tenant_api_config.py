@@ -45,7 +45,7 @@ def test_from_env_overrides_configured_values() -> None:
             "EVENT_BUS_NAME": "bus-x",
             "AUDIT_EXPORT_BUCKET": "audit-bucket-x",
             "AUDIT_EXPORT_URL_EXPIRY_SECONDS": "1800",
-            "TENANT_API_KEY_SECRET_PREFIX": "custom/prefix",  # pragma: allowlist secret
+            "TENANT_API_KEY_SECRET_PREFIX": "custom/prefix/",  # pragma: allowlist secret
             "TENANT_MGMT_ROLE_ARN": "arn:aws:iam::111111111111:role/custom",
             "OPS_LOCKS_TABLE": "locks-x",
             "RUNTIME_REGION_PARAM": "/x/runtime",
@@ -68,3 +68,15 @@ def test_from_env_overrides_configured_values() -> None:
     assert cfg.runtime_region_param_name == "/x/runtime"
     assert cfg.fallback_region_param_name == "/x/fallback"
     assert cfg.failover_lock_name == "lock-x"
+
+
+def test_current_config_is_resolved_once_until_reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AWS_REGION", "eu-west-2")
+    monkeypatch.setenv("TENANTS_TABLE_NAME", "tenants-a")
+    first = config.current_config()
+
+    monkeypatch.setenv("TENANTS_TABLE_NAME", "tenants-b")
+    assert config.current_config() is first
+
+    config.reset_config_cache()
+    assert config.current_config().tenants_table_name == "tenants-b"
@@ -6,23 +6,30 @@ from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from src import platform_aws
 from src.tenant_api import dependency_factories
 
 
 class FakeSession:
     def __init__(self) -> None:
         self.clients: dict[str, Any] = {}
+        self.configs: dict[str, Any] = {}
 
-    def client(self, service_name: str, *, region_name: str | None = None) -> Any:
+    def client(
+        self, service_name: str, *, region_name: str | None = None, config: Any = None
+    ) -> Any:
         key = f"{service_name}:{region_name or 'default'}"
+        if config is not None:
+            self.configs[key] = config
         return self.clients.setdefault(key, object())
 
 
 def test_build_tenant_api_dependencies_uses_session_factories(monkeypatch) -> None:
     session = FakeSession()
+    monkeypatch.setattr(platform_aws, "_session_cache", {})
 
     monkeypatch.setattr(
-        dependency_factories.boto3.session,
+        platform_aws.boto3.session,
         "Session",
         lambda *, region_name: session if region_name == "eu-west-2" else None,
     )
@@ -33,6 +40,7 @@ def test_build_tenant_api_dependencies_uses_session_factories(monkeypatch) -> No
     assert deps.events is session.client("events")
     assert deps.ssm is session.client("ssm")
     assert deps.awslambda is session.client("lambda")
+    assert session.configs["events:default"].tcp_keepalive is True
     assert isinstance(deps.usage_client, dependency_factories._NoopUsageClient)
     assert isinstance(deps.memory_provisioner, dependency_factories._NoopMemoryProvisioner)
     assert isinstance(deps.platform_quota_client, dependency_factories._AwsPlatformQuotaClient)
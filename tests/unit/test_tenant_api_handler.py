@@ -1,23 +1,20 @@
 from __future__ import annotations
 
 import json
-import sys
+from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
-
 from src.tenant_api import handler as tenant_api_handler
 from tests.unit.tenant_api_test_support import (
     build_handler_state,
     fixed_now_value,
     invoke_handler,
+    reset_handler_state,
     response_body,
 )
 
@@ -144,9 +141,20 @@ def fixed_now() -> datetime:
     return fixed_now_value()
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _handler_patches() -> Generator[dict[str, Any], None, None]:
+    # Env and handler patches are identical for every test here; install them once.
+    with pytest.MonkeyPatch.context() as mp:
+        yield build_handler_state(mp, fixed_now_value())
+
+
 @pytest.fixture
-def fake_state(monkeypatch: pytest.MonkeyPatch, fixed_now: datetime) -> dict[str, Any]:
-    return build_handler_state(monkeypatch, fixed_now)
+def fake_state(_handler_patches: dict[str, Any]) -> dict[str, Any]:
+    return reset_handler_state(_handler_patches)
+
+
+# Authorizer claims that every _event caller shares; per-call claims are set on a copy.
+_AUTHORIZER_DEFAULTS: dict[str, Any] = {"tier": "premium", "sub": "user-123"}
 
 
 def _event(
@@ -162,13 +170,10 @@ def _event(
     path_params = None
     if tenant_id is not None:
         path_params = {"tenantId": tenant_id}
-    authorizer: dict[str, Any] = {
-        "tenantid": caller_tenant_id,
-        "appid": app_id,
-        "tier": "premium",
-        "sub": "user-123",
-        "roles": roles,
-    }
+    authorizer = _AUTHORIZER_DEFAULTS.copy()
+    authorizer["tenantid"] = caller_tenant_id
+    authorizer["appid"] = app_id
+    authorizer["roles"] = roles
     if usage_identifier_key is not None:
         authorizer["usageIdentifierKey"] = usage_identifier_key
 
@@ -196,6 +201,25 @@ def _last_event_detail(fake_state: dict[str, Any]) -> tuple[str, dict[str, Any]]
     return entry["DetailType"], json.loads(entry["Detail"])
 
 
+_TENANT_METADATA_DEFAULTS: dict[str, Any] = {
+    "SK": "METADATA",
+    "status": "active",
+    "createdAt": "2026-02-25T12:00:00Z",
+    "updatedAt": "2026-02-25T12:00:00Z",
+    "accountId": "123456789012",
+}
+
+
+def _seed_tenant(fake_state: dict[str, Any], tenant_id: str, **fields: Any) -> None:
+    pk = f"TENANT#{tenant_id}"
+    fake_state["db"].items[(pk, "METADATA")] = {
+        "PK": pk,
+        "tenantId": tenant_id,
+        **_TENANT_METADATA_DEFAULTS,
+        **fields,
+    }
+
+
 def _seed_failover_lock(
     fake_state: dict[str, Any],
     *,
@@ -272,6 +296,9 @@ def test_create_tenant_writes_record_provisions_memory_secret_and_emits_event(
         {"tenant_id": "t-001", "app_id": "app-001"}
     ]
     assert len(fake_state["deps"].secretsmanager.calls) == 1
+    secret_payload = json.loads(fake_state["deps"].secretsmanager.calls[0]["SecretString"])
+    assert len(secret_payload["apiKey"]) == 43
+    assert "=" not in secret_payload["apiKey"]
     assert len(fake_state["deps"].secretsmanager.policy_calls) == 1
     policy_call = fake_state["deps"].secretsmanager.policy_calls[0]
     assert policy_call["SecretId"].endswith("platform/tenants/t-001/api-key")
@@ -534,22 +561,151 @@ def test_create_tenant_detects_collision_after_tenant_id_normalization(
     assert error["message"] == "Tenant already exists"
 
 
+def _create_tenant_event(tenant_id: str) -> dict[str, Any]:
+    return _event(
+        method="POST",
+        body={
+            "tenantId": tenant_id,
+            "appId": "app-001",
+            "displayName": "Acme Ltd",
+            "tier": "standard",
+            "ownerEmail": "owner@example.com",
+            "ownerTeam": "team-acme",
+            "accountId": "123456789012",
+        },
+    )
+
+
+def test_create_tenant_conditional_write_conflict_deletes_orphaned_secret(
+    fake_state: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db = fake_state["db"]
+    original_put_item = db.put_item
+
+    def _racing_put_item(table_name: str, item: dict[str, Any], **kwargs: Any) -> Any:
+        # A concurrent create lands between the existence read and this write.
+        db.items[(item["PK"], item["SK"])] = {"PK": item["PK"], "SK": item["SK"]}
+        return original_put_item(table_name, item, **kwargs)
+
+    monkeypatch.setattr(db, "put_item", _racing_put_item)
+
+    response = _invoke(_create_tenant_event("tenant-race-001"))
+
+    assert response["statusCode"] == 409
+    assert _body(response)["error"]["code"] == "CONFLICT"
+    secrets_client = fake_state["deps"].secretsmanager
+    assert len(secrets_client.calls) == 1
+    assert secrets_client.delete_calls == [
+        {
+            "SecretId": (
+                "arn:aws:secretsmanager:eu-west-2:111111111111:secret:"
+                "platform/tenants/tenant-race-001/api-key"
+            ),
+            "ForceDeleteWithoutRecovery": True,
+        }
+    ]
+    assert fake_state["deps"].memory_provisioner.deprovision_calls == []
+    assert fake_state["deps"].events.calls == []
+
+
+@pytest.mark.parametrize(
+    ("error", "status_code"),
+    [
+        (
+            tenant_api_handler.ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow"}},
+                "PutItem",
+            ),
+            502,
+        ),
+        (RuntimeError("connection reset"), 500),
+    ],
+)
+def test_create_tenant_put_item_failure_compensates_secret_and_memory(
+    fake_state: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception,
+    status_code: int,
+) -> None:
+    def _failing_put_item(table_name: str, item: dict[str, Any], **kwargs: Any) -> Any:
+        raise error
+
+    monkeypatch.setattr(fake_state["db"], "put_item", _failing_put_item)
+
+    response = _invoke(_create_tenant_event("tenant-putfail-001"))
+
+    assert response["statusCode"] == status_code
+    deps = fake_state["deps"]
+    assert len(deps.secretsmanager.delete_calls) == 1
+    assert deps.memory_provisioner.deprovision_calls == [
+        {"tenant_id": "tenant-putfail-001", "app_id": "app-001"}
+    ]
+    assert deps.events.calls == []
+
+
+def test_create_tenant_memory_provisioning_failure_deletes_created_secret(
+    fake_state: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _failing_provision(*, tenant_id: str, app_id: str) -> dict[str, Any]:
+        raise RuntimeError("memory store unavailable")
+
+    monkeypatch.setattr(fake_state["deps"].memory_provisioner, "provision", _failing_provision)
+
+    response = _invoke(_create_tenant_event("tenant-memfail-001"))
+
+    assert response["statusCode"] == 500
+    assert len(fake_state["deps"].secretsmanager.delete_calls) == 1
+    assert ("TENANT#tenant-memfail-001", "METADATA") not in fake_state["db"].items
+
+
+def test_create_tenant_secret_failure_deprovisions_memory(
+    fake_state: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _failing_create_secret(**kwargs: Any) -> dict[str, Any]:
+        raise RuntimeError("secrets manager unavailable")
+
+    monkeypatch.setattr(fake_state["deps"].secretsmanager, "create_secret", _failing_create_secret)
+
+    response = _invoke(_create_tenant_event("tenant-secretfail-001"))
+
+    assert response["statusCode"] == 500
+    assert fake_state["deps"].memory_provisioner.deprovision_calls == [
+        {"tenant_id": "tenant-secretfail-001", "app_id": "app-001"}
+    ]
+    assert ("TENANT#tenant-secretfail-001", "METADATA") not in fake_state["db"].items
+
+
+def test_create_tenant_secret_and_memory_failure_skips_compensation(
+    fake_state: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _failing_provision(*, tenant_id: str, app_id: str) -> dict[str, Any]:
+        raise RuntimeError("memory store unavailable")
+
+    def _failing_create_secret(**kwargs: Any) -> dict[str, Any]:
+        raise RuntimeError("secrets manager unavailable")
+
+    deps = fake_state["deps"]
+    monkeypatch.setattr(deps.memory_provisioner, "provision", _failing_provision)
+    monkeypatch.setattr(deps.secretsmanager, "create_secret", _failing_create_secret)
+
+    response = _invoke(_create_tenant_event("tenant-bothfail-001"))
+
+    assert response["statusCode"] == 500
+    assert deps.memory_provisioner.deprovision_calls == []
+    assert deps.secretsmanager.delete_calls == []
+
+
 def test_read_own_tenant_allowed_and_enriched_with_usage(fake_state: dict[str, Any]) -> None:
-    fake_state["db"].items[("TENANT#t-002", "METADATA")] = {
-        "PK": "TENANT#t-002",
-        "SK": "METADATA",
-        "tenantId": "t-002",
-        "appId": "app-002",
-        "displayName": "Bravo",
-        "tier": "basic",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "b@example.com",
-        "ownerTeam": "team-b",
-        "accountId": "123456789012",
-        "monthlyBudgetUsd": Decimal("50"),
-    }
+    _seed_tenant(
+        fake_state,
+        "t-002",
+        appId="app-002",
+        displayName="Bravo",
+        tier="basic",
+        ownerEmail="b@example.com",
+        ownerTeam="team-b",
+        monthlyBudgetUsd=Decimal("50"),
+    )
 
     response = _invoke(
         _event(
@@ -572,20 +728,15 @@ def test_read_own_tenant_allowed_and_enriched_with_usage(fake_state: dict[str, A
 def test_read_own_tenant_canonicalizes_mixed_case_path_tenant_id(
     fake_state: dict[str, Any],
 ) -> None:
-    fake_state["db"].items[("TENANT#tenant-acme-001", "METADATA")] = {
-        "PK": "TENANT#tenant-acme-001",
-        "SK": "METADATA",
-        "tenantId": "tenant-acme-001",
-        "appId": "app-002",
-        "displayName": "Bravo",
-        "tier": "basic",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "b@example.com",
-        "ownerTeam": "team-b",
-        "accountId": "123456789012",
-    }
+    _seed_tenant(
+        fake_state,
+        "tenant-acme-001",
+        appId="app-002",
+        displayName="Bravo",
+        tier="basic",
+        ownerEmail="b@example.com",
+        ownerTeam="team-b",
+    )
 
     response = _invoke(
         _event(
@@ -620,20 +771,15 @@ def test_path_based_tenant_routes_reject_invalid_tenant_ids_deterministically(
 
 
 def test_read_other_tenant_forbidden_for_non_admin(fake_state: dict[str, Any]) -> None:
-    fake_state["db"].items[("TENANT#t-victim", "METADATA")] = {
-        "PK": "TENANT#t-victim",
-        "SK": "METADATA",
-        "tenantId": "t-victim",
-        "appId": "app-victim",
-        "displayName": "Victim",
-        "tier": "standard",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "v@example.com",
-        "ownerTeam": "team-v",
-        "accountId": "123456789012",
-    }
+    _seed_tenant(
+        fake_state,
+        "t-victim",
+        appId="app-victim",
+        displayName="Victim",
+        tier="standard",
+        ownerEmail="v@example.com",
+        ownerTeam="team-v",
+    )
 
     response = _invoke(
         _event(
@@ -651,20 +797,15 @@ def test_read_other_tenant_forbidden_for_non_admin(fake_state: dict[str, Any]) -
 
 
 def test_update_tier_admin_only_emits_tier_changed_event(fake_state: dict[str, Any]) -> None:
-    fake_state["db"].items[("TENANT#t-003", "METADATA")] = {
-        "PK": "TENANT#t-003",
-        "SK": "METADATA",
-        "tenantId": "t-003",
-        "appId": "app-003",
-        "displayName": "Charlie",
-        "tier": "basic",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "c@example.com",
-        "ownerTeam": "team-c",
-        "accountId": "123456789012",
-    }
+    _seed_tenant(
+        fake_state,
+        "t-003",
+        appId="app-003",
+        displayName="Charlie",
+        tier="basic",
+        ownerEmail="c@example.com",
+        ownerTeam="team-c",
+    )
 
     response = _invoke(_event(method="PATCH", tenant_id="t-003", body={"tier": "premium"}))
 
@@ -678,20 +819,15 @@ def test_update_tier_admin_only_emits_tier_changed_event(fake_state: dict[str, A
 
 
 def test_update_canonicalizes_mixed_case_path_tenant_id(fake_state: dict[str, Any]) -> None:
-    fake_state["db"].items[("TENANT#tenant-acme-002", "METADATA")] = {
-        "PK": "TENANT#tenant-acme-002",
-        "SK": "METADATA",
-        "tenantId": "tenant-acme-002",
-        "appId": "app-003",
-        "displayName": "Charlie",
-        "tier": "basic",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "c@example.com",
-        "ownerTeam": "team-c",
-        "accountId": "123456789012",
-    }
+    _seed_tenant(
+        fake_state,
+        "tenant-acme-002",
+        appId="app-003",
+        displayName="Charlie",
+        tier="basic",
+        ownerEmail="c@example.com",
+        ownerTeam="team-c",
+    )
 
     response = _invoke(
         _event(method="PATCH", tenant_id="TENANT-ACME-002", body={"tier": "premium"})
@@ -707,20 +843,15 @@ def test_delete_is_soft_delete_with_30_day_retention_and_event(
     fake_state: dict[str, Any],
     fixed_now: datetime,
 ) -> None:
-    fake_state["db"].items[("TENANT#t-004", "METADATA")] = {
-        "PK": "TENANT#t-004",
-        "SK": "METADATA",
-        "tenantId": "t-004",
-        "appId": "app-004",
-        "displayName": "Delta",
-        "tier": "standard",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "d@example.com",
-        "ownerTeam": "team-d",
-        "accountId": "123456789012",
-    }
+    _seed_tenant(
+        fake_state,
+        "t-004",
+        appId="app-004",
+        displayName="Delta",
+        tier="standard",
+        ownerEmail="d@example.com",
+        ownerTeam="team-d",
+    )
 
     response = _invoke(_event(method="DELETE", tenant_id="t-004"))
 
@@ -739,20 +870,15 @@ def test_delete_canonicalizes_mixed_case_path_tenant_id(
     fake_state: dict[str, Any],
     fixed_now: datetime,
 ) -> None:
-    fake_state["db"].items[("TENANT#tenant-acme-003", "METADATA")] = {
-        "PK": "TENANT#tenant-acme-003",
-        "SK": "METADATA",
-        "tenantId": "tenant-acme-003",
-        "appId": "app-004",
-        "displayName": "Delta",
-        "tier": "standard",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "d@example.com",
-        "ownerTeam": "team-d",
-        "accountId": "123456789012",
-    }
+    _seed_tenant(
+        fake_state,
+        "tenant-acme-003",
+        appId="app-004",
+        displayName="Delta",
+        tier="standard",
+        ownerEmail="d@example.com",
+        ownerTeam="team-d",
+    )
 
     response = _invoke(_event(method="DELETE", tenant_id="Tenant-Acme-003"))
 
@@ -763,7 +889,33 @@ def test_delete_canonicalizes_mixed_case_path_tenant_id(
     assert tenant["purgeAtEpochSeconds"] == int((fixed_now + timedelta(days=30)).timestamp())
 
 
-def test_list_tenants_admin_only(fake_state: dict[str, Any]) -> None:
+@pytest.mark.parametrize(
+    ("method", "body"), [("PATCH", {"displayName": "Ghost"}), ("DELETE", None)]
+)
+def test_update_and_delete_missing_tenant_return_404_without_writing(
+    fake_state: dict[str, Any], method: str, body: dict[str, Any] | None
+) -> None:
+    response = _invoke(_event(method=method, tenant_id="t-missing", body=body))
+
+    assert response["statusCode"] == 404
+    assert _body(response)["error"]["code"] == "NOT_FOUND"
+    assert ("TENANT#t-missing", "METADATA") not in fake_state["db"].items
+    assert fake_state["deps"].events.calls == []
+
+
+@pytest.mark.parametrize(
+    ("caller_overrides", "expected_tenant_ids"),
+    [
+        ({}, {"t-1", "t-2"}),
+        ({"caller_tenant_id": "t-1", "roles": [], "app_id": "app-1"}, {"t-1"}),
+    ],
+    ids=["admin-lists-all", "non-admin-sees-own"],
+)
+def test_list_tenants_admin_only(
+    fake_state: dict[str, Any],
+    caller_overrides: dict[str, Any],
+    expected_tenant_ids: set[str],
+) -> None:
     fake_state["db"].items[("TENANT#t-1", "METADATA")] = {
         "PK": "TENANT#t-1",
         "SK": "METADATA",
@@ -779,20 +931,12 @@ def test_list_tenants_admin_only(fake_state: dict[str, Any]) -> None:
         "tier": "premium",
     }
 
-    # 1. Admin list all
-    response = _invoke(_event(method="GET", tenant_id=None))
-    assert response["statusCode"] == 200
-    items = _body(response)["items"]
-    assert len(items) == 2
+    response = _invoke(_event(method="GET", tenant_id=None, **caller_overrides))
 
-    # 2. Non-admin only sees own
-    response = _invoke(
-        _event(method="GET", tenant_id=None, caller_tenant_id="t-1", roles=[], app_id="app-1")
-    )
     assert response["statusCode"] == 200
     items = _body(response)["items"]
-    assert len(items) == 1
-    assert items[0]["tenantId"] == "t-1"
+    assert len(items) == len(expected_tenant_ids)
+    assert {item["tenantId"] for item in items} == expected_tenant_ids
 
 
 def test_audit_export_writes_real_s3_export_and_returns_presigned_url(
@@ -1281,29 +1425,27 @@ def test_aws_platform_quota_client_falls_back_to_documented_default_limit() -> N
     ]
 
 
-def test_platform_split_accounts_requires_platform_admin(fake_state: dict[str, Any]) -> None:
+@pytest.mark.parametrize(
+    ("roles", "expected_status"),
+    [("Platform.Admin", 202), (["Platform.Operator"], 403)],
+    ids=["platform-admin", "platform-operator"],
+)
+def test_platform_split_accounts_requires_platform_admin(
+    fake_state: dict[str, Any], roles: str | list[str], expected_status: int
+) -> None:
     event = _event(
         method="POST",
+        roles=roles,
         body={"tier": "premium", "targetAccountId": "123456789012"},
         caller_tenant_id="platform",
     )
     event["path"] = "/v1/platform/quota/split-accounts"
 
-    # 1. Platform.Admin succeeds
     response = _invoke(event)
-    assert response["statusCode"] == 202
-    assert "jobId" in _body(response)
 
-    # 2. Platform.Operator (regular admin role in our _event helper) fails
-    event_operator = _event(
-        method="POST",
-        roles=["Platform.Operator"],
-        body={"tier": "premium", "targetAccountId": "123456789012"},
-        caller_tenant_id="platform",
-    )
-    event_operator["path"] = "/v1/platform/quota/split-accounts"
-    response = _invoke(event_operator)
-    assert response["statusCode"] == 403
+    assert response["statusCode"] == expected_status
+    if expected_status == 202:
+        assert "jobId" in _body(response)
 
 
 @pytest.mark.parametrize("target_account_id", ["12345678901", "1234567890123", "12345abc9012"])
@@ -1326,11 +1468,30 @@ def test_platform_split_accounts_rejects_invalid_target_account_id(
     assert error["message"] == "targetAccountId must match ^[0-9]{12}$"
 
 
+def test_unsupported_method_short_circuits_before_dependencies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _unexpected_dependencies() -> Any:
+        raise AssertionError("dependencies must not be built for unsupported methods")
+
+    monkeypatch.setattr(tenant_api_handler, "_dependencies", _unexpected_dependencies)
+
+    response = _invoke(_event(method="TRACE"))
+
+    assert response["statusCode"] == 405
+    assert _body(response)["error"]["code"] == "METHOD_NOT_ALLOWED"
+
+
 def test_parse_roles_accepts_json_encoded_array() -> None:
     parsed = tenant_api_handler._parse_roles('["Platform.Admin","Platform.Operator"]')
     assert parsed == frozenset({"Platform.Admin", "Platform.Operator"})
 
 
+def test_parse_roles_splits_delimited_string_and_drops_blanks() -> None:
+    parsed = tenant_api_handler._parse_roles(" Platform.Admin,, Agent.Invoke\tSelfService.Admin ,")
+    assert parsed == frozenset({"Platform.Admin", "Agent.Invoke", "SelfService.Admin"})
+
+
 def test_create_tenant_allows_json_encoded_admin_roles(fake_state: dict[str, Any]) -> None:
     response = _invoke(
         _event(
@@ -1355,23 +1516,16 @@ def test_create_tenant_allows_json_encoded_admin_roles(fake_state: dict[str, Any
 def test_rotate_api_key_for_own_tenant_requires_self_service_admin_role(
     fake_state: dict[str, Any],
 ) -> None:
-    fake_state["db"].items[("TENANT#t-rotate", "METADATA")] = {
-        "PK": "TENANT#t-rotate",
-        "SK": "METADATA",
-        "tenantId": "t-rotate",
-        "appId": "app-rotate",
-        "displayName": "Rotate",
-        "tier": "standard",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "r@example.com",
-        "ownerTeam": "team-r",
-        "accountId": "123456789012",
-        "apiKeySecretArn": (
-            "arn:aws:secretsmanager:eu-west-2:111111111111:secret:platform/tenants/t-rotate/api-key"
-        ),
-    }
+    _seed_tenant(
+        fake_state,
+        "t-rotate",
+        appId="app-rotate",
+        displayName="Rotate",
+        tier="standard",
+        ownerEmail="r@example.com",
+        ownerTeam="team-r",
+        apiKeySecretArn="arn:aws:secretsmanager:eu-west-2:111111111111:secret:platform/tenants/t-rotate/api-key",
+    )
     event = _event(
         method="POST",
         tenant_id="t-rotate",
@@ -1391,23 +1545,16 @@ def test_rotate_api_key_for_own_tenant_requires_self_service_admin_role(
 def test_rotate_api_key_for_own_tenant_succeeds_for_platform_operator(
     fake_state: dict[str, Any],
 ) -> None:
-    fake_state["db"].items[("TENANT#t-rotate", "METADATA")] = {
-        "PK": "TENANT#t-rotate",
-        "SK": "METADATA",
-        "tenantId": "t-rotate",
-        "appId": "app-rotate",
-        "displayName": "Rotate",
-        "tier": "standard",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "r@example.com",
-        "ownerTeam": "team-r",
-        "accountId": "123456789012",
-        "apiKeySecretArn": (
-            "arn:aws:secretsmanager:eu-west-2:111111111111:secret:platform/tenants/t-rotate/api-key"
-        ),
-    }
+    _seed_tenant(
+        fake_state,
+        "t-rotate",
+        appId="app-rotate",
+        displayName="Rotate",
+        tier="standard",
+        ownerEmail="r@example.com",
+        ownerTeam="team-r",
+        apiKeySecretArn="arn:aws:secretsmanager:eu-west-2:111111111111:secret:platform/tenants/t-rotate/api-key",
+    )
     event = _event(
         method="POST",
         tenant_id="t-rotate",
@@ -1434,24 +1581,17 @@ def test_rotate_api_key_for_own_tenant_succeeds_for_platform_operator(
 def test_rotate_api_key_canonicalizes_mixed_case_path_tenant_id(
     fake_state: dict[str, Any],
 ) -> None:
-    fake_state["db"].items[("TENANT#tenant-rotate-001", "METADATA")] = {
-        "PK": "TENANT#tenant-rotate-001",
-        "SK": "METADATA",
-        "tenantId": "tenant-rotate-001",
-        "appId": "app-rotate",
-        "displayName": "Rotate",
-        "tier": "standard",
-        "status": "active",
-        "createdAt": "2026-02-25T12:00:00Z",
-        "updatedAt": "2026-02-25T12:00:00Z",
-        "ownerEmail": "r@example.com",
-        "ownerTeam": "team-r",
-        "accountId": "123456789012",
-        "apiKeySecretArn": (
-            "arn:aws:secretsmanager:eu-west-2:111111111111:secret:"
-            "platform/tenants/tenant-rotate-001/api-key"
-        ),
-    }
+    _seed_tenant(
+        fake_state,
+        "tenant-rotate-001",
+        appId="app-rotate",
+        displayName="Rotate",
+        tier="standard",
+        ownerEmail="r@example.com",
+        ownerTeam="team-r",
+        apiKeySecretArn="arn:aws:secretsmanager:eu-west-2:111111111111:secret:"
+        "platform/tenants/tenant-rotate-001/api-key",
+    )
     event = _event(
         method="POST",
         tenant_id="Tenant-Rotate-001",
@@ -38,6 +38,26 @@ def test_dependencies_uses_central_config_region(monkeypatch) -> None:
         lambda *, region: captured.setdefault("region", region) or object(),
     )
 
+    monkeypatch.setattr(tenant_api_handler, "_cached_dependencies", None)
+
     tenant_api_handler._dependencies()
 
     assert captured["region"] == "eu-west-2"
+
+
+def test_dependencies_are_built_once_per_execution_environment(monkeypatch) -> None:
+    built: list[object] = []
+
+    def _build(*, region: str) -> object:
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setenv("AWS_REGION", "eu-west-2")
+    monkeypatch.setattr(tenant_api_handler, "_cached_dependencies", None)
+    monkeypatch.setattr(dependency_factories, "build_tenant_api_dependencies", _build)
+
+    first = tenant_api_handler._dependencies()
+    second = tenant_api_handler._dependencies()
+
+    assert first is second
+    assert len(built) == 1
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import Generator
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
@@ -10,9 +12,21 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from src.tenant_api import agent_registry, ops_control, tenant_lifecycle, webhook_registry
+from src.tenant_api import (
+    agent_registry,
+    db_utils,
+    http_utils,
+    ops_control,
+    tenant_lifecycle,
+    validation,
+    webhook_registry,
+)
 from src.tenant_api import handler as tenant_api_handler
-from tests.unit.tenant_api_test_support import build_module_state, fixed_now_value
+from tests.unit.tenant_api_test_support import (
+    apply_common_tenant_api_env,
+    build_module_state,
+    fixed_now_value,
+)
 
 
 @pytest.fixture
@@ -20,9 +34,17 @@ def fixed_now() -> datetime:
     return fixed_now_value()
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _tenant_api_env() -> Generator[None, None, None]:
+    # The tenant API env never varies across this module; set it once and undo it on exit.
+    with pytest.MonkeyPatch.context() as mp:
+        apply_common_tenant_api_env(mp, include_agents_table=True)
+        yield
+
+
 @pytest.fixture
 def module_state(monkeypatch: pytest.MonkeyPatch, fixed_now: Any) -> dict[str, Any]:
-    return build_module_state(monkeypatch, fixed_now)
+    return build_module_state(monkeypatch, fixed_now, apply_env=False)
 
 
 def _caller(
@@ -141,3 +163,73 @@ def test_webhook_registry_dispatch_registers_webhook(module_state: dict[str, Any
         if key[0] == "TENANT#t-001" and key[1].startswith("WEBHOOK#")
     ]
     assert webhook_keys
+
+
+def test_build_update_expression_numbers_placeholders_in_attribute_order() -> None:
+    expression, names, values = db_utils.build_update_expression(
+        {"status": "active", "monthlyBudgetUsd": 12.5}
+    )
+
+    assert expression == "SET #n1 = :v1, #n2 = :v2"
+    assert names == {"#n1": "status", "#n2": "monthlyBudgetUsd"}
+    assert values == {":v1": "active", ":v2": Decimal("12.5")}
+
+
+def test_caller_identity_falls_back_across_authorizer_key_casing() -> None:
+    caller = http_utils.caller_identity(
+        {
+            "requestContext": {
+                "authorizer": {
+                    "lambda": {
+                        "tenantid": "",
+                        "tenantId": " t-001 ",
+                        "appId": "app-001",
+                        "tier": "standard",
+                        "sub": 42,
+                        "usage_identifier_key": "uik-1",
+                        "roles": "Platform.Admin, Agent.Invoke",
+                    }
+                }
+            }
+        }
+    )
+
+    assert caller.tenant_id == "t-001"
+    assert caller.app_id == "app-001"
+    assert caller.sub == "42"
+    assert caller.usage_identifier_key == "uik-1"
+    assert caller.roles == frozenset({"Platform.Admin", "Agent.Invoke"})
+
+
+def test_tenant_key_returns_independent_copies() -> None:
+    first = db_utils.tenant_key("t-001")
+    first["SK"] = "MUTATED"
+
+    assert db_utils.tenant_key("t-001") == {"PK": "TENANT#t-001", "SK": "METADATA"}
+
+
+def test_parse_request_reads_http_api_v2_shape_in_one_pass() -> None:
+    request = http_utils.parse_request(
+        {
+            "requestContext": {
+                "http": {"method": "patch", "path": "/v1/tenants/t-001/"},
+                "authorizer": {"lambda": {"tenantid": "t-001"}},
+            }
+        }
+    )
+
+    assert request.method == "PATCH"
+    assert request.path == "/v1/tenants/t-001"
+    assert request.authorizer == {"tenantid": "t-001"}
+
+
+def test_missing_fields_treats_absent_and_blank_values_as_missing() -> None:
+    body = {"tenantId": "t-001", "appId": "  ", "displayName": None, "accountId": 0}
+
+    assert validation.missing_fields(
+        body, ("tenantId", "appId", "displayName", "tier", "accountId")
+    ) == [
+        "appId",
+        "displayName",
+        "tier",
+    ]